@@ -2,15 +2,60 @@
 UltraViab API - Organ Viability Assessment API
 Main application entry point - only responsible for app initialization and route registration.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic_core import to_json
+
+from controllers import (
+    assessment_router,
+    health_router,
+    job_router,
+    metrics_router,
+    model_router,
+    prediction_router,
+    signal_router,
+)
+from metrics import MetricsMiddleware
+from utils.dependencies import (
+    get_assessment_writer,
+    get_job_runner,
+    get_prediction_service,
+    get_scoring_executor,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the prediction service (scoring plans, models) and its executor before serving
+    traffic, and run the assessment write-behind flusher and the bulk job runner for
+    the app's lifetime.
+    """
+    get_prediction_service()
+    executor = get_scoring_executor()
+    writer = get_assessment_writer()
+    if writer is not None:
+        writer.start()
+    jobs = get_job_runner()
+    if jobs is not None:
+        jobs.start()
+    yield
+    if jobs is not None:
+        await jobs.stop()
+    if writer is not None:
+        await writer.stop()
+    executor.shutdown()
 
-from controllers import health_router, prediction_router
 
 app = FastAPI(
     title="UltraViab API",
     description="Organ Viability Assessment API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS Configuration - Open to all origins
@@ -22,9 +67,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request count / latency / in-flight instrumentation (outermost, so it times everything)
+app.add_middleware(MetricsMiddleware)
+
+
+
+@app.exception_handler(RequestValidationError)
+async def request_validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    """
+    FastAPI's 422 body, except that NaN and infinite inputs are echoed as the
+    strings "NaN" / "Infinity": strict JSON has no literal for them, and the
+    default handler fails to encode the error it is reporting.
+    """
+    content = to_json({"detail": jsonable_encoder(exc.errors())}, inf_nan_mode="strings")
+    return Response(content, status_code=422, media_type="application/json")
+
+
 # Register all controllers/routers
 app.include_router(health_router)
 app.include_router(prediction_router)
+app.include_router(model_router)
+app.include_router(metrics_router)
+app.include_router(assessment_router)
+app.include_router(signal_router)
+app.include_router(job_router)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,17 @@
+from .assessment_controller import router as assessment_router
 from .health_controller import router as health_router
+from .job_controller import router as job_router
+from .metrics_controller import router as metrics_router
+from .model_controller import router as model_router
 from .prediction_controller import router as prediction_router
+from .signal_controller import router as signal_router
 
-__all__ = ["health_router", "prediction_router"]
+__all__ = [
+    "assessment_router",
+    "health_router",
+    "job_router",
+    "metrics_router",
+    "model_router",
+    "prediction_router",
+    "signal_router",
+]
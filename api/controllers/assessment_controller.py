@@ -0,0 +1,53 @@
+"""
+Assessment controller - handles assessment history endpoints.
+Follows Single Responsibility Principle - only handles HTTP layer concerns.
+"""
+from dataclasses import asdict
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from schemas.assessment import Assessment, AssessmentHistoryResponse
+from services.assessment_store import DEFAULT_HISTORY_LIMIT, MAX_HISTORY_LIMIT, IAssessmentStore
+from utils.dependencies import get_assessment_store
+
+router = APIRouter(prefix="/assessments", tags=["Assessments"])
+
+
+# Plain def: FastAPI runs it on the threadpool, keeping SQLite reads off the event loop
+@router.get("", response_model=AssessmentHistoryResponse)
+def list_assessments(
+    organ_type: Optional[str] = Query(None, description="Organ type, case-insensitive"),
+    classification: Optional[str] = Query(None, description="Accept, Marginal or Decline"),
+    since: Optional[datetime] = Query(None, description="ISO-8601 lower bound (inclusive); UTC unless an offset is given"),
+    until: Optional[datetime] = Query(None, description="ISO-8601 upper bound (exclusive); UTC unless an offset is given"),
+    before_id: Optional[int] = Query(None, description="Cursor: next_before_id of the previous page"),
+    limit: int = Query(DEFAULT_HISTORY_LIMIT, ge=1, le=MAX_HISTORY_LIMIT),
+    store: Optional[IAssessmentStore] = Depends(get_assessment_store)
+) -> AssessmentHistoryResponse:
+    """
+    Page through persisted predictions, newest first.
+    
+    Args:
+        organ_type: Only this organ type
+        classification: Only this classification
+        since: Only assessments at or after this time
+        until: Only assessments before this time
+        before_id: Continue after this assessment
+        limit: Page size
+        store: Injected assessment store
+        
+    Returns:
+        Matching assessments and the cursor for the next page
+    """
+    if store is None:
+        raise HTTPException(status_code=404, detail="Assessment history is disabled (set ULTRAVIAB_ASSESSMENT_DB to enable it)")
+    records = store.query(
+        organ_type=organ_type, classification=classification,
+        since=since, until=until, before_id=before_id, limit=limit
+    )
+    return AssessmentHistoryResponse(
+        assessments=[Assessment(**asdict(record)) for record in records],
+        next_before_id=records[-1].id if len(records) == limit else None
+    )
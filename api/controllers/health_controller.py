@@ -2,7 +2,10 @@
 Health controller - handles health check endpoints.
 Follows Single Responsibility Principle.
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from services.prediction_service import IPredictionService
+from utils.dependencies import get_prediction_cache, get_prediction_service
 
 router = APIRouter(tags=["Health"])
 
@@ -14,10 +17,15 @@ async def root():
 
 
 @router.get("/health")
-async def health_check():
-    """Detailed health check endpoint."""
+async def health_check(
+    prediction_service: IPredictionService = Depends(get_prediction_service)
+):
+    """Detailed health check endpoint, including response-cache counters."""
+    cache = get_prediction_cache()
     return {
         "status": "healthy",
         "service": "UltraViab API",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "scoring_version": prediction_service.version,
+        "cache": cache.stats() if cache is not None else None
     }
@@ -0,0 +1,232 @@
+"""
+Job controller - handles bulk scoring job endpoints.
+Follows Single Responsibility Principle - only handles HTTP layer concerns.
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from schemas.job import JobListResponse, JobResponse
+from services import columnar_scoring
+from services.job_runner import DEFAULT_JOB_BATCH_ROWS, JobQueueFullError, JobRunner
+from services.job_store import DEFAULT_JOB_LIMIT, MAX_JOB_LIMIT, STATUSES, SUCCEEDED, JobRecord
+from utils.dependencies import get_job_runner
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# How often a progress stream re-reads its job
+PROGRESS_POLL_SECONDS = 0.5
+
+
+def _runner(runner: Optional[JobRunner]) -> JobRunner:
+    if runner is None:
+        raise HTTPException(status_code=404, detail="Bulk scoring jobs are disabled (set ULTRAVIAB_JOB_DB to enable them)")
+    return runner
+
+
+def _job(runner: JobRunner, job_id: str) -> JobRecord:
+    job = runner.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job
+
+
+def _job_response(job: JobRecord) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        format=job.format,
+        rows_total=job.rows_total,
+        rows_done=job.rows_done,
+        progress=job.rows_done / job.rows_total if job.rows_total else None,
+        run_seconds=job.run_seconds,
+        rows_per_second=job.rows_per_second,
+        output_bytes=job.output_bytes,
+        attempts=job.attempts,
+        cancel_requested=bool(job.cancel_requested),
+        error=job.error,
+    )
+
+
+@router.post("", response_model=JobResponse, status_code=202)
+async def submit_job(
+    request: Request,
+    batch_rows: int = Query(
+        DEFAULT_JOB_BATCH_ROWS, ge=1, le=columnar_scoring.MAX_BATCH_ROWS,
+        description="Rows scored per pass; progress is reported and cancellation checked per pass"
+    ),
+    explain: bool = Query(True, description="Append one contribution column per feature"),
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> JobResponse:
+    """
+    Queue an Arrow IPC or Parquet cohort for background scoring.
+
+    The upload is spooled to disk and the call returns as soon as the job is
+    queued. The result has the same layout as /predict/columnar.
+
+    Args:
+        request: Raw request carrying an Arrow file, Arrow stream or Parquet body
+        batch_rows: Rows per scoring pass
+        explain: Include per-feature contribution columns
+        runner: Injected job runner, when jobs are enabled
+
+    Returns:
+        The queued job
+    """
+    runner = _runner(runner)
+    try:
+        columnar_format = columnar_scoring.detect_format(request.headers.get("content-type"))
+    except ValueError as exc:
+        raise HTTPException(status_code=415, detail=str(exc))
+    try:
+        job = await runner.submit(request.stream(), columnar_format, batch_rows, explain)
+    except JobQueueFullError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "30"})
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return _job_response(job)
+
+
+# Plain def: FastAPI runs it on the threadpool, keeping SQLite reads off the event loop
+@router.get("", response_model=JobListResponse)
+def list_jobs(
+    status: Optional[str] = Query(None, description=f"One of {', '.join(STATUSES)}"),
+    limit: int = Query(DEFAULT_JOB_LIMIT, ge=1, le=MAX_JOB_LIMIT),
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> JobListResponse:
+    """
+    List jobs, newest first.
+
+    Args:
+        status: Only jobs in this state
+        limit: Most jobs returned
+        runner: Injected job runner, when jobs are enabled
+
+    Returns:
+        Matching jobs
+    """
+    runner = _runner(runner)
+    return JobListResponse(jobs=[_job_response(job) for job in runner.store.list(status, limit)])
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: str,
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> JobResponse:
+    """
+    Poll a job's state, progress and throughput.
+
+    Args:
+        job_id: Job id returned on submission
+        runner: Injected job runner, when jobs are enabled
+
+    Returns:
+        The job
+    """
+    return _job_response(_job(_runner(runner), job_id))
+
+
+@router.get("/{job_id}/progress", response_class=StreamingResponse)
+async def stream_job_progress(
+    job_id: str,
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> StreamingResponse:
+    """
+    Stream a job's progress as NDJSON: one line per change, ending with the
+    line for its final state.
+
+    Args:
+        job_id: Job id returned on submission
+        runner: Injected job runner, when jobs are enabled
+
+    Returns:
+        NDJSON stream of JobResponse objects
+    """
+    runner = _runner(runner)
+    job = await asyncio.to_thread(_job, runner, job_id)
+
+    async def updates():
+        current, last = job, None
+        while True:
+            line = _job_response(current).model_dump_json()
+            if line != last:
+                yield line + "\n"
+                last = line
+            if not current.active:
+                return
+            await asyncio.sleep(PROGRESS_POLL_SECONDS)
+            current = await asyncio.to_thread(runner.store.get, job_id)
+            if current is None:
+                return
+
+    return StreamingResponse(updates(), media_type="application/x-ndjson")
+
+
+@router.get("/{job_id}/result", response_class=FileResponse)
+def get_job_result(
+    job_id: str,
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> FileResponse:
+    """
+    Download a succeeded job's scored cohort, in the format it was submitted in.
+
+    Args:
+        job_id: Job id returned on submission
+        runner: Injected job runner, when jobs are enabled
+
+    Returns:
+        The scored cohort file
+    """
+    job = _job(_runner(runner), job_id)
+    if job.status != SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' is {job.status}, not {SUCCEEDED}")
+    return FileResponse(job.output_path, media_type=columnar_scoring.CONTENT_TYPES[job.format])
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel_job(
+    job_id: str,
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> JobResponse:
+    """
+    Cancel a job. A queued job is cancelled at once; a running one stops at
+    the end of its current batch and discards its partial output.
+
+    Args:
+        job_id: Job id returned on submission
+        runner: Injected job runner, when jobs are enabled
+
+    Returns:
+        The job, cancelled or flagged for cancellation
+    """
+    runner = _runner(runner)
+    job = _job(runner, job_id)
+    if not job.active:
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' already {job.status}")
+    return _job_response(runner.cancel(job_id))
+
+
+@router.delete("/{job_id}", status_code=204)
+def delete_job(
+    job_id: str,
+    runner: Optional[JobRunner] = Depends(get_job_runner)
+) -> Response:
+    """
+    Delete a finished job and its input and result files.
+
+    Args:
+        job_id: Job id returned on submission
+        runner: Injected job runner, when jobs are enabled
+    """
+    runner = _runner(runner)
+    job = _job(runner, job_id)
+    if job.active:
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' is {job.status}; cancel it first")
+    runner.delete(job_id)
+    return Response(status_code=204)
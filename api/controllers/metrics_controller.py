@@ -0,0 +1,16 @@
+"""
+Metrics controller - exposes Prometheus-format metrics.
+Follows Single Responsibility Principle - only handles HTTP layer concerns.
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from metrics.registry import REGISTRY
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Request counts, latency histograms, in-flight requests and stage timings."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
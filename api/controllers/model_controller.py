@@ -0,0 +1,43 @@
+"""
+Model controller - handles model registry endpoints.
+Follows Single Responsibility Principle - only handles HTTP layer concerns.
+"""
+from fastapi import APIRouter, Depends
+
+from schemas.model import ModelInfo, ModelRegistryResponse
+from services.model_registry import ModelRegistry
+from utils.dependencies import get_engine, get_model_registry
+
+router = APIRouter(prefix="/models", tags=["Models"])
+
+
+@router.get("", response_model=ModelRegistryResponse)
+async def list_models(
+    registry: ModelRegistry = Depends(get_model_registry)
+) -> ModelRegistryResponse:
+    """
+    List the model versions loaded at startup and how long each took to load.
+    
+    Args:
+        registry: Injected model registry
+        
+    Returns:
+        Serving engine, active version and every loaded model
+    """
+    return ModelRegistryResponse(
+        engine=get_engine(),
+        active_version=registry.active_version,
+        models=[
+            ModelInfo(
+                version=artifact.version,
+                path=artifact.path,
+                active=artifact.version == registry.active_version,
+                load_seconds=artifact.load_seconds,
+                loaded_at=artifact.loaded_at,
+                size_bytes=artifact.size_bytes,
+                feature_names=artifact.feature_names,
+                metadata=artifact.metadata
+            )
+            for artifact in registry.list()
+        ]
+    )
@@ -2,28 +2,618 @@
 Prediction controller - handles prediction endpoints.
 Follows Single Responsibility Principle - only handles HTTP layer concerns.
 """
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Callable, Iterator, List, Optional, TypeVar
 
-from schemas.prediction import PredictionRequest, PredictionResponse
-from services.prediction_service import IPredictionService
-from utils.dependencies import get_prediction_service
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+from starlette.background import BackgroundTask
+
+from schemas.live import LiveScoringError, LiveScoringMessage, LiveScoringResult
+from schemas.prediction import (
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    PredictionRequest,
+    PredictionResponse,
+)
+from schemas.signals import (
+    DopplerFeaturesResponse,
+    PerfusionFeaturesResponse,
+    ShearWaveFeaturesResponse,
+    SignalFeatures,
+    SignalPredictionResponse,
+)
+from schemas.sweep import SweepRequest, SweepResponse
+from services import (
+    bulk_scoring,
+    columnar_scoring,
+    incremental_scoring,
+    request_codec,
+    signal_features,
+    sweep,
+)
+from services.assessment_store import AssessmentRecord
+from services.assessment_writer import AssessmentWriteBehind
+from services.micro_batcher import MicroBatcher
+from services.scoring_executor import ExecutorSaturatedError, ScoringExecutor
+from utils.dependencies import (
+    get_assessment_writer,
+    get_micro_batcher,
+    get_scoring_executor,
+    resolved_inline,
+)
 
 router = APIRouter(prefix="/predict", tags=["Predictions"])
 
+T = TypeVar("T")
+
+
+def _request_body(model: type) -> dict:
+    """
+    OpenAPI request and response bodies for routes that read and encode their
+    bodies themselves: JSON described by model, or a columnar table.
+    """
+    # Nested models resolve to components; PredictionRequest is one through the /signals response
+    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    binary = {"schema": {"type": "string", "format": "binary"}}
+    columnar = {media_type: binary for media_type in columnar_scoring.CONTENT_TYPES.values()}
+    return {
+        "requestBody": {"required": True, "content": {"application/json": {"schema": schema}, **columnar}},
+        "responses": {"200": {"content": columnar}},
+    }
+
+
+def _saturated(exc: ExecutorSaturatedError) -> HTTPException:
+    """503 telling clients to back off when the scoring queue is full."""
+    return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+
+
+def _reserve_stream(executor: ScoringExecutor) -> Callable[[], None]:
+    try:
+        return executor.reserve_stream()
+    except ExecutorSaturatedError as exc:
+        raise _saturated(exc)
+
+
+def _holding_slot(chunks: Iterator[bytes], release: Callable[[], None]) -> Iterator[bytes]:
+    """Yield a scored stream, giving its slot back when it ends or fails."""
+    try:
+        yield from chunks
+    finally:
+        release()
+
+
+def _slot_response(chunks: Iterator[bytes], release: Callable[[], None], media_type: str) -> StreamingResponse:
+    # The background task covers clients that disconnect before the stream ends
+    return StreamingResponse(_holding_slot(chunks, release), media_type=media_type, background=BackgroundTask(release))
+
+
+def _live_errors(exc: ValidationError) -> list:
+    """Validation errors as plain JSON (no docs links or exception objects)."""
+    return exc.errors(include_url=False, include_context=False)
+
+
+def _is_json(content_type: Optional[str]) -> bool:
+    """Whether FastAPI would parse a body of this content type as JSON."""
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or (media_type.startswith("application/") and media_type.endswith("+json"))
+
+
+async def _decode(request: Request, decode: Callable[[bytes, bool], T]) -> T:
+    """
+    Decode a JSON body with the fast-path codec, reporting failures with the
+    same 422 body FastAPI gives a declared body parameter.
+    """
+    body = await request.body()
+    if not body:
+        raise RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        return decode(body, _is_json(request.headers.get("content-type")))
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", exc.pos), "msg": "JSON decode error",
+              "input": {}, "ctx": {"error": exc.msg}}],
+            body=exc.doc,
+        )
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
+
+
+def _columnar_format(media_types: Optional[str]) -> Optional[str]:
+    """The columnar format a Content-Type or Accept header puts first, or None if it prefers anything else."""
+    media_type = (media_types or "").split(",", 1)[0]
+    if media_type.split(";", 1)[0].strip().lower() in columnar_scoring.MEDIA_TYPES:
+        return columnar_scoring.detect_format(media_type)
+    return None
+
+
+def _response_format(request: Request, body_format: Optional[str]) -> Optional[str]:
+    """
+    Columnar format to answer in, or None for JSON. The first Accept entry
+    decides; without one, or with */*, a columnar body is answered in its own format.
+    """
+    accept = request.headers.get("accept", "")
+    if accept.split(",", 1)[0].split(";", 1)[0].strip() in ("", "*/*"):
+        return body_format
+    return _columnar_format(accept)
 
-@router.post("", response_model=PredictionResponse)
+
+async def _score_columnar(request: Request, body_format: str, executor: ScoringExecutor,
+                          single: bool = False) -> list:
+    """
+    Score an Arrow IPC or Parquet body from its columns, without per-row objects.
+
+    Returns:
+        (scored, missing, valid_rows) per record batch of the body, as results_batch() takes them
+    """
+    body = await request.body()
+    try:
+        record_batches = [
+            record_batch for record_batch in columnar_scoring.read_batches(body, body_format)
+            if record_batch.num_rows
+        ]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except OSError as exc:
+        # A truncated body fails part-way through, as an Arrow IO error
+        raise HTTPException(status_code=400, detail=f"Not a readable {body_format} body: {exc}")
+    rows = sum(record_batch.num_rows for record_batch in record_batches)
+    if rows == 0:
+        raise HTTPException(status_code=400, detail="The table has no rows")
+    if single and rows != 1:
+        raise HTTPException(status_code=400, detail=f"/predict scores one row, got {rows}; use /predict/batch")
+
+    results = []
+    for record_batch in record_batches:
+        batch, missing, valid_rows = columnar_scoring.scorable_features(record_batch)
+        try:
+            scored = await executor.score_batch(batch, explain=True)
+        except ExecutorSaturatedError as exc:
+            raise _saturated(exc)
+        results.append((scored, missing, valid_rows))
+    return results
+
+
+def _columnar_response(record_batches: list, response_format: str) -> Response:
+    """Result batches encoded in one Arrow IPC or Parquet body."""
+    return Response(
+        b"".join(columnar_scoring.iter_encoded(response_format, iter(record_batches))),
+        media_type=columnar_scoring.CONTENT_TYPES[response_format],
+    )
+
+
+def _table_results(scored_batches: list, response_format: str) -> Response:
+    """A scored table answered in a columnar format, with an error value for each unscorable row."""
+    record_batches = [columnar_scoring.results_batch(*scored_batch) for scored_batch in scored_batches]
+    return _columnar_response(record_batches, response_format)
+
+
+def _table_predictions(executor: ScoringExecutor, scored_batches: list) -> List[PredictionResponse]:
+    """A scored table as the predictions a JSON body would get; every row must be scorable."""
+    predictions, first_row = [], 0
+    for scored, missing, valid_rows in scored_batches:
+        invalid = missing.any(axis=1).nonzero()[0]
+        if len(invalid):
+            row = invalid[0]
+            raise HTTPException(
+                status_code=400,
+                detail=f"Row {first_row + row} cannot be scored ({columnar_scoring.missing_fields_error(missing[row])}); "
+                       f"request a columnar response for per-row errors",
+            )
+        predictions.extend(executor.service.build_responses(scored))
+        first_row += len(missing)
+    return predictions
+
+
+def _record(writer: Optional[AssessmentWriteBehind], executor: ScoringExecutor,
+            requests: List[PredictionRequest], predictions: List[PredictionResponse]) -> None:
+    """Hand predictions to the write-behind buffer; persisting happens after the response."""
+    if writer is None:
+        return
+    version = executor.service.version
+    writer.submit(
+        AssessmentRecord.from_prediction(request, prediction, version)
+        for request, prediction in zip(requests, predictions)
+    )
+
+
+@router.post("", response_model=PredictionResponse, openapi_extra=_request_body(PredictionRequest))
 async def predict(
-    request: PredictionRequest,
-    prediction_service: IPredictionService = Depends(get_prediction_service)
-) -> PredictionResponse:
+    request: Request,
+    executor: ScoringExecutor = Depends(resolved_inline(get_scoring_executor)),
+    batcher: Optional[MicroBatcher] = Depends(resolved_inline(get_micro_batcher)),
+    writer: Optional[AssessmentWriteBehind] = Depends(resolved_inline(get_assessment_writer))
+) -> Response:
     """
     Generate organ viability prediction.
     
+    A JSON PredictionRequest body is decoded by the fast-path codec and the
+    prediction encoded directly, without re-validating it as a response model.
+    A one-row Arrow IPC or Parquet body (by Content-Type) is scored from its
+    columns, as for /predict/batch. The first Accept entry picks the response
+    format; without one, a columnar body is answered in its own format and a
+    JSON body in JSON.
+    
     Args:
-        request: Organ assessment data
-        prediction_service: Injected prediction service
+        request: Raw request carrying the organ assessment
+        executor: Injected executor running the prediction service
+        batcher: Injected micro-batcher, when request coalescing is enabled
+        writer: Injected assessment write-behind buffer, when history is enabled
         
     Returns:
         Viability prediction with score, classification, and risk factors
     """
-    return prediction_service.predict(request)
+    body_format = _columnar_format(request.headers.get("content-type"))
+    response_format = _response_format(request, body_format)
+    if body_format is not None:
+        scored_batches = await _score_columnar(request, body_format, executor, single=True)
+        if response_format is not None:
+            return _table_results(scored_batches, response_format)
+        prediction = _table_predictions(executor, scored_batches)[0]
+        return Response(request_codec.encode_prediction(prediction), media_type="application/json")
+
+    assessment = await _decode(request, request_codec.decode_request)
+    try:
+        if batcher is not None:
+            prediction = await batcher.predict(assessment)
+        else:
+            prediction = await executor.predict(assessment)
+    except ExecutorSaturatedError as exc:
+        raise _saturated(exc)
+    _record(writer, executor, [assessment], [prediction])
+    if response_format is not None:
+        return _columnar_response([columnar_scoring.predictions_to_record_batch([prediction])], response_format)
+    return Response(request_codec.encode_prediction(prediction), media_type="application/json")
+
+
+@router.post("/batch", response_model=BatchPredictionResponse, openapi_extra=_request_body(BatchPredictionRequest))
+async def predict_batch(
+    request: Request,
+    executor: ScoringExecutor = Depends(resolved_inline(get_scoring_executor)),
+    writer: Optional[AssessmentWriteBehind] = Depends(resolved_inline(get_assessment_writer))
+) -> Response:
+    """
+    Generate viability predictions for many organs in one call.
+    
+    The body is a JSON BatchPredictionRequest, decoded by the fast-path codec,
+    or (by Content-Type) an Arrow IPC or Parquet table with PredictionRequest
+    columns. Tables are mapped straight into the scoring arrays and answered
+    in the same format with viability_score, classification, confidence,
+    risk_factors, error and contribution_<feature> columns, one row per input
+    row; rows missing a required field get null results and an error instead
+    of failing the call. Like /predict/columnar, tables are not written to
+    assessment history. The first Accept entry picks the response format for
+    either kind of body; without one, tables are answered in their own format.
+    A table answered as JSON must have no unscorable rows.
+    
+    Args:
+        request: Raw request carrying the batch of organ assessments
+        executor: Injected executor running the prediction service
+        writer: Injected assessment write-behind buffer, when history is enabled
+        
+    Returns:
+        Predictions in the same order as the submitted assessments
+    """
+    body_format = _columnar_format(request.headers.get("content-type"))
+    response_format = _response_format(request, body_format)
+    if body_format is not None:
+        scored_batches = await _score_columnar(request, body_format, executor)
+        if response_format is not None:
+            return _table_results(scored_batches, response_format)
+        predictions = _table_predictions(executor, scored_batches)
+        return Response(request_codec.encode_batch(predictions), media_type="application/json")
+
+    assessments = await _decode(request, request_codec.decode_batch)
+    try:
+        predictions = await executor.predict_batch(assessments)
+    except ExecutorSaturatedError as exc:
+        raise _saturated(exc)
+    _record(writer, executor, assessments, predictions)
+    if response_format is not None:
+        return _columnar_response([columnar_scoring.predictions_to_record_batch(predictions)], response_format)
+    return Response(request_codec.encode_batch(predictions), media_type="application/json")
+
+
+@router.post("/sweep", response_model=SweepResponse)
+async def predict_sweep(
+    request: SweepRequest,
+    executor: ScoringExecutor = Depends(get_scoring_executor)
+) -> SweepResponse:
+    """
+    Score a grid of what-if variations of one assessment in a single call.
+    
+    Args:
+        request: Base assessment plus one or two swept fields
+        executor: Injected executor running the prediction service
+        
+    Returns:
+        Score and classification matrices over the grid, plus the score cut-offs
+    """
+    batch, x_values, y_values = sweep.sweep_batch(request)
+    try:
+        scored = await executor.score_batch(batch)
+    except ExecutorSaturatedError as exc:
+        raise _saturated(exc)
+    service = executor.service
+    return sweep.sweep_response(
+        request, scored, x_values, y_values,
+        cutoffs=service.classification_cutoffs(request.base.organ_type),
+        scoring_version=service.version,
+    )
+
+
+@router.post("/stream", response_class=StreamingResponse)
+async def predict_stream(
+    request: Request,
+    chunk_size: int = Query(
+        bulk_scoring.DEFAULT_CHUNK_SIZE, ge=1, le=bulk_scoring.MAX_CHUNK_SIZE,
+        description="Rows parsed and scored per chunk (throughput vs. peak memory)"
+    ),
+    executor: ScoringExecutor = Depends(get_scoring_executor)
+) -> StreamingResponse:
+    """
+    Score a streamed CSV or NDJSON upload and stream scored rows back as NDJSON.
+    
+    The body is read in chunks, so uploads of any size are scored in bounded memory.
+    CSV headers may use PredictionRequest field names or the synthetic-data layout.
+    Each stream holds one of the executor's bulk-stream slots until it ends;
+    with none free the call gets 503.
+    
+    Args:
+        request: Raw request carrying a text/csv or application/x-ndjson body
+        chunk_size: Rows per scoring chunk
+        executor: Injected executor limiting concurrent bulk streams
+        
+    Returns:
+        NDJSON stream with one scored (or error) line per input row
+    """
+    try:
+        upload_format = bulk_scoring.detect_format(request.headers.get("content-type"))
+    except ValueError as exc:
+        raise HTTPException(status_code=415, detail=str(exc))
+
+    release = _reserve_stream(executor)
+    try:
+        upload = await bulk_scoring.spool_upload(request.stream())
+    except BaseException:
+        release()
+        raise
+    return _slot_response(
+        bulk_scoring.score_upload(executor.service, upload, upload_format, chunk_size),
+        release, "application/x-ndjson"
+    )
+
+
+@router.post("/columnar", response_class=StreamingResponse)
+async def predict_columnar(
+    request: Request,
+    batch_rows: int = Query(
+        columnar_scoring.DEFAULT_BATCH_ROWS, ge=1, le=columnar_scoring.MAX_BATCH_ROWS,
+        description="Rows scored per pass (throughput vs. peak memory)"
+    ),
+    explain: bool = Query(True, description="Append one contribution column per feature"),
+    executor: ScoringExecutor = Depends(get_scoring_executor)
+) -> StreamingResponse:
+    """
+    Score an Arrow IPC or Parquet cohort and return it in the same format.
+    
+    The response holds the input columns followed by viability_score,
+    classification, confidence, risk_factors, error and, with explain, one
+    contribution_<feature> column per feature. Column names follow
+    PredictionRequest or the synthetic-data layout, as for /predict/stream,
+    and the call holds a bulk-stream slot the same way.
+    
+    Args:
+        request: Raw request carrying an Arrow file, Arrow stream or Parquet body
+        batch_rows: Rows per scoring pass
+        explain: Include per-feature contribution columns
+        executor: Injected executor limiting concurrent bulk streams
+        
+    Returns:
+        Scored cohort, streamed batch by batch
+    """
+    try:
+        columnar_format = columnar_scoring.detect_format(request.headers.get("content-type"))
+    except ValueError as exc:
+        raise HTTPException(status_code=415, detail=str(exc))
+
+    release = _reserve_stream(executor)
+    try:
+        upload = await bulk_scoring.spool_upload(request.stream())
+        try:
+            batches = columnar_scoring.read_batches(upload, columnar_format, batch_rows)
+        except ValueError as exc:
+            upload.close()
+            raise HTTPException(status_code=400, detail=str(exc))
+    except BaseException:
+        release()
+        raise
+    return _slot_response(
+        columnar_scoring.score_upload(executor.service, upload, batches, columnar_format, explain),
+        release, columnar_scoring.CONTENT_TYPES[columnar_format]
+    )
+
+
+@router.post("/signals", response_model=SignalPredictionResponse)
+async def predict_signals(
+    assessment: str = Form(..., description="JSON object with the PredictionRequest fields not derived from recordings"),
+    doppler: Optional[UploadFile] = File(None, description="Doppler velocity trace (NPY or raw 1-D buffer)"),
+    doppler_sample_rate_hz: Optional[float] = Form(None, gt=0),
+    shear_wave: Optional[UploadFile] = File(None, description="Tracked displacements ([acquisitions,] positions, samples)"),
+    shear_wave_sample_rate_hz: Optional[float] = Form(None, gt=0),
+    shear_wave_spacing_mm: Optional[float] = Form(None, gt=0),
+    shear_wave_positions: Optional[int] = Form(None, ge=2),
+    shear_wave_samples: Optional[int] = Form(None, ge=3),
+    perfusion: Optional[UploadFile] = File(None, description="Per-region intensity curves (regions, frames)"),
+    perfusion_regions: Optional[int] = Form(None, ge=2),
+    dtype: str = Form("float32", description="Sample type of raw (headerless) buffers"),
+    executor: ScoringExecutor = Depends(get_scoring_executor),
+    writer: Optional[AssessmentWriteBehind] = Depends(get_assessment_writer)
+) -> SignalPredictionResponse:
+    """
+    Score an assessment whose resistive index, shear wave velocity and/or
+    perfusion uniformity are derived from uploaded ultrasound recordings.
+    
+    Derived values replace the matching fields of the assessment JSON; fields
+    without a recording must be present in it.
+    
+    Args:
+        assessment: JSON object with the remaining PredictionRequest fields
+        doppler: Doppler velocity trace, yields resistive_index
+        doppler_sample_rate_hz: Sampling rate of the Doppler trace
+        shear_wave: Tracked displacements, yields shear_wave_velocity_ms
+        shear_wave_sample_rate_hz: Tracking pulse repetition frequency
+        shear_wave_spacing_mm: Distance between adjacent tracking positions
+        shear_wave_positions: Tracking positions, to shape a raw buffer
+        shear_wave_samples: Samples per acquisition, to shape a raw buffer
+        perfusion: Per-region intensity curves, yields perfusion_uniformity_pct
+        perfusion_regions: Regions of interest, to shape a raw buffer
+        dtype: Sample type of raw buffers
+        executor: Injected executor running the prediction service
+        writer: Injected assessment write-behind buffer, when history is enabled
+        
+    Returns:
+        Extracted features, the assembled request and its prediction
+    """
+    if doppler is None and shear_wave is None and perfusion is None:
+        raise HTTPException(status_code=400, detail="Upload at least one of doppler, shear_wave or perfusion")
+    if doppler is not None and doppler_sample_rate_hz is None:
+        raise HTTPException(status_code=400, detail="doppler_sample_rate_hz is required with a doppler recording")
+    if shear_wave is not None and (shear_wave_sample_rate_hz is None or shear_wave_spacing_mm is None):
+        raise HTTPException(
+            status_code=400,
+            detail="shear_wave_sample_rate_hz and shear_wave_spacing_mm are required with a shear_wave recording"
+        )
+    try:
+        fields = json.loads(assessment)
+    except json.JSONDecodeError as exc:
+        raise HTTPException(status_code=400, detail=f"assessment is not valid JSON: {exc}")
+    if not isinstance(fields, dict):
+        raise HTTPException(status_code=400, detail="assessment must be a JSON object")
+
+    def extract():
+        # Memory-maps the spooled uploads and reduces them off the event loop
+        return (
+            None if doppler is None else signal_features.extract_doppler(
+                doppler.file, doppler_sample_rate_hz, dtype
+            ),
+            None if shear_wave is None else signal_features.extract_shear_wave(
+                shear_wave.file, shear_wave_sample_rate_hz, shear_wave_spacing_mm,
+                shear_wave_positions, shear_wave_samples, dtype,
+            ),
+            None if perfusion is None else signal_features.extract_perfusion(
+                perfusion.file, perfusion_regions, dtype
+            ),
+        )
+
+    try:
+        doppler_found, shear_wave_found, perfusion_found = await asyncio.get_running_loop().run_in_executor(
+            None, extract
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    fields.update(signal_features.request_fields(doppler_found, shear_wave_found, perfusion_found))
+    try:
+        request = PredictionRequest(**fields)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+    try:
+        prediction = await executor.predict(request)
+    except ExecutorSaturatedError as exc:
+        raise _saturated(exc)
+    _record(writer, executor, [request], [prediction])
+
+    return SignalPredictionResponse(
+        features=SignalFeatures(
+            doppler=None if doppler_found is None else DopplerFeaturesResponse(**asdict(doppler_found)),
+            shear_wave=None if shear_wave_found is None else ShearWaveFeaturesResponse(**asdict(shear_wave_found)),
+            perfusion=None if perfusion_found is None else PerfusionFeaturesResponse(**asdict(perfusion_found)),
+        ),
+        request=request,
+        prediction=prediction,
+    )
+
+
+@router.websocket("/live")
+async def predict_live(
+    websocket: WebSocket,
+    executor: ScoringExecutor = Depends(get_scoring_executor),
+    writer: Optional[AssessmentWriteBehind] = Depends(get_assessment_writer)
+) -> None:
+    """
+    Score a live assessment incrementally over a WebSocket.
+    
+    The first message carries a complete assessment ({"assessment": {...}});
+    later messages carry only the fields that changed ({"update": {...}}).
+    Every message is answered with the rescored assessment and the fields that
+    changed, or with an error that leaves the session as it was. Under the
+    rule-based engine only the changed terms of the weighted sum are recomputed;
+    other engines rescore the merged assessment.
+    
+    Args:
+        websocket: Client connection; the session lives as long as it does
+        executor: Injected executor running the prediction service
+        writer: Injected assessment write-behind buffer, when history is enabled
+    """
+    await websocket.accept()
+    request: Optional[PredictionRequest] = None
+    session: Optional[incremental_scoring.ScoringSession] = None
+    seq = 0
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                message = LiveScoringMessage.model_validate_json(text)
+            except ValidationError as exc:
+                await websocket.send_text(LiveScoringError(detail=_live_errors(exc)).model_dump_json())
+                continue
+
+            try:
+                if message.assessment is not None:
+                    request, changed = message.assessment, list(PredictionRequest.model_fields)
+                    session = incremental_scoring.open_session(executor.service, request)
+                    prediction = session.prediction() if session is not None else await executor.predict(request)
+                elif request is None:
+                    raise ValueError("Send an assessment before sending updates")
+                elif session is not None:
+                    prediction, changed = session.update(message.update)
+                    request = session.request
+                else:
+                    merged, changed = incremental_scoring.merge_update(request, message.update)
+                    prediction = await executor.predict(merged)
+                    request = merged
+            except ValidationError as exc:
+                await websocket.send_text(LiveScoringError(id=message.id, detail=_live_errors(exc)).model_dump_json())
+                continue
+            except (ValueError, ExecutorSaturatedError) as exc:
+                await websocket.send_text(LiveScoringError(id=message.id, detail=str(exc)).model_dump_json())
+                continue
+
+            seq += 1
+            await websocket.send_text(
+                LiveScoringResult(id=message.id, seq=seq, changed=changed, prediction=prediction).model_dump_json()
+            )
+            _record(writer, executor, [request], [prediction])
+    except WebSocketDisconnect:
+        return
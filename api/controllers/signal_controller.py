@@ -0,0 +1,102 @@
+"""
+Signal controller - handles ultrasound recording feature-extraction endpoints.
+Follows Single Responsibility Principle - only handles HTTP layer concerns.
+"""
+import asyncio
+from dataclasses import asdict
+from typing import Callable, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from schemas.signals import DopplerFeaturesResponse, PerfusionFeaturesResponse, ShearWaveFeaturesResponse
+from services import bulk_scoring, signal_features
+
+router = APIRouter(prefix="/signals", tags=["Signals"])
+
+DTYPE_QUERY = Query(
+    "float32", pattern="^(" + "|".join(signal_features.RAW_DTYPES) + ")$",
+    description="Sample type of raw (headerless) buffers; NPY uploads carry their own"
+)
+
+
+async def _extract(request: Request, extractor: Callable, *args):
+    """Spool the body, then map and reduce it off the event loop; bad recordings are 400s."""
+    upload = await bulk_scoring.spool_upload(request.stream())
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, extractor, upload, *args)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    finally:
+        upload.close()
+
+
+@router.post("/doppler", response_model=DopplerFeaturesResponse)
+async def doppler(
+    request: Request,
+    sample_rate_hz: float = Query(..., gt=0, description="Sampling rate of the velocity trace"),
+    dtype: str = DTYPE_QUERY
+) -> DopplerFeaturesResponse:
+    """
+    Derive the resistive index from a Doppler velocity trace.
+    
+    Args:
+        request: Raw request carrying a 1-D NPY array or raw sample buffer
+        sample_rate_hz: Sampling rate of the trace
+        dtype: Sample type of raw buffers
+        
+    Returns:
+        Median RI, PSV and EDV over the recorded beats, and the heart rate
+    """
+    features = await _extract(request, signal_features.extract_doppler, sample_rate_hz, dtype)
+    return DopplerFeaturesResponse(**asdict(features))
+
+
+@router.post("/shear-wave", response_model=ShearWaveFeaturesResponse)
+async def shear_wave(
+    request: Request,
+    sample_rate_hz: float = Query(..., gt=0, description="Tracking pulse repetition frequency"),
+    spacing_mm: float = Query(..., gt=0, description="Distance between adjacent tracking positions"),
+    positions: Optional[int] = Query(None, ge=2, description="Tracking positions (raw buffers only)"),
+    samples: Optional[int] = Query(None, ge=3, description="Samples per acquisition (raw buffers only)"),
+    dtype: str = DTYPE_QUERY
+) -> ShearWaveFeaturesResponse:
+    """
+    Derive shear wave velocity from tracked displacements.
+    
+    Args:
+        request: Raw request carrying a ([acquisitions,] positions, samples) array,
+            positions ordered by distance from the push
+        sample_rate_hz: Tracking pulse repetition frequency
+        spacing_mm: Distance between adjacent tracking positions
+        positions: Tracking positions, to shape a raw buffer
+        samples: Samples per acquisition, to split a raw buffer into acquisitions
+        dtype: Sample type of raw buffers
+        
+    Returns:
+        Median and IQR of the wave speed over acquisitions
+    """
+    features = await _extract(
+        request, signal_features.extract_shear_wave, sample_rate_hz, spacing_mm, positions, samples, dtype
+    )
+    return ShearWaveFeaturesResponse(**asdict(features))
+
+
+@router.post("/perfusion", response_model=PerfusionFeaturesResponse)
+async def perfusion(
+    request: Request,
+    regions: Optional[int] = Query(None, ge=2, description="Regions of interest (raw buffers only)"),
+    dtype: str = DTYPE_QUERY
+) -> PerfusionFeaturesResponse:
+    """
+    Derive perfusion uniformity from per-region intensity curves.
+    
+    Args:
+        request: Raw request carrying a (regions, frames) array
+        regions: Regions of interest, to shape a raw buffer
+        dtype: Sample type of raw buffers
+        
+    Returns:
+        Uniformity of the time-averaged intensity across regions
+    """
+    features = await _extract(request, signal_features.extract_perfusion, regions, dtype)
+    return PerfusionFeaturesResponse(**asdict(features))
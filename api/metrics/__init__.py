@@ -0,0 +1,12 @@
+from .middleware import MetricsMiddleware
+from .registry import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry, stage_timer
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "stage_timer",
+]
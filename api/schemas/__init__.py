@@ -1,3 +1,42 @@
-from .prediction import PredictionRequest, PredictionResponse
+from .assessment import Assessment, AssessmentHistoryResponse
+from .job import JobListResponse, JobResponse
+from .live import LiveScoringError, LiveScoringMessage, LiveScoringResult
+from .model import ModelInfo, ModelRegistryResponse
+from .prediction import (
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    PredictionRequest,
+    PredictionResponse,
+)
+from .signals import (
+    DopplerFeaturesResponse,
+    PerfusionFeaturesResponse,
+    ShearWaveFeaturesResponse,
+    SignalFeatures,
+    SignalPredictionResponse,
+)
+from .sweep import SweepAxis, SweepRequest, SweepResponse
 
-__all__ = ["PredictionRequest", "PredictionResponse"]
+__all__ = [
+    "PredictionRequest",
+    "PredictionResponse",
+    "BatchPredictionRequest",
+    "BatchPredictionResponse",
+    "ModelInfo",
+    "ModelRegistryResponse",
+    "Assessment",
+    "AssessmentHistoryResponse",
+    "DopplerFeaturesResponse",
+    "ShearWaveFeaturesResponse",
+    "PerfusionFeaturesResponse",
+    "SignalFeatures",
+    "SignalPredictionResponse",
+    "LiveScoringMessage",
+    "LiveScoringResult",
+    "LiveScoringError",
+    "JobResponse",
+    "JobListResponse",
+    "SweepAxis",
+    "SweepRequest",
+    "SweepResponse",
+]
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class Assessment(BaseModel):
+    """A persisted prediction."""
+    id: int
+    created_at: str
+    organ_type: str
+    viability_score: int
+    classification: str
+    confidence: float
+    scoring_version: str
+    risk_factors: List[str]
+    request: Dict[str, Any]
+
+
+class AssessmentHistoryResponse(BaseModel):
+    """Newest-first page of assessment history."""
+    assessments: List[Assessment]
+    next_before_id: Optional[int] = None
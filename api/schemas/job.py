@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class JobResponse(BaseModel):
+    """State, progress and throughput of a bulk scoring job."""
+    id: str
+    status: str
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    format: str
+    rows_total: Optional[int] = None
+    rows_done: int
+    progress: Optional[float] = None
+    run_seconds: float
+    rows_per_second: Optional[float] = None
+    output_bytes: Optional[int] = None
+    attempts: int
+    cancel_requested: bool
+    error: Optional[str] = None
+
+
+class JobListResponse(BaseModel):
+    """Newest-first list of bulk scoring jobs."""
+    jobs: List[JobResponse]
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, model_validator
+from typing import Any, Dict, List, Optional, Union
+
+from schemas.prediction import PredictionRequest, PredictionResponse
+
+
+class LiveScoringMessage(BaseModel):
+    """
+    Client message on the /predict/live WebSocket: a complete assessment starts
+    (or restarts) the session, an update changes some of its fields.
+    """
+    id: Optional[Union[int, str]] = None
+    assessment: Optional[PredictionRequest] = None
+    update: Optional[Dict[str, Any]] = None
+
+    @model_validator(mode="after")
+    def _one_of(self):
+        if (self.assessment is None) == (self.update is None):
+            raise ValueError("Send exactly one of assessment or update")
+        return self
+
+
+class LiveScoringResult(BaseModel):
+    """Rescored assessment after a start or update, echoing the message id."""
+    id: Optional[Union[int, str]] = None
+    seq: int
+    changed: List[str]
+    prediction: PredictionResponse
+
+
+class LiveScoringError(BaseModel):
+    """Rejected message; the session keeps its previous state."""
+    id: Optional[Union[int, str]] = None
+    detail: Any
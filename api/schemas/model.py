@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class ModelInfo(BaseModel):
+    """A model version loaded by the API."""
+    version: str
+    path: str
+    active: bool
+    load_seconds: float
+    loaded_at: str
+    size_bytes: int
+    feature_names: List[str]
+    metadata: Dict[str, Any]
+
+
+class ModelRegistryResponse(BaseModel):
+    """Response model for the loaded model registry."""
+    engine: str
+    active_version: Optional[str]
+    models: List[ModelInfo]
@@ -1,21 +1,29 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, FiniteFloat, model_serializer, model_validator
 from typing import List, Optional
 
+from metrics.registry import stage_timer
+
 
 class PredictionRequest(BaseModel):
     """Request model for organ viability prediction."""
     organ_type: str
-    tissue_stiffness_kpa: float
-    resistive_index: float
-    shear_wave_velocity_ms: float
-    perfusion_uniformity_pct: float
+    tissue_stiffness_kpa: FiniteFloat
+    resistive_index: FiniteFloat
+    shear_wave_velocity_ms: FiniteFloat
+    perfusion_uniformity_pct: FiniteFloat
     echogenicity_grade: int
-    edema_index: float
-    cold_ischemia_hours: float
+    edema_index: FiniteFloat
+    cold_ischemia_hours: FiniteFloat
     donor_age: int
     kdpi_percentile: Optional[int] = None
     cause_of_death: str
-    warm_ischemia_minutes: float
+    warm_ischemia_minutes: FiniteFloat
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _timed_validation(cls, data, handler):
+        with stage_timer("validation"):
+            return handler(data)
 
 
 class PredictionResponse(BaseModel):
@@ -25,3 +33,18 @@ class PredictionResponse(BaseModel):
     confidence: float
     risk_factors: List[str]
     feature_contributions: dict
+
+    @model_serializer(mode="wrap")
+    def _timed_serialization(self, handler):
+        with stage_timer("serialization"):
+            return handler(self)
+
+
+class BatchPredictionRequest(BaseModel):
+    """Request model for scoring many organs in one call."""
+    requests: List[PredictionRequest] = Field(..., min_length=1)
+
+
+class BatchPredictionResponse(BaseModel):
+    """Response model for batch prediction, in request order."""
+    predictions: List[PredictionResponse]
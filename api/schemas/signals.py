@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import Optional
+
+from schemas.prediction import PredictionRequest, PredictionResponse
+
+
+class DopplerFeaturesResponse(BaseModel):
+    """Resistive index derived from a Doppler velocity trace (velocities in the trace's unit)."""
+    resistive_index: float
+    peak_systolic_velocity: float
+    end_diastolic_velocity: float
+    heart_rate_bpm: float
+    beats: int
+    duration_seconds: float
+
+
+class ShearWaveFeaturesResponse(BaseModel):
+    """Shear wave velocity (median and IQR over acquisitions) from tracked displacements."""
+    shear_wave_velocity_ms: float
+    velocity_iqr_ms: float
+    acquisitions: int
+
+
+class PerfusionFeaturesResponse(BaseModel):
+    """Perfusion uniformity from per-region intensity curves."""
+    perfusion_uniformity_pct: float
+    regions: int
+    frames: int
+
+
+class SignalFeatures(BaseModel):
+    """Features extracted from whichever recordings were uploaded."""
+    doppler: Optional[DopplerFeaturesResponse] = None
+    shear_wave: Optional[ShearWaveFeaturesResponse] = None
+    perfusion: Optional[PerfusionFeaturesResponse] = None
+
+
+class SignalPredictionResponse(BaseModel):
+    """Prediction for an assessment whose ultrasound fields were derived from recordings."""
+    features: SignalFeatures
+    request: PredictionRequest
+    prediction: PredictionResponse
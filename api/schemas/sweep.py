@@ -0,0 +1,51 @@
+from pydantic import BaseModel, Field, FiniteFloat, field_validator, model_validator
+from typing import Dict, List, Optional
+
+from schemas.prediction import PredictionRequest
+from services.scoring_kernel import NUMERIC_FIELDS
+
+MAX_SWEEP_STEPS = 200
+
+
+class SweepAxis(BaseModel):
+    """One swept numeric field, sampled at evenly spaced points from start to stop."""
+    field: str
+    start: FiniteFloat
+    stop: FiniteFloat
+    steps: int = Field(25, ge=2, le=MAX_SWEEP_STEPS)
+
+    @field_validator("field")
+    @classmethod
+    def _numeric_field(cls, value: str) -> str:
+        if value not in NUMERIC_FIELDS:
+            raise ValueError(f"must be one of {', '.join(NUMERIC_FIELDS)}")
+        return value
+
+
+class SweepRequest(BaseModel):
+    """Request model for a what-if grid around one assessment."""
+    base: PredictionRequest
+    x: SweepAxis
+    y: Optional[SweepAxis] = None
+
+    @model_validator(mode="after")
+    def _distinct_axes(self) -> "SweepRequest":
+        if self.y is not None and self.y.field == self.x.field:
+            raise ValueError("x and y must sweep different fields")
+        return self
+
+
+class SweepResponse(BaseModel):
+    """
+    Scores over the grid: scores[i][j] is the score at y_values[i], x_values[j]
+    (a single row when only x is swept). classes[i][j] indexes into labels.
+    """
+    x_field: str
+    x_values: List[float]
+    y_field: Optional[str] = None
+    y_values: Optional[List[float]] = None
+    scores: List[List[int]]
+    classes: List[List[int]]
+    labels: List[str]
+    cutoffs: Optional[Dict[str, float]] = None
+    scoring_version: str
@@ -0,0 +1,44 @@
+"""
+Score an Arrow IPC or Parquet cohort file offline.
+
+Uses the same prediction service as the API (honouring ULTRAVIAB_ENGINE and the
+scoring/risk config), so notebook results match what /predict would return.
+
+Usage (from api/):
+    python score_cohort.py cohort.parquet scored.parquet
+    python score_cohort.py cohort.arrow scored.arrow --batch-rows 500000 --no-explain
+"""
+import argparse
+import sys
+import time
+from typing import List
+
+from services import columnar_scoring
+from utils.dependencies import get_prediction_service
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Score a columnar cohort file with the UltraViab scorer.")
+    parser.add_argument("source", help="Input .arrow / .feather / .arrows / .parquet file")
+    parser.add_argument("destination", help="Output file; its extension selects the format")
+    parser.add_argument("--batch-rows", type=int, default=columnar_scoring.DEFAULT_BATCH_ROWS,
+                        help="Rows scored per pass (throughput vs. peak memory)")
+    parser.add_argument("--no-explain", action="store_true", help="Skip the per-feature contribution columns")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        rows = columnar_scoring.score_file(
+            get_prediction_service(), args.source, args.destination,
+            batch_rows=args.batch_rows, explain=not args.no_explain,
+        )
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    print(f"Scored {rows:,} rows into {args.destination} in {elapsed:.1f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
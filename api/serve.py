@@ -0,0 +1,118 @@
+"""
+Pre-fork launcher for the UltraViab API.
+
+Loads the scoring plans / model once in the master process, then forks N uvicorn
+workers that share the warm service copy-on-write and accept on one socket.
+
+Usage (from api/):
+    python serve.py --workers 4 --port 8000
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List
+
+import uvicorn
+
+from app import app
+from utils.dependencies import get_prediction_service
+
+# A worker that dies sooner than this after starting is replaced only after this long
+RESPAWN_BACKOFF_SECONDS = 1.0
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, args: argparse.Namespace) -> None:
+    config = uvicorn.Config(app, log_level=args.log_level, timeout_keep_alive=args.keep_alive)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run UltraViab API workers sharing one preloaded model.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--keep-alive", type=int, default=5, help="Keep-alive timeout in seconds")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    # Load plans / model artifacts before forking so every worker shares the pages
+    get_prediction_service()
+    # Keep the preloaded objects out of GC passes that would touch (and copy) their pages
+    gc.freeze()
+
+    sock = _bind(args.host, args.port)
+    print(f"UltraViab master {os.getpid()} serving on {args.host}:{args.port} with {args.workers} workers")
+
+    children: Dict[int, float] = {}  # pid -> start time
+    stopping = False
+
+    def _spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                _run_worker(sock, args)
+            finally:
+                os._exit(0)
+        children[pid] = time.monotonic()
+        if stopping:
+            # The stop signal arrived while forking; this worker missed it
+            os.kill(pid, signal.SIGTERM)
+
+    def _forward(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for child in list(children):
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, _forward)
+    signal.signal(signal.SIGTERM, _forward)
+    for _ in range(max(args.workers, 1)):
+        _spawn()
+
+    # Reap workers as they exit; until told to stop, replace any that die (OOM, native crash)
+    exit_code = 0
+    while children:
+        try:
+            pid, status = os.wait()
+        except InterruptedError:
+            continue
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        if stopping:
+            if code not in (0, -signal.SIGTERM):
+                exit_code = 1
+            continue
+        print(f"UltraViab worker {pid} exited with code {code}; starting a replacement", file=sys.stderr)
+        if time.monotonic() - started < RESPAWN_BACKOFF_SECONDS:
+            # Dying on startup: don't fork in a tight loop
+            time.sleep(RESPAWN_BACKOFF_SECONDS)
+        if not stopping:
+            _spawn()
+    sock.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,23 @@
-from .prediction_service import PredictionService
+"""
+Scoring and prediction services.
 
-__all__ = ["PredictionService"]
+Exports resolve lazily so the NumPy-only scoring path (services.scoring_kernel,
+services.scoring_plan) imports without pulling in pydantic or the web stack.
+"""
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "IPredictionService": "services.prediction_service",
+    "PredictionService": "services.prediction_service",
+}
+
+__all__ = ["IPredictionService", "PredictionService"]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'services' has no attribute '{name}'")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
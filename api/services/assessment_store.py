@@ -0,0 +1,203 @@
+"""
+Assessment history storage.
+Prediction results are persisted behind IAssessmentStore. The SQLite implementation
+mirrors the Postgres schema in supabase/migrations, so it can be used offline and in tests.
+"""
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from schemas.prediction import PredictionRequest, PredictionResponse
+
+ASSESSMENT_DB_ENV = "ULTRAVIAB_ASSESSMENT_DB"
+
+DEFAULT_HISTORY_LIMIT = 100
+MAX_HISTORY_LIMIT = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    organ_type TEXT NOT NULL,
+    viability_score INTEGER NOT NULL,
+    classification TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    scoring_version TEXT NOT NULL,
+    risk_factors TEXT NOT NULL,
+    request TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assessments_organ_type_created_at_idx ON assessments (organ_type, created_at);
+CREATE INDEX IF NOT EXISTS assessments_classification_created_at_idx ON assessments (classification, created_at);
+CREATE INDEX IF NOT EXISTS assessments_created_at_idx ON assessments (created_at);
+"""
+
+_COLUMNS = (
+    "created_at", "organ_type", "viability_score", "classification",
+    "confidence", "scoring_version", "risk_factors", "request",
+)
+
+
+def utc_timestamp(moment: datetime) -> str:
+    """
+    A time as stored: fixed-width ISO-8601 UTC, so text comparison orders
+    chronologically. Naive times are taken to be UTC.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def utc_now() -> str:
+    """Current time as a stored timestamp."""
+    return utc_timestamp(datetime.now(timezone.utc))
+
+
+@dataclass
+class AssessmentRecord:
+    """One persisted prediction."""
+    organ_type: str
+    viability_score: int
+    classification: str
+    confidence: float
+    scoring_version: str
+    risk_factors: List[str] = field(default_factory=list)
+    request: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = field(default_factory=utc_now)
+    id: Optional[int] = None
+
+    @classmethod
+    def from_prediction(cls, request: PredictionRequest, response: PredictionResponse,
+                        scoring_version: str) -> "AssessmentRecord":
+        return cls(
+            organ_type=request.organ_type.strip().lower(),
+            viability_score=response.viability_score,
+            classification=response.classification,
+            confidence=response.confidence,
+            scoring_version=scoring_version,
+            risk_factors=list(response.risk_factors),
+            request=request.model_dump(),
+        )
+
+
+class IAssessmentStore(ABC):
+    """
+    Interface for assessment history storage.
+    Follows Dependency Inversion Principle - depend on abstractions.
+    """
+
+    @abstractmethod
+    def insert_many(self, records: Sequence[AssessmentRecord]) -> int:
+        """Persist records in one transaction and return how many were written."""
+        pass
+
+    @abstractmethod
+    def query(
+        self,
+        organ_type: Optional[str] = None,
+        classification: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> List[AssessmentRecord]:
+        """Newest-first assessments matching every given filter."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class SQLiteAssessmentStore(IAssessmentStore):
+    """
+    SQLite-backed assessment history.
+
+    Args:
+        path: Database file, created with its parent directory if missing (":memory:" for tests)
+    """
+    def __init__(self, path: str):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+
+    def insert_many(self, records: Sequence[AssessmentRecord]) -> int:
+        rows = [
+            (
+                record.created_at, record.organ_type, record.viability_score, record.classification,
+                record.confidence, record.scoring_version,
+                json.dumps(record.risk_factors), json.dumps(record.request, separators=(",", ":")),
+            )
+            for record in records
+        ]
+        if not rows:
+            return 0
+        statement = f"INSERT INTO assessments ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(statement, rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return len(rows)
+
+    def query(
+        self,
+        organ_type: Optional[str] = None,
+        classification: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> List[AssessmentRecord]:
+        clauses, params = [], []
+        if organ_type:
+            clauses.append("organ_type = ?")
+            params.append(organ_type.strip().lower())
+        if classification:
+            clauses.append("classification = ?")
+            params.append(classification)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(utc_timestamp(since))
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(utc_timestamp(until))
+        if before_id is not None:
+            # Keyset pagination: resume strictly after the (created_at, id) of the cursor row
+            clauses.append("(created_at, id) < ((SELECT created_at FROM assessments WHERE id = ?), ?)")
+            params.extend([before_id, before_id])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        # Every index ends in created_at (plus the implicit rowid), so filters and ordering share one index
+        statement = (
+            f"SELECT id, {', '.join(_COLUMNS)} FROM assessments {where} "
+            "ORDER BY created_at DESC, id DESC LIMIT ?"
+        )
+        params.append(min(max(limit, 1), MAX_HISTORY_LIMIT))
+
+        with self._lock:
+            rows = self._connection.execute(statement, params).fetchall()
+        return [
+            AssessmentRecord(
+                id=row[0], created_at=row[1], organ_type=row[2], viability_score=row[3],
+                classification=row[4], confidence=row[5], scoring_version=row[6],
+                risk_factors=json.loads(row[7]), request=json.loads(row[8]),
+            )
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,108 @@
+"""
+Write-behind persistence of assessments.
+Requests only append to an in-memory buffer; a background task bulk-inserts the
+buffer in batches off the event loop, so storage adds no latency to /predict.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Iterable, Optional
+
+from metrics.registry import REGISTRY, Counter, Gauge
+from services.assessment_store import AssessmentRecord, IAssessmentStore
+
+WRITE_BATCH_SIZE_ENV = "ULTRAVIAB_ASSESSMENT_BATCH_SIZE"
+FLUSH_INTERVAL_ENV = "ULTRAVIAB_ASSESSMENT_FLUSH_MS"
+MAX_PENDING_ENV = "ULTRAVIAB_ASSESSMENT_MAX_PENDING"
+DEFAULT_WRITE_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.25
+DEFAULT_MAX_PENDING = 100_000
+
+logger = logging.getLogger(__name__)
+
+WRITTEN = REGISTRY.register(Counter(
+    "ultraviab_assessments_written_total", "Assessments persisted to the history store."
+))
+DROPPED = REGISTRY.register(Counter(
+    "ultraviab_assessments_dropped_total", "Assessments dropped because the buffer was full or a write failed."
+))
+PENDING = REGISTRY.register(Gauge(
+    "ultraviab_assessments_pending", "Assessments buffered and not yet persisted."
+))
+
+
+class AssessmentWriteBehind:
+    """
+    Buffers assessment records and flushes them to a store in bulk.
+
+    Args:
+        store: Destination store
+        batch_size: Records per insert transaction
+        flush_interval_seconds: Longest a record waits before being flushed
+        max_pending: Buffer bound; newer records are dropped (and counted) beyond it
+    """
+    def __init__(
+        self,
+        store: IAssessmentStore,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.store = store
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self._buffer: Deque[AssessmentRecord] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, records: Iterable[AssessmentRecord]) -> None:
+        """Queue records for persistence without blocking the caller."""
+        for record in records:
+            if len(self._buffer) >= self.max_pending:
+                DROPPED.inc()
+                continue
+            self._buffer.append(record)
+            PENDING.inc()
+        if self._wakeup is not None and len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and persist everything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+        while self._buffer:
+            await self._flush_batch()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._buffer:
+                await self._flush_batch()
+
+    async def _flush_batch(self) -> None:
+        batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+        PENDING.dec(len(batch))
+        try:
+            written = await asyncio.get_running_loop().run_in_executor(None, self.store.insert_many, batch)
+        except Exception:
+            logger.exception("Failed to persist %d assessments", len(batch))
+            DROPPED.inc(len(batch))
+            return
+        WRITTEN.inc(written)
@@ -0,0 +1,230 @@
+"""
+Bulk scoring of streamed CSV / NDJSON uploads.
+Uploads are spooled to a bounded buffer, parsed in fixed-size chunks and scored
+chunk by chunk, so peak memory depends on the chunk size, not the file size.
+"""
+import csv
+import io
+import json
+import tempfile
+from itertools import islice
+from typing import AsyncIterator, BinaryIO, Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from services.prediction_service import IPredictionService
+from services.scoring_kernel import NUMERIC_FIELDS, REQUIRED_FIELDS, ScoredBatch, columns_to_batch
+
+CSV = "csv"
+NDJSON = "ndjson"
+
+MEDIA_TYPES = {
+    "text/csv": CSV,
+    "application/csv": CSV,
+    "application/x-ndjson": NDJSON,
+    "application/ndjson": NDJSON,
+    "application/jsonl": NDJSON,
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+MAX_CHUNK_SIZE = 100_000
+
+# Uploads larger than this are spilled from memory to a temporary file.
+SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024
+
+# Column names written by generate_ultra_viab_data ("Synthetic Data").
+SYNTHETIC_COLUMN_ALIASES = {
+    "CIT_hours": "cold_ischemia_hours",
+    "KDPI_score": "kdpi_percentile",
+    "Stiffness_kPa": "tissue_stiffness_kpa",
+    "Resistive_Index": "resistive_index",
+    "Perfusion_Uniformity": "perfusion_uniformity_pct",
+}
+
+# Values used for fields an upload does not carry (the dashboard defaults).
+BULK_DEFAULTS = {
+    "organ_type": "Kidney",
+    "shear_wave_velocity_ms": 2.1,
+    "echogenicity_grade": 2,
+    "edema_index": 0.2,
+    "donor_age": 45,
+    "cause_of_death": "Other",
+    "warm_ischemia_minutes": 15,
+}
+
+
+def detect_format(content_type: str) -> str:
+    """
+    Resolve an upload Content-Type to CSV or NDJSON.
+
+    Raises:
+        ValueError: If the media type is not supported
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in MEDIA_TYPES:
+        supported = ", ".join(sorted(MEDIA_TYPES))
+        raise ValueError(f"Unsupported media type '{media_type}'. Use one of: {supported}")
+    return MEDIA_TYPES[media_type]
+
+
+async def spool_upload(body: AsyncIterator[bytes]) -> BinaryIO:
+    """Copy a streamed request body into a temp file that only spills to disk when large."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    async for chunk in body:
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def iter_csv_chunks(upload: BinaryIO, chunk_size: int) -> Iterator[Tuple[Dict[str, list], int]]:
+    """Yield (columns, row count) for chunks of at most chunk_size CSV rows."""
+    reader = csv.reader(io.TextIOWrapper(upload, encoding="utf-8", newline=""))
+    header = next(reader, None)
+    if header is None:
+        return
+    names = [SYNTHETIC_COLUMN_ALIASES.get(name.strip(), name.strip()) for name in header]
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            return
+        width = len(names)
+        padded = [row + [""] * (width - len(row)) if len(row) < width else row for row in rows]
+        yield {name: list(values) for name, values in zip(names, zip(*padded))}, len(rows)
+
+
+def iter_ndjson_chunks(upload: BinaryIO, chunk_size: int) -> Iterator[Tuple[Dict[str, list], int]]:
+    """Yield (columns, row count) for chunks of at most chunk_size NDJSON records."""
+    lines = (line for line in upload if line.strip())
+    while True:
+        records = [_parse_record(line) for line in islice(lines, chunk_size)]
+        if not records:
+            return
+        yield records_to_columns(records), len(records)
+
+
+def _parse_record(line: bytes) -> dict:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return {}
+    return record if isinstance(record, dict) else {}
+
+
+def records_to_columns(records: Sequence[dict]) -> Dict[str, list]:
+    """Pivot NDJSON records into columns, applying the synthetic-data aliases."""
+    columns: Dict[str, list] = {}
+    for i, record in enumerate(records):
+        for key, value in record.items():
+            name = SYNTHETIC_COLUMN_ALIASES.get(key, key)
+            columns.setdefault(name, [None] * len(records))[i] = value
+    return columns
+
+
+def _float_column(values: Sequence) -> np.ndarray:
+    """Values as floats; non-numeric and infinite ones become NaN (missing)."""
+    try:
+        column = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        column = np.array([_to_float(v) for v in values], dtype=np.float64)
+    column[np.isinf(column)] = np.nan
+    return column
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def score_columns(
+    service: IPredictionService,
+    columns: Dict[str, list],
+    n_rows: int,
+    row_offset: int,
+) -> bytes:
+    """
+    Score one chunk of columns and serialize it as NDJSON.
+
+    Rows with missing or non-numeric required fields are reported with an
+    "error" key instead of being scored.
+
+    Args:
+        service: Prediction service used for scoring
+        columns: Column values keyed by field name (aliases already applied)
+        n_rows: Number of rows in the chunk
+        row_offset: Index of the first row within the whole upload
+
+    Returns:
+        NDJSON bytes, one line per input row
+    """
+    prepared = {}
+    for name in NUMERIC_FIELDS:
+        if name in columns:
+            prepared[name] = _float_column(columns[name])
+        else:
+            prepared[name] = np.full(n_rows, BULK_DEFAULTS.get(name, np.nan), dtype=np.float64)
+    for name in ("organ_type", "cause_of_death"):
+        raw = columns.get(name) or [None] * n_rows
+        prepared[name] = [value or BULK_DEFAULTS[name] for value in raw]
+
+    missing = np.column_stack([np.isnan(prepared[name]) for name in REQUIRED_FIELDS])
+    invalid = missing.any(axis=1)
+    # Position of each valid row within the scored (valid-only) batch
+    scored_index = np.cumsum(~invalid) - 1
+
+    batch = columns_to_batch(prepared)
+    if invalid.any():
+        batch = batch.take(np.flatnonzero(~invalid))
+    scored = service.score_batch(batch)
+
+    lines = []
+    for row in range(n_rows):
+        if invalid[row]:
+            bad = [REQUIRED_FIELDS[j] for j in np.flatnonzero(missing[row])]
+            record = {"row": row_offset + row, "error": f"Missing or non-numeric fields: {', '.join(bad)}"}
+        else:
+            record = _scored_record(scored, int(scored_index[row]), row_offset + row)
+        lines.append(json.dumps(record))
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _scored_record(scored: ScoredBatch, i: int, row: int) -> dict:
+    return {
+        "row": row,
+        "viability_score": int(scored.scores[i]),
+        "classification": str(scored.classifications[i]),
+        "confidence": float(scored.confidences[i]),
+        "risk_factors": scored.risk_factors(i),
+    }
+
+
+def score_upload(
+    service: IPredictionService,
+    upload: BinaryIO,
+    upload_format: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Score a spooled upload chunk by chunk, yielding NDJSON.
+
+    Args:
+        service: Prediction service used for scoring
+        upload: Spooled CSV or NDJSON body
+        upload_format: CSV or NDJSON
+        chunk_size: Rows parsed and scored per chunk
+
+    Yields:
+        NDJSON bytes for each scored chunk, in input order
+    """
+    row_offset = 0
+    try:
+        if upload_format == CSV:
+            chunks = iter_csv_chunks(upload, chunk_size)
+        else:
+            chunks = iter_ndjson_chunks(upload, chunk_size)
+        for columns, n_rows in chunks:
+            yield score_columns(service, columns, n_rows, row_offset)
+            row_offset += n_rows
+    finally:
+        upload.close()
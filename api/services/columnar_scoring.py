@@ -0,0 +1,573 @@
+"""
+Columnar bulk scoring of Arrow IPC and Parquet cohorts.
+Cohorts are read record batch by record batch (memory-mapped when read from a
+local file), numeric columns are taken straight from the Arrow buffers, and each
+batch is written back out with score, classification, risk and per-feature
+contribution columns appended - no CSV parsing or per-row objects on either side.
+"""
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from schemas.prediction import PredictionResponse
+from services import bulk_scoring
+from services.bulk_scoring import BULK_DEFAULTS, REQUIRED_FIELDS, SYNTHETIC_COLUMN_ALIASES
+from services.prediction_service import IPredictionService
+from services.scoring_kernel import (
+    NO_RISK_FACTORS,
+    NUMERIC_FIELDS,
+    FeatureBatch,
+    ScoredBatch,
+    factorize,
+    round_contributions,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ARROW_FILE = "arrow"
+ARROW_STREAM = "arrow-stream"
+PARQUET = "parquet"
+
+MEDIA_TYPES = {
+    "application/vnd.apache.arrow.file": ARROW_FILE,
+    "application/vnd.apache.arrow.stream": ARROW_STREAM,
+    "application/vnd.apache.parquet": PARQUET,
+    "application/x-parquet": PARQUET,
+}
+CONTENT_TYPES = {
+    ARROW_FILE: "application/vnd.apache.arrow.file",
+    ARROW_STREAM: "application/vnd.apache.arrow.stream",
+    PARQUET: "application/vnd.apache.parquet",
+}
+SUFFIXES = {
+    ".arrow": ARROW_FILE,
+    ".feather": ARROW_FILE,
+    ".ipc": ARROW_FILE,
+    ".arrows": ARROW_STREAM,
+    ".parquet": PARQUET,
+    ".pq": PARQUET,
+}
+
+DEFAULT_BATCH_ROWS = 1_000_000
+MAX_BATCH_ROWS = 5_000_000
+
+CONTRIBUTION_PREFIX = "contribution_"
+# Text columns read dictionary-encoded, so each distinct organ / cause is handled once
+CATEGORY_COLUMNS = ["organ_type", "cause_of_death"]
+OUTPUT_COLUMNS = ("viability_score", "classification", "confidence", "risk_factors", "error")
+
+Source = Union[str, bytes, BinaryIO]
+
+
+def _pyarrow():
+    # Only needed for columnar uploads - keeps pyarrow out of API startup
+    import pyarrow
+    return pyarrow
+
+
+def detect_format(content_type: str) -> str:
+    """
+    Resolve an upload Content-Type to a columnar format.
+
+    Raises:
+        ValueError: If the media type is not a supported columnar format
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in MEDIA_TYPES:
+        supported = ", ".join(sorted(MEDIA_TYPES))
+        raise ValueError(f"Unsupported media type '{media_type}'. Use one of: {supported}")
+    return MEDIA_TYPES[media_type]
+
+
+def format_for_path(path: str) -> str:
+    """
+    Infer a columnar format from a file extension.
+
+    Raises:
+        ValueError: If the extension is not recognised
+    """
+    suffix = path[path.rfind("."):].lower() if "." in path else ""
+    if suffix not in SUFFIXES:
+        raise ValueError(f"Cannot infer a columnar format from '{path}'. Use one of: {', '.join(sorted(SUFFIXES))}")
+    return SUFFIXES[suffix]
+
+
+def read_batches(source: Source, fmt: str, batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator["pa.RecordBatch"]:
+    """
+    Open an Arrow IPC or Parquet source and iterate over it in batches of at most batch_rows rows.
+
+    Local Arrow IPC files are memory-mapped and in-memory bodies read in place,
+    so their columns are read without copying. The file is opened eagerly, so
+    unreadable input fails here rather than part-way through a streamed response.
+
+    Args:
+        source: File path, request body bytes or binary file object
+        fmt: ARROW_FILE, ARROW_STREAM or PARQUET
+        batch_rows: Largest batch handed to the scorer
+
+    Returns:
+        Iterator over record batches in file order
+
+    Raises:
+        ValueError: If the source is not a readable file of that format
+    """
+    pa = _pyarrow()
+    if isinstance(source, bytes):
+        source = pa.BufferReader(source)
+    try:
+        if fmt == PARQUET:
+            import pyarrow.parquet as pq
+            metadata = pq.read_metadata(source)
+            if not isinstance(source, str):
+                source.seek(0)
+            # Category columns come back dictionary-encoded, as Parquet stores them
+            parquet_file = pq.ParquetFile(
+                source, metadata=metadata, memory_map=isinstance(source, str),
+                read_dictionary=[name for name in CATEGORY_COLUMNS if name in metadata.schema.names],
+            )
+            return parquet_file.iter_batches(batch_size=batch_rows)
+        if isinstance(source, str):
+            handle = pa.memory_map(source)
+        elif isinstance(source, pa.NativeFile):
+            handle = source
+        else:
+            handle = pa.PythonFile(source, mode="r")
+        reader = pa.ipc.open_file(handle) if fmt == ARROW_FILE else pa.ipc.open_stream(handle)
+    except pa.ArrowInvalid as exc:
+        raise ValueError(f"Not a readable {fmt} file: {exc}") from exc
+    return _ipc_batches(reader, fmt, batch_rows)
+
+
+def count_rows(path: str, fmt: str) -> Optional[int]:
+    """
+    Row count of a local Arrow file or Parquet file from its footer, without reading
+    the data; None for Arrow streams, which have no footer.
+
+    Raises:
+        ValueError: If the file is not a readable file of that format
+    """
+    pa = _pyarrow()
+    try:
+        if fmt == PARQUET:
+            import pyarrow.parquet as pq
+            return pq.read_metadata(path).num_rows
+        if fmt == ARROW_FILE:
+            with pa.memory_map(path) as handle:
+                reader = pa.ipc.open_file(handle)
+                return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        with pa.memory_map(path) as handle:
+            pa.ipc.open_stream(handle)
+        return None
+    except pa.ArrowInvalid as exc:
+        raise ValueError(f"Not a readable {fmt} file: {exc}") from exc
+
+
+def _ipc_batches(reader, fmt: str, batch_rows: int) -> Iterator["pa.RecordBatch"]:
+    if fmt == ARROW_FILE:
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        batches = reader
+    for record_batch in batches:
+        # Slicing is zero-copy; it only bounds the scoring working set
+        for start in range(0, record_batch.num_rows, batch_rows):
+            yield record_batch.slice(start, batch_rows)
+
+
+def record_batch_to_features(record_batch: "pa.RecordBatch") -> Tuple[FeatureBatch, np.ndarray]:
+    """
+    Build a FeatureBatch from an Arrow record batch.
+
+    Non-null float64 columns are viewed in place; other numeric types are cast
+    in Arrow with nulls becoming NaN. Organ types are dictionary-encoded by
+    Arrow and handed to the kernel already factorized. Missing optional columns
+    take the bulk-scoring defaults and synthetic-data column names are accepted.
+
+    Args:
+        record_batch: Cohort rows
+
+    Returns:
+        (FeatureBatch over every row, (n, len(REQUIRED_FIELDS)) missing-value mask)
+    """
+    n = record_batch.num_rows
+    columns = {
+        SYNTHETIC_COLUMN_ALIASES.get(name, name): record_batch.column(i)
+        for i, name in enumerate(record_batch.schema.names)
+    }
+
+    # Column-major, so each Arrow column lands in one contiguous copy
+    values = np.empty((n, len(NUMERIC_FIELDS)), dtype=np.float64, order="F")
+    for j, name in enumerate(NUMERIC_FIELDS):
+        if name in columns:
+            values[:, j] = _float_column(columns[name])
+        else:
+            values[:, j] = BULK_DEFAULTS.get(name, np.nan)
+    # Infinity is no more usable than a non-numeric value: both are missing
+    values[np.isinf(values)] = np.nan
+
+    organs, organ_codes = _category_column(columns.get("organ_type"), BULK_DEFAULTS["organ_type"], n)
+    causes, cause_codes = _category_column(columns.get("cause_of_death"), BULK_DEFAULTS["cause_of_death"], n)
+    batch = FeatureBatch(
+        values=values,
+        organ_types=np.array(organs, dtype=object)[organ_codes],
+        causes_of_death=np.array(causes, dtype=object)[cause_codes],
+        organ_codes=(organs, organ_codes),
+    )
+    missing = np.isnan(values[:, [NUMERIC_FIELDS.index(name) for name in REQUIRED_FIELDS]])
+    return batch, missing
+
+
+def _float_column(array: "pa.Array") -> np.ndarray:
+    pa = _pyarrow()
+    if array.type == pa.float64() and array.null_count == 0:
+        return array.to_numpy(zero_copy_only=True)
+    try:
+        return array.cast(pa.float64(), safe=False).to_numpy(zero_copy_only=False)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # Text columns with stray non-numeric values: those rows become missing
+        return bulk_scoring._float_column(array.to_pylist())
+
+
+def _category_column(array: Optional["pa.Array"], default: str, n: int) -> Tuple[list, np.ndarray]:
+    """Distinct values of a text column (empty or null -> default) and each row's index."""
+    if array is None:
+        return [default], np.zeros(n, dtype=np.intp)
+    pa = _pyarrow()
+    import pyarrow.compute as pc
+    # Dictionary columns (pandas categoricals, Parquet dictionary pages) are used as-is
+    encoded = array if pa.types.is_dictionary(array.type) else pc.dictionary_encode(array)
+    distinct = [default if value in (None, "") else str(value) for value in encoded.dictionary.to_pylist()]
+    distinct.append(default)  # code for null rows
+    codes = encoded.indices.fill_null(len(distinct) - 1).to_numpy(zero_copy_only=False)
+    return distinct, codes.astype(np.intp)
+
+
+def scorable_features(record_batch: "pa.RecordBatch") -> Tuple[FeatureBatch, np.ndarray, np.ndarray]:
+    """
+    Features of the rows of a record batch that can be scored.
+
+    Args:
+        record_batch: Cohort rows
+
+    Returns:
+        (FeatureBatch of the rows with every required field, (n, len(REQUIRED_FIELDS))
+        missing-value mask over all rows, indices of the scorable rows)
+    """
+    batch, missing = record_batch_to_features(record_batch)
+    invalid = missing.any(axis=1)
+    valid_rows = np.flatnonzero(~invalid)
+    return (batch.take(valid_rows) if invalid.any() else batch), missing, valid_rows
+
+
+def result_columns(scored: ScoredBatch, missing: np.ndarray, valid_rows: np.ndarray,
+                   explain: bool = True) -> Dict[str, "pa.Array"]:
+    """
+    Result columns for every row of a record batch, from the scores of its scorable rows.
+
+    Rows with missing or non-numeric required fields get null results and an
+    "error" message. Contributions are rounded as in the JSON responses.
+
+    Args:
+        scored: service.score_batch() of scorable_features()
+        missing: Missing-value mask from scorable_features()
+        valid_rows: Scorable row indices from scorable_features()
+        explain: Include one contribution column per feature
+
+    Returns:
+        Column name -> array, in output order
+    """
+    pa = _pyarrow()
+    invalid = missing.any(axis=1)
+
+    def scatter(values: np.ndarray, fill) -> np.ndarray:
+        if not invalid.any():
+            return values
+        full = np.full((len(invalid),) + values.shape[1:], fill, dtype=values.dtype)
+        full[valid_rows] = values
+        return full
+
+    mask = invalid if invalid.any() else None
+    results = {
+        "viability_score": pa.array(scatter(scored.scores, 0), mask=mask),
+        "classification": _label_array(scored.classifications, scatter, mask),
+        "confidence": pa.array(scatter(scored.confidences, np.nan), mask=mask),
+        "risk_factors": _risk_factor_array(scored, valid_rows, len(invalid)),
+        "error": _error_array(missing),
+    }
+    if explain and scored.contributions is not None:
+        contributions = scatter(round_contributions(scored.contributions), np.nan)
+        for j, name in enumerate(scored.contribution_names):
+            results[CONTRIBUTION_PREFIX + name] = pa.array(contributions[:, j], mask=mask)
+    return results
+
+
+def score_record_batch(
+    service: IPredictionService,
+    record_batch: "pa.RecordBatch",
+    explain: bool = True,
+) -> "pa.RecordBatch":
+    """
+    Score one record batch and append the results as columns.
+
+    Args:
+        service: Prediction service used for scoring
+        record_batch: Cohort rows
+        explain: Append one contribution column per feature
+
+    Returns:
+        The input columns (minus any stale result columns) followed by result_columns()
+    """
+    pa = _pyarrow()
+    batch, missing, valid_rows = scorable_features(record_batch)
+    results = result_columns(service.score_batch(batch, explain=explain), missing, valid_rows, explain)
+    kept = [name for name in record_batch.schema.names
+            if name not in OUTPUT_COLUMNS and not name.startswith(CONTRIBUTION_PREFIX)]
+    return pa.RecordBatch.from_arrays(
+        [record_batch.column(name) for name in kept] + list(results.values()),
+        names=kept + list(results),
+    )
+
+
+def results_batch(scored: ScoredBatch, missing: np.ndarray, valid_rows: np.ndarray,
+                  explain: bool = True) -> "pa.RecordBatch":
+    """result_columns() alone, without the input columns, as a record batch."""
+    pa = _pyarrow()
+    results = result_columns(scored, missing, valid_rows, explain)
+    return pa.RecordBatch.from_arrays(list(results.values()), names=list(results))
+
+
+def predictions_to_record_batch(predictions: Sequence[PredictionResponse]) -> "pa.RecordBatch":
+    """
+    Prediction responses as a record batch laid out like results_batch().
+    Contributions keep the rounding of the JSON responses; features a
+    prediction has no contribution for are null.
+    """
+    pa = _pyarrow()
+    names = list(dict.fromkeys(name for prediction in predictions for name in prediction.feature_contributions))
+    columns = {
+        "viability_score": pa.array([prediction.viability_score for prediction in predictions], type=pa.int64()),
+        "classification": pa.array([prediction.classification for prediction in predictions], type=pa.string()),
+        "confidence": pa.array([prediction.confidence for prediction in predictions], type=pa.float64()),
+        "risk_factors": pa.array(
+            [prediction.risk_factors for prediction in predictions], type=pa.list_(pa.string())
+        ),
+        "error": pa.nulls(len(predictions), type=pa.string()),
+    }
+    for name in names:
+        columns[CONTRIBUTION_PREFIX + name] = pa.array(
+            [prediction.feature_contributions.get(name) for prediction in predictions], type=pa.float64()
+        )
+    return pa.RecordBatch.from_arrays(list(columns.values()), names=list(columns))
+
+
+def _label_array(labels: np.ndarray, scatter, mask: Optional[np.ndarray]) -> "pa.Array":
+    """String array of class labels, converting each distinct label once."""
+    pa = _pyarrow()
+    distinct, codes = factorize(labels)
+    return pa.DictionaryArray.from_arrays(
+        pa.array(scatter(codes.astype(np.int32), 0), mask=mask),
+        pa.array([str(label) for label in distinct], type=pa.string()),
+    ).dictionary_decode()
+
+
+def _risk_factor_array(scored: ScoredBatch, valid_rows: np.ndarray, n: int) -> "pa.Array":
+    """
+    list<string> of each row's flagged labels, built from the flag masks without per-row Python.
+    """
+    pa = _pyarrow()
+    flags = scored.risk_flags
+    n_rules = flags.masks.shape[1]
+    # Flat label table: (organ row, rule) -> label, plus the no-risk message
+    table = np.append(flags.labels.ravel(), NO_RISK_FACTORS)
+    flagged = np.column_stack([flags.masks, ~flags.masks.any(axis=1)])
+    rows, rules = np.nonzero(flagged)
+    codes = np.where(rules == n_rules, len(table) - 1, flags.label_rows[rows] * n_rules + rules)
+
+    counts = np.zeros(n, dtype=np.int64)
+    counts[valid_rows] = flagged.sum(axis=1)
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int32)
+    labels = pa.DictionaryArray.from_arrays(
+        pa.array(codes.astype(np.int32)), pa.array(table.tolist(), type=pa.string())
+    ).dictionary_decode()
+    null_rows = None
+    if len(valid_rows) < n:
+        null_rows = np.ones(n, dtype=bool)
+        null_rows[valid_rows] = False
+    return pa.ListArray.from_arrays(
+        pa.array(offsets), labels, mask=None if null_rows is None else pa.array(null_rows)
+    )
+
+
+def missing_fields_error(missing_row: np.ndarray) -> str:
+    """The "error" value of a row, from its row of the missing-value mask."""
+    return "Missing or non-numeric fields: " + ", ".join(np.array(REQUIRED_FIELDS)[missing_row])
+
+
+def _error_array(missing: np.ndarray) -> "pa.Array":
+    """Null for scored rows; the missing required fields for rejected rows."""
+    pa = _pyarrow()
+    errors = np.full(len(missing), None, dtype=object)
+    invalid = np.flatnonzero(missing.any(axis=1))
+    if len(invalid):
+        # Rows share a handful of distinct patterns - build each message once
+        patterns, inverse = np.unique(missing[invalid], axis=0, return_inverse=True)
+        messages = np.array([missing_fields_error(pattern) for pattern in patterns], dtype=object)
+        errors[invalid] = messages[inverse.ravel()]
+    return pa.array(errors, type=pa.string())
+
+
+def score_batches(
+    service: IPredictionService,
+    batches: Iterator["pa.RecordBatch"],
+    explain: bool = True,
+) -> Iterator["pa.RecordBatch"]:
+    """Score record batches lazily, one output batch per input batch."""
+    for record_batch in batches:
+        if record_batch.num_rows:
+            yield score_record_batch(service, record_batch, explain=explain)
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to the caller in chunks."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _open_writer(sink, fmt: str, schema: "pa.Schema"):
+    pa = _pyarrow()
+    if fmt == PARQUET:
+        import pyarrow.parquet as pq
+        # Dictionary pages only pay off for the text columns; float columns would just be re-encoded
+        text_columns = [field.name for field in schema if not pa.types.is_floating(field.type)
+                        and not pa.types.is_integer(field.type)]
+        return pq.ParquetWriter(sink, schema, use_dictionary=text_columns)
+    if fmt == ARROW_FILE:
+        return pa.ipc.new_file(sink, schema)
+    return pa.ipc.new_stream(sink, schema)
+
+
+def write_batches(sink: Source, fmt: str, batches: Iterator["pa.RecordBatch"]) -> int:
+    """
+    Write record batches to a path or file object as Arrow IPC or Parquet.
+
+    Returns:
+        Number of rows written
+    """
+    writer, rows = None, 0
+    try:
+        for record_batch in batches:
+            if writer is None:
+                writer = _open_writer(sink, fmt, record_batch.schema)
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def iter_encoded(fmt: str, batches: Iterator["pa.RecordBatch"]) -> Iterator[bytes]:
+    """
+    Encode record batches as Arrow IPC or Parquet bytes, yielding as each batch is written.
+
+    Peak memory is one batch, so scored cohorts can be streamed back over HTTP.
+    """
+    pa = _pyarrow()
+    sink = _ChunkSink()
+    stream = pa.PythonFile(sink, mode="w")
+    writer = None
+    try:
+        for record_batch in batches:
+            if writer is None:
+                writer = _open_writer(stream, fmt, record_batch.schema)
+            writer.write_batch(record_batch)
+            yield sink.drain()
+        if writer is not None:
+            writer.close()
+            writer = None
+        yield sink.drain()
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def score_upload(
+    service: IPredictionService,
+    upload: BinaryIO,
+    batches: Iterator["pa.RecordBatch"],
+    fmt: str,
+    explain: bool = True,
+) -> Iterator[bytes]:
+    """
+    Score a spooled columnar upload and yield the scored cohort in the same format.
+
+    Args:
+        service: Prediction service used for scoring
+        upload: Spooled Arrow IPC or Parquet body, closed once scored
+        batches: read_batches() over the upload
+        fmt: ARROW_FILE, ARROW_STREAM or PARQUET
+        explain: Append per-feature contribution columns
+
+    Yields:
+        Encoded output, batch by batch
+    """
+    try:
+        yield from iter_encoded(fmt, score_batches(service, batches, explain))
+    finally:
+        upload.close()
+
+
+def score_file(
+    service: IPredictionService,
+    source: str,
+    destination: str,
+    source_format: Optional[str] = None,
+    destination_format: Optional[str] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    explain: bool = True,
+) -> int:
+    """
+    Score a cohort file into a new columnar file.
+
+    Args:
+        service: Prediction service used for scoring
+        source: Input .arrow/.feather/.arrows/.parquet path
+        destination: Output path
+        source_format: Input format; inferred from the extension by default
+        destination_format: Output format; inferred from the extension by default
+        batch_rows: Rows scored per pass
+        explain: Append per-feature contribution columns
+
+    Returns:
+        Number of rows written
+    """
+    source_format = source_format or format_for_path(source)
+    destination_format = destination_format or format_for_path(destination)
+    batches = score_batches(service, read_batches(source, source_format, batch_rows), explain)
+    return write_batches(destination, destination_format, batches)
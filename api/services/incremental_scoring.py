@@ -0,0 +1,181 @@
+"""
+Incremental scoring for live assessments.
+A session keeps one assessment's weighted-sum terms and risk-rule flags between
+updates, so a partial update (say cold_ischemia_hours and resistive_index during
+machine perfusion) recomputes only the terms and rules reading the changed fields.
+Single rows are handled with Python scalars: at one row and a dozen terms, NumPy
+call overhead costs more than the arithmetic.
+"""
+import math
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from schemas.prediction import PredictionRequest, PredictionResponse
+from services.prediction_cache import CachedPredictionService
+from services.prediction_service import PredictionService
+from services.risk_rules import RiskRuleSet
+from services.scoring_kernel import CLASSIFICATION_LABELS, COLUMN_INDEX, NUMERIC_FIELDS, round_contributions
+
+UPDATABLE_FIELDS = frozenset(PredictionRequest.model_fields)
+
+
+def merge_update(request: PredictionRequest, fields: Mapping[str, Any]) -> Tuple[PredictionRequest, List[str]]:
+    """
+    Apply a partial update to an assessment.
+
+    Args:
+        request: Current assessment
+        fields: Subset of PredictionRequest fields with their new values
+
+    Returns:
+        (validated merged assessment, names of the fields whose value changed)
+
+    Raises:
+        ValueError: If fields names an unknown field, or (as pydantic.ValidationError)
+            if the merged assessment fails validation
+    """
+    unknown = sorted(set(fields) - UPDATABLE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown assessment fields: {', '.join(unknown)}")
+    merged = PredictionRequest.model_validate({**request.model_dump(), **fields})
+    changed = [name for name in fields if getattr(merged, name) != getattr(request, name)]
+    return merged, changed
+
+
+def _value(request: PredictionRequest, name: str) -> float:
+    value = getattr(request, name)
+    return math.nan if value is None else float(value)
+
+
+def _positions_by_field(columns: np.ndarray) -> Dict[str, List[int]]:
+    """Positions reading each numeric field, for a (k,) array of source columns."""
+    positions: Dict[str, List[int]] = {name: [] for name in NUMERIC_FIELDS}
+    for position, column in enumerate(columns.tolist()):
+        positions[NUMERIC_FIELDS[column]].append(position)
+    return positions
+
+
+class ScoringSession:
+    """
+    Running weighted sum for one assessment under the rule-based engine.
+
+    Each scaled feature's term (weight x clipped normalized value) and each risk
+    rule's flag is kept between updates; an update recomputes the terms and
+    rules whose source field changed, then re-adds the k terms with math.fsum,
+    so no rounding drift accumulates however long the session runs. Scores,
+    classes, risk factors and contributions match PredictionService.predict on
+    the merged assessment. Changing organ_type switches plans and restarts the
+    session; a reloaded risk rule file is re-evaluated in full.
+
+    Args:
+        service: Rule-based prediction service providing plans, rules and confidence
+        request: Initial, complete assessment
+    """
+    def __init__(self, service: PredictionService, request: PredictionRequest):
+        self.service = service
+        self.updates = 0
+        self._start(request)
+
+    def _start(self, request: PredictionRequest) -> None:
+        plan = self.service.scoring_plans.plan_for(request.organ_type)
+        self.request = request
+        self.plan = plan
+        self.values = [_value(request, name) for name in NUMERIC_FIELDS]
+        self._columns = plan.columns.tolist()
+        self._scale = plan.scale.tolist()
+        self._offset = plan.offset.tolist()
+        self._fill = plan.fill_values.tolist()
+        self._coefficients = plan.coefficients.tolist()
+        self._term_bias = plan.term_bias.tolist()
+        self._term_index = plan.term_index.tolist()
+        self._marginal, self._accept = plan.thresholds.tolist()
+        self._terms_by_field = _positions_by_field(plan.columns)
+        self._weighted = [0.0] * len(self._columns)
+        self._contributions = plan.constant_terms.tolist()
+        self._update_terms(range(len(self._columns)))
+        self._rules: Optional[RiskRuleSet] = None
+        self._flags: List[bool] = []
+
+    def _update_terms(self, terms) -> None:
+        # Same operations, in the same order, as ScoringPlan.normalize / explain
+        for j in terms:
+            x = self.values[self._columns[j]]
+            if x != x:
+                x = self._fill[j]
+            clipped = min(max(x * self._scale[j] + self._offset[j], 0.0), 1.0)
+            self._weighted[j] = clipped * self._coefficients[j]
+            self._contributions[self._term_index[j]] = self._weighted[j] + self._term_bias[j]
+
+    def _risk_factors(self, changed: List[str]) -> List[str]:
+        rules = self.service.risk_rules.current()
+        organ_type = self.request.organ_type
+        if rules is not self._rules:
+            self._rules = rules
+            self._rules_by_field = _positions_by_field(rules.columns)
+            self._flags = rules.row_flags(self.values, organ_type, range(len(rules.rule_ids)))
+        else:
+            for name in changed:
+                positions = self._rules_by_field.get(name, ())
+                for j, fired in zip(positions, rules.row_flags(self.values, organ_type, positions)):
+                    self._flags[j] = fired
+        return rules.row_factors(self._flags, organ_type)
+
+    def prediction(self, changed: Optional[List[str]] = None) -> PredictionResponse:
+        """
+        Score, classification, risk factors and contributions of the current assessment.
+
+        Args:
+            changed: Fields changed since the last call, whose risk rules need re-checking
+        """
+        raw = math.fsum(self._weighted) + self.plan.intercept
+        # As scoring_kernel.to_scores: rounding first makes the score independent of summation order
+        score = math.floor(round(raw * 100, 9))
+        classification = CLASSIFICATION_LABELS[(score >= self._marginal) + (score >= self._accept)]
+        return PredictionResponse(
+            viability_score=score,
+            classification=str(classification),
+            confidence=self.service.confidence,
+            risk_factors=self._risk_factors(changed or []),
+            feature_contributions=dict(zip(self.plan.feature_names, round_contributions(self._contributions).tolist())),
+        )
+
+    def update(self, fields: Mapping[str, Any]) -> Tuple[PredictionResponse, List[str]]:
+        """
+        Apply a partial update and rescore.
+
+        Args:
+            fields: Subset of PredictionRequest fields with their new values
+
+        Returns:
+            (prediction for the merged assessment, names of the fields whose value changed)
+
+        Raises:
+            ValueError: If the update names an unknown field or fails validation;
+                the session is left unchanged
+        """
+        request, changed = merge_update(self.request, fields)
+        self.updates += 1
+        if "organ_type" in changed:
+            self._start(request)
+            return self.prediction(), changed
+
+        self.request = request
+        for name in changed:
+            if name in COLUMN_INDEX:
+                self.values[COLUMN_INDEX[name]] = _value(request, name)
+                self._update_terms(self._terms_by_field[name])
+        return self.prediction(changed), changed
+
+
+def open_session(service: Any, request: PredictionRequest) -> Optional[ScoringSession]:
+    """
+    Incremental session for the rule-based engine, or None for engines without a
+    decomposable weighted sum (callers rescore merged assessments in full instead).
+    """
+    if isinstance(service, CachedPredictionService):
+        # Each update is a new assessment, so the response cache would only miss
+        service = service.inner
+    if isinstance(service, PredictionService):
+        return ScoringSession(service, request)
+    return None
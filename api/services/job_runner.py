@@ -0,0 +1,420 @@
+"""
+Background execution of bulk scoring jobs.
+The API process accepts a cohort upload, spools it to the job directory and
+queues it in the job store; a JobRunner claims queued jobs and runs each one on
+its own small pool of worker processes, separate from the interactive scoring
+executor. Workers run at lower CPU priority and there are at most `workers` jobs
+running at once - across every API process sharing the store, since claims
+check the store's running count - so a large job cannot starve /predict traffic.
+
+Workers score the cohort with the same vectorized columnar path as
+/predict/columnar, file to file, reporting progress to the store after every
+batch and on a heartbeat timer, and stopping at the end of a batch if the job
+is cancelled or its claim has been given to another attempt.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from metrics.registry import REGISTRY, Counter, Gauge
+from services import columnar_scoring
+from services.assessment_store import utc_now
+from services.job_store import (
+    CANCELLED,
+    DEFAULT_STALE_SECONDS,
+    FAILED,
+    INTERRUPT,
+    LOST,
+    QUEUED,
+    SUCCEEDED,
+    IJobStore,
+    JobRecord,
+    SQLiteJobStore,
+    new_job_id,
+)
+from services.prediction_service import IPredictionService
+
+JOB_DIR_ENV = "ULTRAVIAB_JOB_DIR"
+JOB_WORKERS_ENV = "ULTRAVIAB_JOB_WORKERS"
+JOB_MAX_QUEUED_ENV = "ULTRAVIAB_JOB_MAX_QUEUED"
+JOB_NICE_ENV = "ULTRAVIAB_JOB_NICE"
+DEFAULT_JOB_DIR = Path(__file__).resolve().parent.parent / "data" / "jobs"
+DEFAULT_JOB_WORKERS = 1
+DEFAULT_MAX_QUEUED_JOBS = 100
+DEFAULT_JOB_NICE = 10
+# Progress is reported (and cancellation checked) once per batch
+DEFAULT_JOB_BATCH_ROWS = 250_000
+# Workers also report on a timer, at this fraction of the stale timeout, so slow batches keep their claim
+HEARTBEATS_PER_STALE_TIMEOUT = 4
+DEFAULT_HEARTBEAT_SECONDS = DEFAULT_STALE_SECONDS / HEARTBEATS_PER_STALE_TIMEOUT
+DEFAULT_POLL_SECONDS = 1.0
+# Uploads are written to the job directory in pieces of about this size
+SPOOL_WRITE_BYTES = 1024 * 1024
+# How long shutdown waits for interrupted jobs to reach the end of their batch
+SHUTDOWN_GRACE_SECONDS = 30.0
+
+logger = logging.getLogger(__name__)
+
+JOBS_FINISHED = REGISTRY.register(Counter(
+    "ultraviab_jobs_finished_total", "Bulk scoring jobs finished, by final status.", ["status"]
+))
+JOBS_RUNNING = REGISTRY.register(Gauge(
+    "ultraviab_jobs_running", "Bulk scoring jobs running on this process's job workers."
+))
+JOB_ROWS = REGISTRY.register(Counter(
+    "ultraviab_job_rows_scored_total", "Rows scored by finished bulk scoring jobs."
+))
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the queue already holds the maximum number of waiting jobs."""
+
+
+class JobStopped(Exception):
+    """Raised inside a worker when its job was cancelled or interrupted."""
+
+    def __init__(self, reason: int):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def run_job(store: IJobStore, service: IPredictionService, job_id: str, attempt: int,
+            heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS) -> str:
+    """
+    Score a claimed job's input file into its output file.
+
+    Progress is reported after every batch and, from a background thread,
+    every heartbeat_seconds, so a batch slower than the store's stale timeout
+    does not get the job requeued under its worker. Every report is checked
+    against the claim: once the job is cancelled, interrupted or no longer
+    this attempt's, the worker stops at the end of its batch.
+
+    The output is written to a ".partial" file of this attempt and renamed
+    once complete, so a result file only ever exists for a succeeded job.
+
+    Args:
+        store: Job store the progress is reported to
+        service: Prediction service used for scoring
+        job_id: A job in the running state
+        attempt: The job's attempt count when it was claimed
+        heartbeat_seconds: Interval of the progress reports between batches
+
+    Returns:
+        The job's final status (QUEUED if it was interrupted and requeued, or
+        is no longer this worker's)
+    """
+    job = store.get(job_id)
+    if job is None:
+        return QUEUED
+    partial = f"{job.output_path}.{attempt}.partial"
+    started = time.perf_counter()
+    rows = 0
+    stop = 0
+
+    def report() -> int:
+        nonlocal stop
+        if not stop:
+            stop = store.report_progress(job_id, attempt, rows, time.perf_counter() - started)
+        return stop
+
+    def reported(batches):
+        nonlocal rows
+        for record_batch in batches:
+            yield record_batch
+            rows += record_batch.num_rows
+            if report():
+                raise JobStopped(stop)
+
+    done = threading.Event()
+
+    def heartbeat() -> None:
+        while not done.wait(heartbeat_seconds) and not report():
+            pass
+
+    threading.Thread(target=heartbeat, name=f"job-heartbeat-{job_id}", daemon=True).start()
+    try:
+        batches = columnar_scoring.read_batches(job.input_path, job.format, job.batch_rows)
+        columnar_scoring.write_batches(
+            partial, job.format, reported(columnar_scoring.score_batches(service, batches, job.explain))
+        )
+        if report():
+            raise JobStopped(stop)
+        os.replace(partial, job.output_path)
+    except JobStopped as exc:
+        _remove(partial)
+        if exc.reason == LOST:
+            logger.warning("Job %s attempt %d was taken over; stopping", job_id, attempt)
+            return QUEUED
+        if exc.reason == INTERRUPT:
+            store.requeue(job_id, attempt)
+            return QUEUED
+        store.finish(job_id, attempt, CANCELLED)
+        return CANCELLED
+    except Exception as exc:
+        # Any failure belongs to the job, not the worker: record it and stay available
+        _remove(partial)
+        logger.exception("Job %s failed", job_id)
+        store.finish(job_id, attempt, FAILED, error=str(exc) or type(exc).__name__)
+        return FAILED
+    finally:
+        done.set()
+    if not store.finish(job_id, attempt, SUCCEEDED, output_bytes=os.path.getsize(job.output_path)):
+        return QUEUED
+    return SUCCEEDED
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _spool(body: AsyncIterator[bytes], path: str) -> None:
+    """Write an upload to path, gathering its chunks into SPOOL_WRITE_BYTES writes made on a worker thread."""
+    spool = await asyncio.to_thread(open, path, "wb")
+    try:
+        pending: List[bytes] = []
+        pending_bytes = 0
+        async for chunk in body:
+            pending.append(chunk)
+            pending_bytes += len(chunk)
+            if pending_bytes >= SPOOL_WRITE_BYTES:
+                await asyncio.to_thread(spool.writelines, pending)
+                pending, pending_bytes = [], 0
+        await asyncio.to_thread(spool.writelines, pending)
+    finally:
+        await asyncio.to_thread(spool.close)
+
+
+# Store and service used inside job worker processes (the service inherited warm through fork)
+_worker_store: Optional[IJobStore] = None
+_worker_service: Optional[IPredictionService] = None
+_worker_heartbeat_seconds = DEFAULT_HEARTBEAT_SECONDS
+
+
+def _init_worker(store_path: str, service_factory: Callable[[], IPredictionService], nice: int,
+                 heartbeat_seconds: float) -> None:
+    global _worker_store, _worker_service, _worker_heartbeat_seconds
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+    # SQLite connections must not cross fork, so each worker opens its own
+    _worker_store = SQLiteJobStore(store_path)
+    _worker_service = service_factory()
+    _worker_heartbeat_seconds = heartbeat_seconds
+
+
+def _worker_run_job(job_id: str, attempt: int) -> str:
+    return run_job(_worker_store, _worker_service, job_id, attempt, _worker_heartbeat_seconds)
+
+
+class JobRunner:
+    """
+    Accepts bulk scoring jobs and runs them on a dedicated worker pool.
+
+    Args:
+        store: Job store, shared with the worker processes through store_path
+        store_path: Database path the workers open
+        service_factory: Module-level callable building the prediction service in workers
+        job_dir: Directory holding each job's input and output files
+        workers: Job worker processes, and the most jobs running at once across all processes sharing the store
+        max_queued: Jobs allowed to wait before submissions are rejected
+        nice: CPU niceness increment applied to the workers
+        poll_seconds: How often the store is checked for work queued by other processes
+        stale_seconds: Silence after which another process's running job is requeued
+    """
+    def __init__(
+        self,
+        store: IJobStore,
+        store_path: str,
+        service_factory: Callable[[], IPredictionService],
+        job_dir: str = str(DEFAULT_JOB_DIR),
+        workers: int = DEFAULT_JOB_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED_JOBS,
+        nice: int = DEFAULT_JOB_NICE,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+    ):
+        self.store = store
+        self.store_path = store_path
+        self.service_factory = service_factory
+        self.job_dir = Path(job_dir)
+        self.workers = max(workers, 1)
+        self.max_queued = max_queued
+        self.nice = nice
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self._pool: Optional[Executor] = None
+        self._active: Dict[str, asyncio.Future] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, body: AsyncIterator[bytes], fmt: str, batch_rows: int = DEFAULT_JOB_BATCH_ROWS,
+                     explain: bool = True) -> JobRecord:
+        """
+        Spool an uploaded cohort to the job directory and queue it.
+
+        Args:
+            body: Request body chunks (Arrow file, Arrow stream or Parquet)
+            fmt: ARROW_FILE, ARROW_STREAM or PARQUET
+            batch_rows: Rows scored per pass; progress is reported per pass
+            explain: Append per-feature contribution columns
+
+        Returns:
+            The queued job
+
+        Raises:
+            JobQueueFullError: If max_queued jobs are already waiting
+            ValueError: If the upload is not a readable, non-empty file of that format
+        """
+        # File and store I/O runs on worker threads, keeping the event loop free for other requests
+        if await asyncio.to_thread(self.store.count, QUEUED) >= self.max_queued:
+            raise JobQueueFullError(f"Job queue is full ({self.max_queued} waiting)")
+
+        job_id = new_job_id()
+        directory = self.job_dir / job_id
+        await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+        suffix = {columnar_scoring.ARROW_FILE: ".arrow", columnar_scoring.ARROW_STREAM: ".arrows"}.get(fmt, ".parquet")
+        input_path = str(directory / f"input{suffix}")
+        try:
+            await _spool(body, input_path)
+            rows_total = await asyncio.to_thread(columnar_scoring.count_rows, input_path, fmt)
+            if rows_total == 0:
+                raise ValueError("The cohort has no rows")
+        except BaseException:
+            self._remove_files(directory)
+            raise
+
+        job = JobRecord(
+            id=job_id, status=QUEUED, created_at=utc_now(), input_path=input_path,
+            output_path=str(directory / f"output{suffix}"), format=fmt, batch_rows=batch_rows,
+            explain=explain, rows_total=rows_total,
+        )
+        await asyncio.to_thread(self.store.submit, job)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[JobRecord]:
+        """Cancel a queued job, or stop a running one at the end of its current batch."""
+        return self.store.cancel(job_id)
+
+    def delete(self, job_id: str) -> bool:
+        """Remove a finished job and its files."""
+        job = self.store.get(job_id)
+        if job is None or job.active:
+            return False
+        self._remove_files(Path(job.input_path).parent)
+        return self.store.delete(job_id)
+
+    def start(self) -> None:
+        """Fork the job workers and start claiming jobs on the running event loop."""
+        if self._task is not None:
+            return
+        self._pool = self._new_pool()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop claiming jobs and return running ones to the queue; they restart
+        from the beginning when the API next starts.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for job_id in list(self._active):
+            self.store.interrupt(job_id)
+        if self._active:
+            await asyncio.wait(list(self._active.values()), timeout=SHUTDOWN_GRACE_SECONDS)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._wakeup = None
+
+    @property
+    def running(self) -> int:
+        return len(self._active)
+
+    def _new_pool(self) -> Executor:
+        # fork shares the already-loaded service/model copy-on-write with workers
+        context = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        pool = ProcessPoolExecutor(
+            self.workers, mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.store_path, self.service_factory, self.nice,
+                      self.stale_seconds / HEARTBEATS_PER_STALE_TIMEOUT),
+        )
+        # Fork every worker now, before the server starts its threads
+        for _ in range(self.workers):
+            pool.submit(os.getpid).result()
+        return pool
+
+    async def _run(self) -> None:
+        while True:
+            # Jobs left running by a process that died (this one included, before a restart)
+            await asyncio.to_thread(self.store.requeue_stale, self.stale_seconds)
+            while len(self._active) < self.workers:
+                job = await asyncio.to_thread(self.store.claim, self.workers)
+                if job is None:
+                    break
+                self._launch(job)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _launch(self, job: JobRecord) -> None:
+        pool = self._pool
+        future = asyncio.get_running_loop().run_in_executor(pool, _worker_run_job, job.id, job.attempts)
+        self._active[job.id] = future
+        JOBS_RUNNING.inc()
+        future.add_done_callback(lambda done: self._finished(job.id, job.attempts, pool, done))
+
+    def _finished(self, job_id: str, attempt: int, pool: Executor, future: asyncio.Future) -> None:
+        # A newer attempt of the same job may be running here already
+        if self._active.get(job_id) is future:
+            del self._active[job_id]
+        JOBS_RUNNING.dec()
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None:
+            status = future.result()
+        else:
+            # The worker process died (e.g. out of memory) - fail the job and replace the pool
+            logger.error("Job %s lost its worker: %r", job_id, exc)
+            status = FAILED
+            self.store.finish(job_id, attempt, FAILED, error="Job worker exited unexpectedly")
+            # Every job on a broken pool fails together; only the first replaces it
+            if isinstance(exc, BrokenProcessPool) and self._task is not None and pool is self._pool:
+                self._pool = self._new_pool()
+        if status != QUEUED:
+            JOBS_FINISHED.inc(status=status)
+        if status == SUCCEEDED:
+            job = self.store.get(job_id)
+            if job is not None:
+                JOB_ROWS.inc(job.rows_done)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    @staticmethod
+    def _remove_files(directory: Path) -> None:
+        for path in directory.glob("*"):
+            path.unlink(missing_ok=True)
+        try:
+            directory.rmdir()
+        except OSError:
+            pass
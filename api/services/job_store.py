@@ -0,0 +1,314 @@
+"""
+Durable queue of bulk scoring jobs.
+Jobs, their state and progress live in SQLite, so queued work survives restarts
+and any process (the API or a job worker) can claim, update or cancel a job
+without a message broker. Claiming is a single UPDATE ... RETURNING, so two
+runners never pick up the same job.
+"""
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from services.assessment_store import utc_now
+
+JOB_DB_ENV = "ULTRAVIAB_JOB_DB"
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+STATUSES = (QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED)
+
+# cancel_requested values: the user cancelled the job, or the API is shutting down
+# and the job should stop and go back to the queue
+CANCEL = 1
+INTERRUPT = 2
+# report_progress() result when the job is no longer the caller's claim: it was
+# requeued as stale (and possibly claimed again), finished or deleted
+LOST = 3
+
+DEFAULT_JOB_LIMIT = 100
+MAX_JOB_LIMIT = 1000
+# A running job whose worker has not reported for this long is assumed lost and requeued
+DEFAULT_STALE_SECONDS = 120.0
+MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    heartbeat REAL,
+    input_path TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    format TEXT NOT NULL,
+    batch_rows INTEGER NOT NULL,
+    explain INTEGER NOT NULL,
+    rows_total INTEGER,
+    rows_done INTEGER NOT NULL DEFAULT 0,
+    run_seconds REAL NOT NULL DEFAULT 0,
+    output_bytes INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created_at_idx ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_created_at_idx ON jobs (created_at);
+"""
+
+_COLUMNS = (
+    "id", "status", "created_at", "started_at", "finished_at", "heartbeat",
+    "input_path", "output_path", "format", "batch_rows", "explain", "rows_total",
+    "rows_done", "run_seconds", "output_bytes", "attempts", "cancel_requested", "error",
+)
+
+
+def new_job_id() -> str:
+    return uuid.uuid4().hex
+
+
+@dataclass
+class JobRecord:
+    """One bulk scoring job and its progress."""
+    id: str
+    status: str
+    created_at: str
+    input_path: str
+    output_path: str
+    format: str
+    batch_rows: int
+    explain: bool
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    heartbeat: Optional[float] = None
+    rows_total: Optional[int] = None
+    rows_done: int = 0
+    run_seconds: float = 0.0
+    output_bytes: Optional[int] = None
+    attempts: int = 0
+    cancel_requested: int = 0
+    error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        return self.rows_done / self.run_seconds if self.run_seconds > 0 else None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "JobRecord":
+        record = cls(**dict(zip(_COLUMNS, row)))
+        record.explain = bool(record.explain)
+        return record
+
+
+class IJobStore(ABC):
+    """
+    Interface for the job queue.
+    Follows Dependency Inversion Principle - runners and controllers depend on this abstraction.
+    """
+
+    @abstractmethod
+    def submit(self, job: JobRecord) -> None:
+        """Enqueue a new job."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        pass
+
+    @abstractmethod
+    def list(self, status: Optional[str] = None, limit: int = DEFAULT_JOB_LIMIT) -> List[JobRecord]:
+        """Jobs newest first, optionally of one status."""
+        pass
+
+    @abstractmethod
+    def count(self, status: str) -> int:
+        pass
+
+    @abstractmethod
+    def claim(self, max_running: Optional[int] = None) -> Optional[JobRecord]:
+        """
+        Mark the oldest queued job running and return it, or None if none is
+        queued or max_running jobs are already running in any process.
+        """
+        pass
+
+    @abstractmethod
+    def report_progress(self, job_id: str, attempt: int, rows_done: int, run_seconds: float) -> int:
+        """
+        Record a running job's progress and refresh its heartbeat, if attempt is
+        still its current claim. Returns its cancel_requested value (0, CANCEL
+        or INTERRUPT), or LOST if the claim is gone and the worker must stop.
+        """
+        pass
+
+    @abstractmethod
+    def finish(self, job_id: str, attempt: int, status: str, error: Optional[str] = None,
+               output_bytes: Optional[int] = None) -> bool:
+        """Give a running job its final status if attempt is still its current claim; returns whether it did."""
+        pass
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> Optional[JobRecord]:
+        """
+        Cancel a queued job at once, or flag a running one for its worker to stop.
+        Returns the updated job, or None if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def interrupt(self, job_id: str) -> None:
+        """Ask a running job's worker to stop and return the job to the queue."""
+        pass
+
+    @abstractmethod
+    def requeue(self, job_id: str, attempt: int) -> None:
+        """Put a running job back in the queue, to be restarted from the beginning, if attempt is still its claim."""
+        pass
+
+    @abstractmethod
+    def requeue_stale(self, stale_seconds: float = DEFAULT_STALE_SECONDS) -> int:
+        """
+        Requeue running jobs whose worker stopped reporting: cancelled ones are
+        marked cancelled, and ones already tried MAX_ATTEMPTS times failed.
+        Returns the number of jobs changed.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, job_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class SQLiteJobStore(IJobStore):
+    """
+    SQLite-backed job queue, shared by the API process and its job workers.
+
+    Args:
+        path: Database file, created with its parent directory if missing
+    """
+    def __init__(self, path: str):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Workers and the API write concurrently; wait for the lock rather than failing
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+
+    def _execute(self, statement: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._connection.execute(statement, params).fetchall()
+
+    def submit(self, job: JobRecord) -> None:
+        values = tuple(getattr(job, name) for name in _COLUMNS)
+        self._execute(f"INSERT INTO jobs ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})", values)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        rows = self._execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,))
+        return JobRecord.from_row(rows[0]) if rows else None
+
+    def list(self, status: Optional[str] = None, limit: int = DEFAULT_JOB_LIMIT) -> List[JobRecord]:
+        where, params = ("WHERE status = ?", (status,)) if status else ("", ())
+        rows = self._execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM jobs {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+            params + (min(max(limit, 1), MAX_JOB_LIMIT),),
+        )
+        return [JobRecord.from_row(row) for row in rows]
+
+    def count(self, status: str) -> int:
+        return self._execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,))[0][0]
+
+    def claim(self, max_running: Optional[int] = None) -> Optional[JobRecord]:
+        # One statement: SQLite serialises writers, so processes cannot claim past the limit together
+        limit = "AND (SELECT COUNT(*) FROM jobs WHERE status = ?) < ? " if max_running is not None else ""
+        rows = self._execute(
+            f"UPDATE jobs SET status = ?, started_at = ?, heartbeat = ?, attempts = attempts + 1, "
+            f"rows_done = 0, run_seconds = 0 "
+            f"WHERE id = (SELECT id FROM jobs WHERE status = ? ORDER BY created_at, id LIMIT 1) {limit}"
+            f"RETURNING {', '.join(_COLUMNS)}",
+            (RUNNING, utc_now(), time.time(), QUEUED) + ((RUNNING, max_running) if max_running is not None else ()),
+        )
+        return JobRecord.from_row(rows[0]) if rows else None
+
+    def report_progress(self, job_id: str, attempt: int, rows_done: int, run_seconds: float) -> int:
+        rows = self._execute(
+            "UPDATE jobs SET rows_done = ?, run_seconds = ?, heartbeat = ? "
+            "WHERE id = ? AND status = ? AND attempts = ? RETURNING cancel_requested",
+            (rows_done, run_seconds, time.time(), job_id, RUNNING, attempt),
+        )
+        return rows[0][0] if rows else LOST
+
+    def finish(self, job_id: str, attempt: int, status: str, error: Optional[str] = None,
+               output_bytes: Optional[int] = None) -> bool:
+        return bool(self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = ?, output_bytes = ? "
+            "WHERE id = ? AND status = ? AND attempts = ? RETURNING id",
+            (status, utc_now(), error, output_bytes, job_id, RUNNING, attempt),
+        ))
+
+    def cancel(self, job_id: str) -> Optional[JobRecord]:
+        self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, cancel_requested = ? WHERE id = ? AND status = ?",
+            (CANCELLED, utc_now(), CANCEL, job_id, QUEUED),
+        )
+        self._execute("UPDATE jobs SET cancel_requested = ? WHERE id = ? AND status = ?", (CANCEL, job_id, RUNNING))
+        return self.get(job_id)
+
+    def interrupt(self, job_id: str) -> None:
+        self._execute(
+            "UPDATE jobs SET cancel_requested = ? WHERE id = ? AND status = ? AND cancel_requested = 0",
+            (INTERRUPT, job_id, RUNNING),
+        )
+
+    def requeue(self, job_id: str, attempt: int) -> None:
+        self._execute(
+            "UPDATE jobs SET status = ?, started_at = NULL, heartbeat = NULL, cancel_requested = 0 "
+            "WHERE id = ? AND status = ? AND attempts = ?",
+            (QUEUED, job_id, RUNNING, attempt),
+        )
+
+    def requeue_stale(self, stale_seconds: float = DEFAULT_STALE_SECONDS) -> int:
+        cutoff = time.time() - stale_seconds
+        cancelled = self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ? "
+            "WHERE status = ? AND heartbeat < ? AND cancel_requested = ? RETURNING id",
+            (CANCELLED, utc_now(), RUNNING, cutoff, CANCEL),
+        )
+        failed = self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = ? "
+            "WHERE status = ? AND heartbeat < ? AND attempts >= ? RETURNING id",
+            (FAILED, utc_now(), f"Worker lost {MAX_ATTEMPTS} times", RUNNING, cutoff, MAX_ATTEMPTS),
+        )
+        requeued = self._execute(
+            "UPDATE jobs SET status = ?, started_at = NULL, heartbeat = NULL, cancel_requested = 0 "
+            "WHERE status = ? AND heartbeat < ? RETURNING id",
+            (QUEUED, RUNNING, cutoff),
+        )
+        return len(cancelled) + len(failed) + len(requeued)
+
+    def delete(self, job_id: str) -> bool:
+        return bool(self._execute("DELETE FROM jobs WHERE id = ? RETURNING id", (job_id,)))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,85 @@
+"""
+Dynamic micro-batching for single-organ predictions.
+Concurrent /predict calls are held for at most a few milliseconds (or until N
+have arrived), scored as one vectorized batch and fanned back out to each caller.
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+from metrics.registry import REGISTRY, Histogram
+from schemas.prediction import PredictionRequest, PredictionResponse
+from services.scoring_executor import ScoringExecutor
+
+MICROBATCH_WAIT_ENV = "ULTRAVIAB_MICROBATCH_WAIT_MS"
+MICROBATCH_SIZE_ENV = "ULTRAVIAB_MICROBATCH_MAX_SIZE"
+DEFAULT_MAX_BATCH_SIZE = 64
+
+BATCH_SIZES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+MICROBATCH_SIZE = REGISTRY.register(Histogram(
+    "ultraviab_microbatch_size", "Requests coalesced into each micro-batch.", buckets=BATCH_SIZES
+))
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single predictions into predict_batch calls.
+
+    Args:
+        executor: Executor the coalesced batches are submitted to
+        max_wait_seconds: Longest a request waits for others to join its batch
+        max_batch_size: Batch size that triggers an immediate flush
+    """
+    def __init__(self, executor: ScoringExecutor, max_wait_seconds: float,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        self.executor = executor
+        self.max_wait_seconds = max_wait_seconds
+        self.max_batch_size = max(max_batch_size, 1)
+        self._pending: List[Tuple[PredictionRequest, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes = set()
+
+    async def predict(self, request: PredictionRequest) -> PredictionResponse:
+        """
+        Score one request as part of the next micro-batch.
+
+        Args:
+            request: Organ assessment data
+
+        Returns:
+            The same PredictionResponse a direct predict call would return
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._score(pending))
+        # Hold a reference so the task is not garbage-collected mid-flight
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _score(self, pending: List[Tuple[PredictionRequest, asyncio.Future]]) -> None:
+        MICROBATCH_SIZE.observe(len(pending))
+        try:
+            responses = await self.executor.predict_batch([request for request, _ in pending])
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), response in zip(pending, responses):
+            # Callers that disconnected have already cancelled their future
+            if not future.done():
+                future.set_result(response)
@@ -0,0 +1,64 @@
+"""
+Feature encoding shared by model training and model inference.
+Artifacts store the ordered feature names they were trained on, and the encoder
+builds exactly those columns from a FeatureBatch.
+"""
+from typing import Sequence
+
+import numpy as np
+
+from services.scoring_kernel import COLUMN_INDEX, NUMERIC_FIELDS, FeatureBatch, factorize
+
+ORGAN_TYPES = ("kidney", "liver", "heart", "lung")
+CAUSES_OF_DEATH = ("trauma", "anoxia", "cva", "other")
+
+# Median used when the optional KDPI is missing, as in the rule-based plans.
+KDPI_FILL_VALUE = 50.0
+
+DEFAULT_FEATURE_NAMES = (
+    list(NUMERIC_FIELDS)
+    + [f"organ_type={organ}" for organ in ORGAN_TYPES]
+    + [f"cause_of_death={cause}" for cause in CAUSES_OF_DEATH]
+)
+
+
+def encode(batch: FeatureBatch, feature_names: Sequence[str] = DEFAULT_FEATURE_NAMES) -> np.ndarray:
+    """
+    Build the model input matrix for a batch.
+
+    Numeric names select a request column; "field=value" names are one-hot
+    indicators on organ_type or cause_of_death (case-insensitive).
+
+    Args:
+        batch: Columnar request data
+        feature_names: Ordered feature names the model was trained on
+
+    Returns:
+        (n, len(feature_names)) float64 matrix
+
+    Raises:
+        ValueError: If a feature name cannot be built from a request
+    """
+    X = np.empty((len(batch), len(feature_names)), dtype=np.float64)
+    categorical = {}
+    for j, name in enumerate(feature_names):
+        if name in COLUMN_INDEX:
+            X[:, j] = batch.column(name)
+            if name == "kdpi_percentile":
+                X[:, j] = np.where(np.isnan(X[:, j]), KDPI_FILL_VALUE, X[:, j])
+            continue
+        field, sep, value = name.partition("=")
+        if not sep or field not in ("organ_type", "cause_of_death"):
+            raise ValueError(f"Cannot encode model feature '{name}'")
+        if field not in categorical:
+            # Normalize each distinct value once, then broadcast through the row codes
+            if field == "organ_type":
+                distinct, codes = batch.organ_groups()
+            else:
+                distinct, codes = factorize(batch.causes_of_death)
+            keys = np.array([str(v).strip().lower() for v in distinct], dtype=object)
+            categorical[field] = (keys, codes)
+        keys, codes = categorical[field]
+        X[:, j] = (keys == value)[codes]
+    return X
+
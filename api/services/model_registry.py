@@ -0,0 +1,119 @@
+"""
+Model artifact registry.
+Loads every versioned model artifact once at process start and keeps them warm,
+recording how long each one took to load.
+
+Layout: <model dir>/<version>/model.joblib, where model.joblib is a dict with
+"regressor" (required), "classifier", "scaler", "feature_names" and "metadata".
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.model_features import DEFAULT_FEATURE_NAMES
+
+MODEL_DIR_ENV = "ULTRAVIAB_MODEL_DIR"
+MODEL_VERSION_ENV = "ULTRAVIAB_MODEL_VERSION"
+DEFAULT_MODEL_DIR = Path(__file__).resolve().parent.parent / "models"
+ARTIFACT_FILENAME = "model.joblib"
+
+
+@dataclass
+class ModelArtifact:
+    """A loaded, ready-to-serve model version."""
+    version: str
+    path: str
+    regressor: Any
+    classifier: Any = None
+    scaler: Any = None
+    feature_names: List[str] = field(default_factory=lambda: list(DEFAULT_FEATURE_NAMES))
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    load_seconds: float = 0.0
+    loaded_at: str = ""
+    size_bytes: int = 0
+
+
+def load_model_artifact(path: Path, version: Optional[str] = None) -> ModelArtifact:
+    """
+    Load one artifact, memory-mapping its NumPy arrays where joblib allows it.
+
+    Args:
+        path: Path to a model.joblib file
+        version: Version label; defaults to the artifact's own or its directory name
+
+    Returns:
+        Loaded ModelArtifact with load timing
+
+    Raises:
+        ValueError: If the artifact has no regressor
+    """
+    import joblib  # Heavy (pulls in scikit-learn on unpickle) - only needed when serving models
+
+    started = time.perf_counter()
+    payload = joblib.load(path, mmap_mode="r")
+    load_seconds = time.perf_counter() - started
+
+    if not isinstance(payload, dict) or payload.get("regressor") is None:
+        raise ValueError(f"{path}: artifact must be a dict with a 'regressor'")
+
+    return ModelArtifact(
+        version=version or payload.get("version") or path.parent.name,
+        path=str(path),
+        regressor=payload["regressor"],
+        classifier=payload.get("classifier"),
+        scaler=payload.get("scaler"),
+        feature_names=list(payload.get("feature_names") or DEFAULT_FEATURE_NAMES),
+        metadata=dict(payload.get("metadata") or {}),
+        load_seconds=load_seconds,
+        loaded_at=datetime.now(timezone.utc).isoformat(),
+        size_bytes=path.stat().st_size,
+    )
+
+
+class ModelRegistry:
+    """Loaded model versions and the one currently served."""
+
+    def __init__(self, models: Dict[str, ModelArtifact], active_version: Optional[str] = None):
+        self.models = models
+        # Versions sort lexically, so timestamped versions make "latest" the newest
+        self.active_version = active_version or (max(models) if models else None)
+        if self.active_version and self.active_version not in models:
+            raise ValueError(f"Model version '{self.active_version}' is not loaded")
+
+    @property
+    def active(self) -> ModelArtifact:
+        """
+        The artifact served by the API.
+
+        Raises:
+            LookupError: If no model artifacts were loaded
+        """
+        if self.active_version is None:
+            raise LookupError("No model artifacts loaded")
+        return self.models[self.active_version]
+
+    def list(self) -> List[ModelArtifact]:
+        return [self.models[version] for version in sorted(self.models)]
+
+
+def load_model_registry(model_dir: Optional[str] = None, active_version: Optional[str] = None) -> ModelRegistry:
+    """
+    Eagerly load every artifact in a model directory.
+
+    Args:
+        model_dir: Directory of <version>/model.joblib; defaults to $ULTRAVIAB_MODEL_DIR or api/models
+        active_version: Version to serve; defaults to $ULTRAVIAB_MODEL_VERSION or the latest
+
+    Returns:
+        ModelRegistry with every artifact warm in memory
+    """
+    model_dir = Path(model_dir or os.environ.get(MODEL_DIR_ENV) or DEFAULT_MODEL_DIR)
+    models = {}
+    if model_dir.is_dir():
+        for artifact_path in sorted(model_dir.glob(f"*/{ARTIFACT_FILENAME}")):
+            artifact = load_model_artifact(artifact_path)
+            models[artifact.version] = artifact
+    return ModelRegistry(models, active_version or os.environ.get(MODEL_VERSION_ENV))
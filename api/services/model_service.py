@@ -0,0 +1,135 @@
+"""
+Trained-model prediction service.
+Serves single and batched inference from a warm ModelArtifact; risk factors
+still come from the clinical rules so responses keep the same shape.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from metrics.registry import stage_timer
+from schemas.prediction import PredictionRequest, PredictionResponse
+from services import model_features, scoring_kernel
+from services.model_registry import ModelArtifact
+from services.prediction_service import IPredictionService
+from services.risk_rules import RiskRuleProvider
+from services.scoring_kernel import FeatureBatch, ScoredBatch
+
+# Cut-offs used when an artifact ships without a classifier.
+DEFAULT_THRESHOLDS = np.array([40, 70])
+
+# Reported when an artifact ships without a classifier to estimate confidence.
+DEFAULT_CONFIDENCE = 0.85
+
+
+class ModelPredictionService(IPredictionService):
+    """
+    Service running viability inference through a trained scikit-learn model.
+    Follows Single Responsibility Principle - only handles model inference.
+    """
+    def __init__(self, artifact: ModelArtifact, risk_rules: Optional[RiskRuleProvider] = None):
+        self.artifact = artifact
+        self.risk_rules = risk_rules or RiskRuleProvider()
+        self.feature_contributions = self._importances(artifact)
+
+    @property
+    def version(self) -> str:
+        return f"{self.artifact.version}/{self.risk_rules.current().version}"
+
+    def classification_cutoffs(self, organ_type: str) -> Optional[Dict[str, float]]:
+        if self.artifact.classifier is not None:
+            return None
+        marginal, accept = DEFAULT_THRESHOLDS
+        return {"Marginal": float(marginal), "Accept": float(accept)}
+
+    def predict(self, request: PredictionRequest) -> PredictionResponse:
+        """
+        Generate viability prediction for an organ.
+
+        Args:
+            request: PredictionRequest containing organ assessment data
+
+        Returns:
+            PredictionResponse with viability score and classification
+        """
+        return self.predict_batch([request])[0]
+
+    def predict_batch(self, requests: List[PredictionRequest]) -> List[PredictionResponse]:
+        """
+        Generate viability predictions for a batch of organs with one model call.
+
+        Args:
+            requests: PredictionRequests to score
+
+        Returns:
+            PredictionResponses in the same order as the requests
+        """
+        if not requests:
+            return []
+
+        return self.build_responses(self.score_batch(scoring_kernel.requests_to_batch(requests)))
+
+    def build_responses(self, scored: ScoredBatch) -> List[PredictionResponse]:
+        """PredictionResponses for scored rows, each carrying the model's global importances."""
+        return [
+            PredictionResponse(
+                viability_score=int(scored.scores[i]),
+                classification=str(scored.classifications[i]),
+                confidence=float(scored.confidences[i]),
+                risk_factors=scored.risk_factors(i),
+                feature_contributions=dict(self.feature_contributions)
+            )
+            for i in range(len(scored))
+        ]
+
+    def score_batch(self, batch: FeatureBatch, explain: bool = False) -> ScoredBatch:
+        """
+        Run the regressor (and classifier, if present) over a whole batch.
+
+        Args:
+            batch: FeatureBatch built from requests, CSV or NDJSON rows
+            explain: Ignored - responses carry the model's global importances
+
+        Returns:
+            ScoredBatch aligned with the batch rows
+        """
+        if not len(batch):
+            # scikit-learn rejects empty input, e.g. a columnar batch with no scorable rows
+            return ScoredBatch(
+                scores=np.empty(0, dtype=np.int64),
+                classifications=np.empty(0, dtype=str),
+                confidences=np.empty(0),
+                risk_flags=self.risk_rules.current().evaluate(batch),
+            )
+        with stage_timer("model_inference"):
+            X = model_features.encode(batch, self.artifact.feature_names)
+            if self.artifact.scaler is not None:
+                X = self.artifact.scaler.transform(X)
+
+            raw_scores = np.clip(self.artifact.regressor.predict(X), 0, 100) / 100
+            scores = scoring_kernel.to_scores(raw_scores)
+
+            classifier = self.artifact.classifier
+            if classifier is None:
+                classifications = scoring_kernel.classify(scores, DEFAULT_THRESHOLDS)
+                confidences = np.full(len(batch), DEFAULT_CONFIDENCE)
+            else:
+                probabilities = classifier.predict_proba(X)
+                best = probabilities.argmax(axis=1)
+                classifications = np.asarray(classifier.classes_)[best].astype(str)
+                confidences = probabilities[np.arange(len(batch)), best]
+
+        return ScoredBatch(
+            scores=scores,
+            classifications=classifications,
+            confidences=confidences,
+            risk_flags=self.risk_rules.current().evaluate(batch),
+        )
+
+    @staticmethod
+    def _importances(artifact: ModelArtifact) -> Dict[str, float]:
+        """Global feature importances of the regressor, if it exposes them."""
+        importances = getattr(artifact.regressor, "feature_importances_", None)
+        if importances is None:
+            return {}
+        return dict(zip(artifact.feature_names, scoring_kernel.round_contributions(np.asarray(importances)).tolist()))
@@ -0,0 +1,153 @@
+"""
+Response cache for repeated identical assessments.
+A content-addressed LRU with TTL eviction sits in front of any IPredictionService.
+Keys include the service version, so new weights or a new model never serve stale results.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from schemas.prediction import PredictionRequest, PredictionResponse
+from services.prediction_service import IPredictionService
+from services.scoring_kernel import FeatureBatch, ScoredBatch
+
+CACHE_SIZE_ENV = "ULTRAVIAB_CACHE_SIZE"
+CACHE_TTL_ENV = "ULTRAVIAB_CACHE_TTL_SECONDS"
+DEFAULT_CACHE_SIZE = 10_000
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+# Free-text categorical fields are compared case- and whitespace-insensitively.
+_CATEGORICAL_FIELDS = ("organ_type", "cause_of_death")
+
+
+class LRUTTLCache:
+    """Thread-safe bounded LRU cache whose entries also expire after a TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def request_key(request: PredictionRequest, version: str) -> str:
+    """
+    Canonical content hash of a request's normalized fields plus the scoring version.
+
+    Numbers are compared by value (15 == 15.0) and categorical text ignores case.
+    """
+    fields = request.model_dump()
+    for name in _CATEGORICAL_FIELDS:
+        fields[name] = str(fields[name]).strip().lower()
+    for name, value in fields.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            fields[name] = float(value)
+    canonical = json.dumps([version, fields], sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+class CachedPredictionService(IPredictionService):
+    """
+    Caching decorator around another prediction service.
+    Follows Open/Closed Principle - adds caching without changing the wrapped service.
+    Cached responses are shared, so callers must not mutate them.
+    """
+    def __init__(self, inner: IPredictionService, cache: LRUTTLCache):
+        self.inner = inner
+        self.cache = cache
+        self._cached_version = inner.version
+
+    @property
+    def version(self) -> str:
+        return self.inner.version
+
+    def _current_version(self) -> str:
+        version = self.inner.version
+        if version != self._cached_version:
+            # Weights or model changed underneath us - drop everything at once
+            self.cache.clear()
+            self._cached_version = version
+        return version
+
+    def predict(self, request: PredictionRequest) -> PredictionResponse:
+        """Serve a cached prediction when an identical assessment was scored recently."""
+        key = request_key(request, self._current_version())
+        response = self.cache.get(key)
+        if response is None:
+            response = self.inner.predict(request)
+            self.cache.put(key, response)
+        return response
+
+    def predict_batch(self, requests: List[PredictionRequest]) -> List[PredictionResponse]:
+        """Look up each request, then score only the misses in one batch call."""
+        version = self._current_version()
+        keys = [request_key(request, version) for request in requests]
+        responses = [self.cache.get(key) for key in keys]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if missing:
+            scored = self.inner.predict_batch([requests[i] for i in missing])
+            for i, response in zip(missing, scored):
+                responses[i] = response
+                self.cache.put(keys[i], response)
+        return responses
+
+    def score_batch(self, batch: FeatureBatch, explain: bool = False) -> ScoredBatch:
+        """Bulk columnar scoring bypasses the cache."""
+        return self.inner.score_batch(batch, explain=explain)
+
+    def build_responses(self, scored: ScoredBatch) -> List[PredictionResponse]:
+        return self.inner.build_responses(scored)
+
+    def classification_cutoffs(self, organ_type: str) -> Optional[Dict[str, float]]:
+        return self.inner.classification_cutoffs(organ_type)
@@ -1,36 +1,86 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
+import numpy as np
+
+from metrics.registry import stage_timer
 from schemas.prediction import PredictionRequest, PredictionResponse
+from services import scoring_kernel
+from services.risk_rules import RiskRuleProvider, RiskRuleSet
+from services.scoring_kernel import FeatureBatch, ScoredBatch
+from services.scoring_plan import ScoringPlan, ScoringPlanSet, load_scoring_plans
 
 
 class IPredictionService(ABC):
     """Interface for prediction services (Interface Segregation Principle)."""
     
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Identifies the weights or model producing predictions (changes when they do)."""
+        pass
+
     @abstractmethod
     def predict(self, request: PredictionRequest) -> PredictionResponse:
         """Generate viability prediction for an organ."""
         pass
 
+    @abstractmethod
+    def predict_batch(self, requests: List[PredictionRequest]) -> List[PredictionResponse]:
+        """Generate viability predictions for many organs, in input order."""
+        pass
+
+    @abstractmethod
+    def score_batch(self, batch: FeatureBatch, explain: bool = False) -> ScoredBatch:
+        """
+        Score columnar request data without building per-row response objects.
+        With explain, also return per-row feature contributions where the engine supports them.
+        """
+        pass
+
+    def build_responses(self, scored: ScoredBatch) -> List[PredictionResponse]:
+        """PredictionResponses for the rows of a score_batch(..., explain=True) result, in row order."""
+        return [
+            PredictionResponse(
+                viability_score=int(scored.scores[i]),
+                classification=str(scored.classifications[i]),
+                confidence=float(scored.confidences[i]),
+                risk_factors=scored.risk_factors(i),
+                feature_contributions=scored.feature_contributions(i)
+            )
+            for i in range(len(scored))
+        ]
+
+    def classification_cutoffs(self, organ_type: str) -> Optional[Dict[str, float]]:
+        """Minimum Marginal and Accept scores for an organ, or None when classes are not score cut-offs."""
+        return None
+
 
 class PredictionService(IPredictionService):
     """
     Service handling organ viability prediction business logic.
     Follows Single Responsibility Principle - only handles prediction logic.
     """
-    def __init__(self):
-        # Weights from DEEP_RESEARCH.md
-        self.weights = {
-            "stiffness": 0.28,
-            "resistive_index": 0.22,
-            "perfusion_uniformity": 0.15,
-            "echogenicity": 0.10,
-            "edema_index": 0.05,
-            "kdpi": 0.10,
-            "cold_ischemia_time": 0.06,
-            "donor_age": 0.03,
-            "cause_of_death": 0.01
-        }
+    def __init__(self, scoring_plans: Optional[ScoringPlanSet] = None,
+                 risk_rules: Optional[RiskRuleProvider] = None):
+        # Per-organ ranges and weights live in config/scoring_plans.json,
+        # per-organ risk rules in config/risk_rules.json (hot-reloaded)
+        self.scoring_plans = scoring_plans or load_scoring_plans()
+        self.risk_rules = risk_rules or RiskRuleProvider()
+        self.confidence = 0.85
+
+    @property
+    def version(self) -> str:
+        return f"{self.scoring_plans.version}/{self.risk_rules.current().version}"
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Feature weights of the default organ plan."""
+        return self.scoring_plans.default.weights
+
+    def classification_cutoffs(self, organ_type: str) -> Optional[Dict[str, float]]:
+        marginal, accept = self.scoring_plans.plan_for(organ_type).thresholds
+        return {"Marginal": float(marginal), "Accept": float(accept)}
     
     def predict(self, request: PredictionRequest) -> PredictionResponse:
         """
@@ -42,117 +92,80 @@ class PredictionService(IPredictionService):
         Returns:
             PredictionResponse with viability score and classification
         """
-        score = self._calculate_score(request)
-        classification = self._get_classification(score)
-        risk_factors = self._identify_risk_factors(request)
-        feature_contributions = self._get_feature_contributions(request)
+        plan = self.scoring_plans.plan_for(request.organ_type)
+        values = scoring_kernel.request_values(request)
+        with stage_timer("calculate_score"):
+            score, contributions = self._calculate_score(values, plan)
+        classification = self._get_classification(score, plan)
+        with stage_timer("identify_risk_factors"):
+            risk_factors = self._identify_risk_factors(request, values, self.risk_rules.current())
+        feature_contributions = self._get_feature_contributions(plan, contributions)
         
         return PredictionResponse(
             viability_score=score,
             classification=classification,
-            confidence=0.85,
+            confidence=self.confidence,
             risk_factors=risk_factors,
             feature_contributions=feature_contributions
         )
-    
-    def _calculate_score(self, request: PredictionRequest) -> int:
-        """Calculate viability score using weighted sum of normalized inputs."""
-        
-        # 1. Normalization (Min-Max Scaling)
-        # Stiffness: 0-50 kPa (Lower is better -> Invert)
-        norm_stiffness = 1.0 - min(max((request.tissue_stiffness_kpa - 0) / (50 - 0), 0), 1)
-        
-        # RI: 0.4-1.0 (Lower is better -> Invert)
-        norm_ri = 1.0 - min(max((request.resistive_index - 0.4) / (1.0 - 0.4), 0), 1)
-        
-        # Perfusion Uniformity: 0-100% (Higher is better -> Direct)
-        norm_perfusion = min(max((request.perfusion_uniformity_pct - 0) / (100 - 0), 0), 1)
-        
-        # Echogenicity: 1-5 (Lower is better -> Invert)
-        norm_echo = 1.0 - min(max((request.echogenicity_grade - 1) / (5 - 1), 0), 1)
-        
-        # Edema Index: 0.39 threshold, assume range roughly 0.2 - 0.6 for normalization?
-        # Doc says > 0.39 is bad. Let's assume 0.2 (dry) to 0.6 (very edematous).
-        # Lower is better -> Invert
-        norm_edema = 1.0 - min(max((request.edema_index - 0.2) / (0.6 - 0.2), 0), 1)
-        
-        # KDPI: 0-100% (Lower is better -> Invert)
-        kdpi_val = request.kdpi_percentile if request.kdpi_percentile is not None else 50 # Default middle
-        norm_kdpi = 1.0 - min(max((kdpi_val - 0) / (100 - 0), 0), 1)
-        
-        # CIT: 0-48 hours (Lower is better -> Invert)
-        norm_cit = 1.0 - min(max((request.cold_ischemia_hours - 0) / (48 - 0), 0), 1)
-        
-        # Age: 0-90 years (Lower is better -> Invert)
-        norm_age = 1.0 - min(max((request.donor_age - 0) / (90 - 0), 0), 1)
+
+    def predict_batch(self, requests: List[PredictionRequest]) -> List[PredictionResponse]:
+        """
+        Generate viability predictions for a batch of organs in one vectorized pass.
         
-        # Cause of Death: 0.01 weight. No mapping logic provided. Assume nominal.
-        # Let's say we give it 0.5 (neutral) for now as we can't parse string efficiently without a map.
-        norm_cod = 0.5
-
-        # 2. Weighted Sum
-        raw_score = (
-            norm_stiffness * self.weights["stiffness"] +
-            norm_ri * self.weights["resistive_index"] +
-            norm_perfusion * self.weights["perfusion_uniformity"] +
-            norm_echo * self.weights["echogenicity"] +
-            norm_edema * self.weights["edema_index"] +
-            norm_kdpi * self.weights["kdpi"] +
-            norm_cit * self.weights["cold_ischemia_time"] +
-            norm_age * self.weights["donor_age"] +
-            norm_cod * self.weights["cause_of_death"]
-        )
+        Args:
+            requests: PredictionRequests to score
+            
+        Returns:
+            PredictionResponses in the same order as the requests
+        """
+        if not requests:
+            return []
+
+        return self.build_responses(self.score_batch(scoring_kernel.requests_to_batch(requests), explain=True))
+
+    def score_batch(self, batch: FeatureBatch, explain: bool = False) -> ScoredBatch:
+        """
+        Score columnar request data in one vectorized pass.
         
+        Args:
+            batch: FeatureBatch built from requests, CSV or NDJSON rows
+            explain: Also compute per-row feature contributions
+            
+        Returns:
+            ScoredBatch aligned with the batch rows
+        """
+        with stage_timer("score_batch"):
+            return scoring_kernel.score_batch(
+                batch, self.scoring_plans, self.risk_rules.current(), self.confidence, explain=explain
+            )
+    
+    def _calculate_score(self, values: np.ndarray, plan: ScoringPlan) -> Tuple[int, np.ndarray]:
+        """Calculate viability score and per-feature contributions from one normalization."""
+        raw_score, contributions = plan.explain(values)
         # Scale to 0-100
-        return int(raw_score * 100)
+        return int(scoring_kernel.to_scores(raw_score)[0]), contributions[0]
     
-    def _get_classification(self, score: int) -> str:
-        """Determine classification based on viability score."""
-        # Per doc: 0-39 Decline, 40-69 Marginal, 70-100 Accept
-        if score < 40:
+    def _get_classification(self, score: int, plan: ScoringPlan) -> str:
+        """Determine classification based on viability score and the organ's cut-offs."""
+        # Default per doc: 0-39 Decline, 40-69 Marginal, 70-100 Accept
+        marginal, accept = plan.thresholds
+        if score < marginal:
             return "Decline"
-        if score < 70:
+        if score < accept:
             return "Marginal"
         return "Accept"
     
-    def _identify_risk_factors(self, request: PredictionRequest) -> List[str]:
-        """Identify risk factors from request data."""
-        risk_factors = []
-        
-        # Doc thresholds:
-        # PCL: RI > 0.8 is pathological.
-        if request.resistive_index > 0.8:
-            risk_factors.append("High Vascular Resistance (RI > 0.8)")
-            
-        # Stiffness: > 28 kPa (Kidney) is dysfunctional.
-        if request.tissue_stiffness_kpa > 28.0:
-            risk_factors.append("Critical Tissue Stiffness (> 28 kPa)")
-            
-        # Edema: Index > 0.39
-        if request.edema_index > 0.39:
-            risk_factors.append("Significant Edema (> 0.39)")
-
-        if request.cold_ischemia_hours > 24:
-            risk_factors.append("Extended Cold Ischemia (> 24h)")
-            
-        if request.donor_age > 60:
-             risk_factors.append("Advanced Donor Age (> 60)")
-            
-        if not risk_factors:
-            risk_factors.append("No significant risk factors identified")
-            
-        return risk_factors
+    def _identify_risk_factors(self, request: PredictionRequest, values: np.ndarray,
+                               rules: RiskRuleSet) -> List[str]:
+        """Flag the organ's risk rules for one request's (1, k) values."""
+        batch = FeatureBatch(
+            values=values,
+            organ_types=np.array([request.organ_type], dtype=object),
+            causes_of_death=np.array([request.cause_of_death], dtype=object),
+        )
+        return rules.evaluate(batch).factors(0)
     
-    def _get_feature_contributions(self, request: PredictionRequest) -> Dict[str, float]:
-        """Calculate feature contributions to prediction."""
-        return {
-            "stiffness": self.weights["stiffness"],
-            "resistive_index": self.weights["resistive_index"],
-            "perfusion_uniformity": self.weights["perfusion_uniformity"],
-            "echogenicity": self.weights["echogenicity"],
-            "edema_index": self.weights["edema_index"],
-            "kdpi": self.weights["kdpi"],
-            "cold_ischemia_time": self.weights["cold_ischemia_time"],
-            "donor_age": self.weights["donor_age"],
-            "cause_of_death": self.weights["cause_of_death"]
-        }
+    def _get_feature_contributions(self, plan: ScoringPlan, contributions: np.ndarray) -> Dict[str, float]:
+        """Weight x normalized value per feature; they sum to the score / 100."""
+        return dict(zip(plan.feature_names, scoring_kernel.round_contributions(contributions).tolist()))
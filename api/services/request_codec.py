@@ -0,0 +1,185 @@
+"""
+Fast-path JSON codec for /predict and /predict/batch.
+Bodies are parsed with orjson and checked field by field against a table
+compiled once from PredictionRequest: exact JSON types only, integers used as
+floats must be exactly representable. A body that passes becomes a request
+without a second pydantic pass; anything else (coercible strings, whole-number
+floats for int fields, NaN or infinity, missing fields, malformed JSON) goes
+through the usual pydantic validation, so accepted inputs and error messages
+are unchanged.
+Responses are already validated when the scoring service builds them, so they
+are encoded straight from their fields instead of being re-validated.
+"""
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import ValidationError, to_jsonable_python
+
+from metrics.registry import stage_timer
+from schemas.prediction import BatchPredictionRequest, PredictionRequest, PredictionResponse
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib json module gives the same results, slower
+    orjson = None
+
+# Largest integer a float holds exactly; larger ones are left to pydantic's coercion
+MAX_EXACT_INT = 2 ** 53
+
+_MISSING = object()
+
+
+def _compile_fields() -> Tuple[Tuple[str, type, bool, bool, Any], ...]:
+    """(name, JSON type, nullable, required, default) for each PredictionRequest field, in field order."""
+    fields = []
+    for name, info in PredictionRequest.model_fields.items():
+        annotation, nullable = info.annotation, False
+        if get_origin(annotation) is Union:
+            members = [arg for arg in get_args(annotation) if arg is not type(None)]
+            annotation, nullable = members[0], len(members) < len(get_args(annotation))
+        if annotation not in (str, int, float):
+            raise TypeError(f"No fast-path decoder for PredictionRequest.{name}: {info.annotation}")
+        fields.append((name, annotation, nullable, info.is_required(), info.default))
+    return tuple(fields)
+
+
+_FIELDS = _compile_fields()
+_FIELD_NAMES = frozenset(name for name, *_ in _FIELDS)
+
+
+def _loads(body: bytes) -> Any:
+    """Parsed body, or _MISSING if the fast parser rejects it."""
+    try:
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    except ValueError:
+        return _MISSING
+
+
+def _fast_request(data: Any) -> Optional[PredictionRequest]:
+    """
+    PredictionRequest from a parsed JSON object whose values already have their
+    field types, or None if pydantic has to validate (or coerce) it.
+    """
+    if type(data) is not dict:
+        return None
+    values: Dict[str, Any] = {}
+    for name, kind, nullable, required, default in _FIELDS:
+        value = data.get(name, _MISSING)
+        if value is _MISSING:
+            if required:
+                return None
+            value = default
+        elif value is None:
+            if not nullable:
+                return None
+        elif kind is float and type(value) is int:
+            if not -MAX_EXACT_INT <= value <= MAX_EXACT_INT:
+                return None
+            value = float(value)
+        elif kind is float and type(value) is float:
+            # NaN and infinity are refused by the schema; leave the error to pydantic
+            if not math.isfinite(value):
+                return None
+        elif type(value) is not kind:
+            # Exact type test: bool is not accepted as int, nor int as str
+            return None
+        values[name] = value
+    # What model_construct does, minus its per-field default handling (done above).
+    # Fields set are those the client sent, as validation records them, in a set
+    # of the instance's own so model_copy(update=...) can extend it.
+    request = PredictionRequest.__new__(PredictionRequest)
+    object.__setattr__(request, "__dict__", values)
+    object.__setattr__(request, "__pydantic_fields_set__", data.keys() & _FIELD_NAMES)
+    object.__setattr__(request, "__pydantic_extra__", None)
+    object.__setattr__(request, "__pydantic_private__", None)
+    return request
+
+
+def _validate(model: type, body: bytes, is_json: bool) -> BaseModel:
+    """The standard path: the same parse and validation FastAPI applies to a declared body parameter."""
+    data = json.loads(body) if is_json else body
+    if data is None:
+        raise ValidationError.from_exception_data(model.__name__, [{"type": "missing", "loc": (), "input": None}])
+    return model.model_validate(data, from_attributes=True)
+
+
+def decode_request(body: bytes, is_json: bool = True) -> PredictionRequest:
+    """
+    Parse a /predict body.
+
+    Args:
+        body: Raw request body
+        is_json: False if the body was not sent as JSON; it is then validated
+            as is, which fails as FastAPI would
+
+    Returns:
+        Validated assessment
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+        pydantic.ValidationError: If the body does not describe a valid assessment
+    """
+    request = None
+    if is_json:
+        with stage_timer("validation"):
+            request = _fast_request(_loads(body))
+    if request is None:
+        request = _validate(PredictionRequest, body, is_json)
+    return request
+
+
+def decode_batch(body: bytes, is_json: bool = True) -> List[PredictionRequest]:
+    """
+    Parse a /predict/batch body.
+
+    Args:
+        body: Raw request body holding {"requests": [...]}
+        is_json: False if the body was not sent as JSON, as for decode_request
+
+    Returns:
+        Validated assessments, in order
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+        pydantic.ValidationError: If the body is not a valid batch
+    """
+    requests = None
+    with stage_timer("validation"):
+        data = _loads(body) if is_json else None
+        items = data.get("requests") if type(data) is dict else None
+        if type(items) is list and items:
+            requests = []
+            for item in items:
+                request = _fast_request(item)
+                if request is None:
+                    requests = None
+                    break
+                requests.append(request)
+    if requests is None:
+        requests = _validate(BatchPredictionRequest, body, is_json).requests
+    return requests
+
+
+def _default(value: Any) -> Any:
+    # NumPy scalars and other values orjson has no native encoding for
+    return to_jsonable_python(value)
+
+
+def _dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_prediction(prediction: PredictionResponse) -> bytes:
+    """JSON body of one prediction, as /predict returns it."""
+    with stage_timer("serialization"):
+        return _dumps(prediction.__dict__)
+
+
+def encode_batch(predictions: Sequence[PredictionResponse]) -> bytes:
+    """JSON body of a BatchPredictionResponse holding predictions."""
+    with stage_timer("serialization"):
+        return _dumps({"predictions": [prediction.__dict__ for prediction in predictions]})
@@ -0,0 +1,224 @@
+"""
+Declarative risk-factor rules.
+Per-organ rule tables are read from config/risk_rules.json and compiled into
+threshold and label matrices, so flagging a batch is one vectorized comparison
+per operator instead of one Python branch per rule per row. The provider
+recompiles the table when the file changes, without restarting workers.
+"""
+import copy
+import hashlib
+import json
+import logging
+import operator
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from services.scoring_kernel import COLUMN_INDEX, NO_RISK_FACTORS, FeatureBatch, RiskFlags
+
+RISK_RULES_ENV = "ULTRAVIAB_RISK_RULES"
+RISK_RULES_RELOAD_ENV = "ULTRAVIAB_RISK_RULES_RELOAD_SECONDS"
+DEFAULT_RISK_RULES_PATH = Path(__file__).resolve().parent.parent / "config" / "risk_rules.json"
+DEFAULT_RELOAD_SECONDS = 2.0
+
+OPERATORS = {">": np.greater, ">=": np.greater_equal, "<": np.less, "<=": np.less_equal}
+# Same comparisons on Python floats (NaN compares false either way)
+SCALAR_OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+logger = logging.getLogger(__name__)
+
+
+class RiskRuleSet:
+    """
+    Compiled rule table.
+
+    Row g of thresholds/labels holds organ g's rules (the last row is the default
+    organ's); a disabled rule has a NaN threshold, which never compares true.
+    """
+
+    def __init__(self, rule_ids: List[str], columns: np.ndarray, operators: List[str],
+                 organ_rows: Dict[str, int], default_row: int,
+                 thresholds: np.ndarray, labels: np.ndarray, version: str):
+        self.rule_ids = rule_ids
+        self.columns = columns
+        self.organ_rows = organ_rows
+        self.default_row = default_row
+        self.thresholds = thresholds
+        self.labels = labels
+        self.version = version
+        self.operators = operators
+        # Rules sharing an operator are evaluated together
+        self._operator_groups = [
+            (OPERATORS[op], np.array([j for j, rule_op in enumerate(operators) if rule_op == op], dtype=np.intp))
+            for op in sorted(set(operators))
+        ]
+        # Python-level copies for single-row checks, where NumPy call overhead dominates
+        self._scalar_compare = [SCALAR_OPERATORS[op] for op in operators]
+        self._scalar_columns = columns.tolist()
+        self._scalar_thresholds = thresholds.tolist()
+
+    def evaluate(self, batch: FeatureBatch) -> RiskFlags:
+        """
+        Flag every rule for every row of a batch.
+
+        Returns:
+            RiskFlags with (n, rules) masks and per-row label lookups
+        """
+        organs, codes = batch.organ_groups()
+        organ_rows = np.array([self._row_for(organ) for organ in organs], dtype=np.intp)
+        label_rows = organ_rows[codes]
+        values = batch.values[:, self.columns]
+        if len(organ_rows) and (organ_rows == organ_rows[0]).all():
+            thresholds = self.thresholds[organ_rows[0]]  # one organ: broadcast a single row
+        else:
+            thresholds = self.thresholds[label_rows]
+
+        masks = np.zeros(values.shape, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            for compare, rules in self._operator_groups:
+                masks[:, rules] = compare(values[:, rules], thresholds[..., rules])
+        return RiskFlags(masks=masks, labels=self.labels, label_rows=label_rows)
+
+    def row_flags(self, values: Sequence[float], organ_type: Optional[str], rules: Iterable[int]) -> List[bool]:
+        """
+        Evaluate selected rules for a single row with scalar comparisons, for
+        callers re-checking one assessment as individual fields change.
+
+        Args:
+            values: One row of len(NUMERIC_FIELDS) floats, NaN = missing
+            organ_type: The row's organ type
+            rules: Positions of the rules to evaluate
+
+        Returns:
+            Whether each requested rule fires, in the order requested
+        """
+        thresholds = self._scalar_thresholds[self._row_for(organ_type)]
+        return [self._scalar_compare[j](values[self._scalar_columns[j]], thresholds[j]) for j in rules]
+
+    def row_factors(self, flags: Sequence[bool], organ_type: Optional[str]) -> List[str]:
+        """Labels of the fired rules, given one row's flags for every rule (as RiskFlags.factors)."""
+        labels = self.labels[self._row_for(organ_type)]
+        return [labels[j] for j, fired in enumerate(flags) if fired] or [NO_RISK_FACTORS]
+
+    def _row_for(self, organ_type: Optional[str]) -> int:
+        return self.organ_rows.get(_organ_key(organ_type), self.default_row)
+
+
+def _organ_key(organ_type: Optional[str]) -> str:
+    return str(organ_type or "").strip().lower()
+
+
+def compile_risk_rules(config: dict) -> RiskRuleSet:
+    """
+    Compile a parsed risk-rule config into a RiskRuleSet.
+
+    Each organ starts from the shared rule list and may override a rule's
+    threshold or label by id, or disable it with "enabled": false. Labels are
+    format strings and may reference {threshold}.
+
+    Raises:
+        ValueError: If a rule has an unknown column, operator or id
+    """
+    base_rules = config["rules"]
+    rule_ids = [rule["id"] for rule in base_rules]
+    for rule in base_rules:
+        if rule["column"] not in COLUMN_INDEX:
+            raise ValueError(f"Risk rule '{rule['id']}' has unknown column '{rule['column']}'")
+        if rule.get("op", ">") not in OPERATORS:
+            raise ValueError(f"Risk rule '{rule['id']}' has unknown operator '{rule.get('op')}'")
+
+    default_organ = _organ_key(config.get("default_organ", "kidney"))
+    organs = [_organ_key(organ) for organ in config["organs"] if _organ_key(organ) != default_organ]
+    organs.append(default_organ)
+    overrides_by_organ = {_organ_key(organ): spec for organ, spec in config["organs"].items()}
+
+    thresholds = np.full((len(organs), len(base_rules)), np.nan)
+    labels = np.empty((len(organs), len(base_rules)), dtype=object)
+    for g, organ in enumerate(organs):
+        overrides = overrides_by_organ.get(organ, {}).get("rules", {})
+        unknown = set(overrides) - set(rule_ids)
+        if unknown:
+            raise ValueError(f"{organ}: unknown risk rule(s) {', '.join(sorted(unknown))}")
+        for j, base in enumerate(base_rules):
+            rule = {**copy.deepcopy(base), **overrides.get(base["id"], {})}
+            if rule.get("enabled", True):
+                thresholds[g, j] = float(rule["threshold"])
+            labels[g, j] = rule["label"].format(threshold=float(rule["threshold"]))
+
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+    return RiskRuleSet(
+        rule_ids=rule_ids,
+        columns=np.array([COLUMN_INDEX[rule["column"]] for rule in base_rules], dtype=np.intp),
+        operators=[rule.get("op", ">") for rule in base_rules],
+        organ_rows={organ: g for g, organ in enumerate(organs)},
+        default_row=len(organs) - 1,
+        thresholds=thresholds,
+        labels=labels,
+        version=f"{config.get('version', 'unversioned')}+{digest}",
+    )
+
+
+def load_risk_rules(path: Optional[str] = None) -> RiskRuleSet:
+    """
+    Load and compile risk rules from a JSON config file.
+
+    Args:
+        path: Config path; defaults to $ULTRAVIAB_RISK_RULES or config/risk_rules.json
+
+    Returns:
+        Compiled RiskRuleSet
+    """
+    path = path or os.environ.get(RISK_RULES_ENV) or DEFAULT_RISK_RULES_PATH
+    with open(path, encoding="utf-8") as f:
+        return compile_risk_rules(json.load(f))
+
+
+class RiskRuleProvider:
+    """
+    Serves the compiled rule set for a config file and hot-reloads it.
+
+    The file's modification time is checked at most once per reload interval;
+    a changed file is recompiled and swapped in atomically. A file that fails
+    to compile is logged and the previous rule set stays in service.
+
+    Args:
+        path: Config path; defaults to $ULTRAVIAB_RISK_RULES or config/risk_rules.json
+        reload_seconds: Minimum time between file checks; 0 or less disables reloading
+    """
+    def __init__(self, path: Optional[str] = None, reload_seconds: float = DEFAULT_RELOAD_SECONDS):
+        self.path = Path(path or os.environ.get(RISK_RULES_ENV) or DEFAULT_RISK_RULES_PATH)
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._mtime_ns = self.path.stat().st_mtime_ns
+        self._rules = load_risk_rules(str(self.path))
+        self._checked_at = time.monotonic()
+
+    def current(self) -> RiskRuleSet:
+        if self.reload_seconds > 0 and time.monotonic() - self._checked_at >= self.reload_seconds:
+            self._reload_if_changed()
+        return self._rules
+
+    def _reload_if_changed(self) -> None:
+        # Non-blocking: concurrent callers keep using the current rules meanwhile
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._checked_at = time.monotonic()
+            try:
+                mtime_ns = self.path.stat().st_mtime_ns
+                if mtime_ns == self._mtime_ns:
+                    return
+                # Record the attempt so a broken file is reported once, not on every check
+                self._mtime_ns = mtime_ns
+                rules = load_risk_rules(str(self.path))
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                logger.warning("Keeping risk rules %s: reload of %s failed: %s", self._rules.version, self.path, exc)
+                return
+            self._rules = rules
+            logger.info("Reloaded risk rules %s from %s", rules.version, self.path)
+        finally:
+            self._lock.release()
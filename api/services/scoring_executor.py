@@ -0,0 +1,177 @@
+"""
+Off-event-loop execution of CPU-bound scoring.
+Runs prediction calls inline, on a thread pool (for GIL-releasing models) or on a
+process pool, with a queue-depth limit that rejects work instead of queueing forever.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional
+
+from metrics.registry import REGISTRY, Counter, Gauge
+from schemas.prediction import PredictionRequest, PredictionResponse
+from services.prediction_service import IPredictionService
+from services.scoring_kernel import FeatureBatch, ScoredBatch
+
+EXECUTOR_ENV = "ULTRAVIAB_EXECUTOR"
+EXECUTOR_WORKERS_ENV = "ULTRAVIAB_EXECUTOR_WORKERS"
+MAX_QUEUE_DEPTH_ENV = "ULTRAVIAB_MAX_QUEUE_DEPTH"
+MAX_STREAMS_ENV = "ULTRAVIAB_MAX_STREAMS"
+
+INLINE = "inline"
+THREAD = "thread"
+PROCESS = "process"
+MODES = (INLINE, THREAD, PROCESS)
+
+QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "ultraviab_executor_queue_depth", "Scoring calls queued or running on the executor."
+))
+REJECTED = REGISTRY.register(Counter(
+    "ultraviab_executor_rejected_total", "Scoring calls and bulk streams rejected because the queue was full."
+))
+ACTIVE_STREAMS = REGISTRY.register(Gauge(
+    "ultraviab_executor_streams", "Bulk scoring streams (/predict/stream, /predict/columnar) in progress."
+))
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the scoring queue is at its depth limit."""
+
+
+# Service used inside process-pool workers (inherited warm through fork)
+_worker_service: Optional[IPredictionService] = None
+
+
+def _init_worker(service_factory: Callable[[], IPredictionService]) -> None:
+    global _worker_service
+    _worker_service = service_factory()
+
+
+def _worker_predict(request: PredictionRequest) -> PredictionResponse:
+    return _worker_service.predict(request)
+
+
+def _worker_predict_batch(requests: List[PredictionRequest]) -> List[PredictionResponse]:
+    return _worker_service.predict_batch(requests)
+
+
+def _worker_score_batch(batch: FeatureBatch) -> ScoredBatch:
+    return _worker_service.score_batch(batch)
+
+
+def _worker_explain_batch(batch: FeatureBatch) -> ScoredBatch:
+    return _worker_service.score_batch(batch, explain=True)
+
+
+class ScoringExecutor:
+    """
+    Async front for prediction calls with backpressure.
+
+    Args:
+        service: Service used inline and by thread workers
+        service_factory: Module-level callable building the service in process workers
+        mode: "inline", "thread" or "process"
+        workers: Pool size (ignored inline)
+        max_queue_depth: Calls allowed to be queued or running before rejecting
+        max_streams: Bulk scoring streams allowed at once before rejecting (default: workers)
+    """
+    def __init__(
+        self,
+        service: IPredictionService,
+        service_factory: Callable[[], IPredictionService],
+        mode: str = INLINE,
+        workers: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        max_streams: Optional[int] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Executor mode must be one of {MODES}, got '{mode}'")
+        self.service = service
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue_depth = max_queue_depth or self.workers * 8
+        self.max_streams = max_streams or self.workers
+        self._depth = 0
+        self._streams = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        if mode == THREAD:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="scoring")
+        elif mode == PROCESS:
+            # fork shares the already-loaded service/model copy-on-write with workers
+            context = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+            self._pool = ProcessPoolExecutor(
+                self.workers, mp_context=context,
+                initializer=_init_worker, initargs=(service_factory,)
+            )
+            # Fork every worker now, before the server starts its threads
+            self._pool.submit(os.getpid).result()
+
+    async def predict(self, request: PredictionRequest) -> PredictionResponse:
+        return await self._submit(self.service.predict, _worker_predict, request)
+
+    async def predict_batch(self, requests: List[PredictionRequest]) -> List[PredictionResponse]:
+        return await self._submit(self.service.predict_batch, _worker_predict_batch, requests)
+
+    async def score_batch(self, batch: FeatureBatch, explain: bool = False) -> ScoredBatch:
+        if explain:
+            return await self._submit(partial(self.service.score_batch, explain=True), _worker_explain_batch, batch)
+        return await self._submit(self.service.score_batch, _worker_score_batch, batch)
+
+    async def _submit(self, local_fn: Callable, worker_fn: Callable, payload):
+        if self.mode == INLINE:
+            return local_fn(payload)
+
+        with self._lock:
+            if self._depth >= self.max_queue_depth:
+                REJECTED.inc()
+                raise ExecutorSaturatedError(f"Scoring queue is full ({self.max_queue_depth} pending)")
+            self._depth += 1
+            QUEUE_DEPTH.inc()
+        try:
+            fn = worker_fn if self.mode == PROCESS else local_fn
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, payload)
+        finally:
+            with self._lock:
+                self._depth -= 1
+                QUEUE_DEPTH.dec()
+
+    def reserve_stream(self) -> Callable[[], None]:
+        """
+        Take a bulk-stream slot for the length of a streamed response. Bulk
+        streams score on the server's threadpool rather than through the
+        queue, so they are limited separately, in every mode.
+
+        Returns:
+            Callable giving the slot back; calls after the first do nothing
+
+        Raises:
+            ExecutorSaturatedError: If max_streams streams are already in progress
+        """
+        with self._lock:
+            if self._streams >= self.max_streams:
+                REJECTED.inc()
+                raise ExecutorSaturatedError(f"Too many bulk scoring streams ({self.max_streams} in progress)")
+            self._streams += 1
+            ACTIVE_STREAMS.inc()
+        held = [True]
+
+        def release() -> None:
+            with self._lock:
+                if held:
+                    held.clear()
+                    self._streams -= 1
+                    ACTIVE_STREAMS.dec()
+
+        return release
+
+    @property
+    def queue_depth(self) -> int:
+        return self._depth
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,283 @@
+"""
+Vectorized scoring kernel.
+Turns prediction requests into a columnar float array and scores whole batches
+with NumPy, so N organs cost one pass instead of N Python loops.
+"""
+import math
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Numeric PredictionRequest fields, in matrix column order.
+NUMERIC_FIELDS = (
+    "tissue_stiffness_kpa",
+    "resistive_index",
+    "shear_wave_velocity_ms",
+    "perfusion_uniformity_pct",
+    "echogenicity_grade",
+    "edema_index",
+    "cold_ischemia_hours",
+    "donor_age",
+    "kdpi_percentile",
+    "warm_ischemia_minutes",
+)
+COLUMN_INDEX = {name: i for i, name in enumerate(NUMERIC_FIELDS)}
+
+# Numeric fields every request must carry; the others are NaN when absent.
+REQUIRED_FIELDS = tuple(name for name in NUMERIC_FIELDS if name != "kdpi_percentile")
+REQUIRED_COLUMNS = [COLUMN_INDEX[name] for name in REQUIRED_FIELDS]
+_required_values = itemgetter(*REQUIRED_COLUMNS)
+
+CLASSIFICATION_LABELS = np.array(["Decline", "Marginal", "Accept"])
+
+NO_RISK_FACTORS = "No significant risk factors identified"
+
+# Decimal places of the per-feature contributions in every response format
+CONTRIBUTION_DECIMALS = 4
+
+# Distinct values factorize() separates by vectorized comparison before falling back to a dict
+FACTORIZE_MAX_PASSES = 16
+
+
+@dataclass
+class FeatureBatch:
+    """Columnar view of a batch of prediction requests."""
+    values: np.ndarray           # (n, len(NUMERIC_FIELDS)) float64, NaN = missing
+    organ_types: np.ndarray      # (n,) object
+    causes_of_death: np.ndarray  # (n,) object
+    # Distinct organ_types values and each row's index into them; built on first use
+    organ_codes: Optional[Tuple[list, np.ndarray]] = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[:, COLUMN_INDEX[name]]
+
+    def organ_groups(self) -> Tuple[list, np.ndarray]:
+        """
+        Factorize organ types once per batch, for per-organ plan and rule lookups.
+
+        Returns:
+            (distinct organ_types values, (n,) intp index of each row's value)
+        """
+        if self.organ_codes is None:
+            self.organ_codes = factorize(self.organ_types)
+        return self.organ_codes
+
+    def take(self, rows: np.ndarray) -> "FeatureBatch":
+        """Return a new batch holding only the given rows."""
+        organ_codes = None
+        if self.organ_codes is not None:
+            organ_codes = (self.organ_codes[0], self.organ_codes[1][rows])
+        return FeatureBatch(
+            values=self.values[rows],
+            organ_types=self.organ_types[rows],
+            causes_of_death=self.causes_of_death[rows],
+            organ_codes=organ_codes,
+        )
+
+
+def factorize(values: np.ndarray) -> Tuple[list, np.ndarray]:
+    """
+    Distinct values of an object column and each row's index into them.
+
+    Organ columns hold a handful of distinct values, so each is peeled off with
+    one vectorized comparison; only an unusually diverse remainder falls back to
+    a per-row dict lookup.
+    """
+    n = len(values)
+    distinct: list = []
+    codes = np.empty(n, dtype=np.intp)
+    remaining = np.arange(n)
+    while remaining.size and len(distinct) < FACTORIZE_MAX_PASSES:
+        value = values[remaining[0]]
+        hit = values[remaining] == value
+        codes[remaining[hit]] = len(distinct)
+        distinct.append(value)
+        remaining = remaining[~hit]
+    if remaining.size:
+        index = {value: k for k, value in enumerate(distinct)}
+        codes[remaining] = np.fromiter(
+            (index.setdefault(value, len(index)) for value in values[remaining]),
+            dtype=np.intp, count=remaining.size,
+        )
+        distinct = list(index)
+    return distinct, codes
+
+
+@dataclass
+class RiskFlags:
+    """Risk rules flagged per row, with the label each rule carries for that row's organ."""
+    masks: np.ndarray       # (n, rules) bool
+    labels: np.ndarray      # (organs, rules) object - label table
+    label_rows: np.ndarray  # (n,) intp - label table row per input row
+
+    def factors(self, row: int) -> List[str]:
+        labels = self.labels[self.label_rows[row]]
+        flagged = [labels[j] for j in np.flatnonzero(self.masks[row])]
+        return flagged or [NO_RISK_FACTORS]
+
+
+@dataclass
+class ScoredBatch:
+    """Vectorized scoring output, one entry per input row."""
+    scores: np.ndarray           # (n,) int64
+    classifications: np.ndarray  # (n,) str
+    confidences: np.ndarray      # (n,) float64
+    risk_flags: RiskFlags
+    contributions: Optional[np.ndarray] = None  # (n, len(contribution_names)) float64, if explained
+    contribution_names: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
+
+    def risk_factors(self, row: int) -> List[str]:
+        return self.risk_flags.factors(row)
+
+    def feature_contributions(self, row: int) -> Dict[str, float]:
+        """Per-feature contributions of one row, rounded for responses ({} if not explained)."""
+        if self.contributions is None:
+            return {}
+        return dict(zip(self.contribution_names, round_contributions(self.contributions[row]).tolist()))
+
+
+def requests_to_batch(requests: Sequence) -> FeatureBatch:
+    """
+    Build a FeatureBatch from request objects exposing PredictionRequest fields.
+
+    Args:
+        requests: Sequence of PredictionRequest-like objects
+
+    Returns:
+        FeatureBatch with one row per request, in input order
+
+    Raises:
+        ValueError: If a request has a NaN or infinite value
+    """
+    n = len(requests)
+    values = np.empty((n, len(NUMERIC_FIELDS)), dtype=np.float64)
+    for j, name in enumerate(NUMERIC_FIELDS):
+        values[:, j] = [_as_float(getattr(r, name)) for r in requests]
+    _check_finite(values)
+    return FeatureBatch(
+        values=values,
+        organ_types=np.array([r.organ_type for r in requests], dtype=object),
+        causes_of_death=np.array([r.cause_of_death for r in requests], dtype=object),
+    )
+
+
+def columns_to_batch(columns: Mapping[str, Sequence]) -> FeatureBatch:
+    """
+    Build a FeatureBatch from column arrays keyed by PredictionRequest field name.
+
+    Args:
+        columns: Every numeric field plus organ_type and cause_of_death
+
+    Returns:
+        FeatureBatch sharing row order with the columns
+    """
+    values = np.column_stack([
+        np.asarray(columns[name], dtype=np.float64) for name in NUMERIC_FIELDS
+    ])
+    return FeatureBatch(
+        values=values,
+        organ_types=np.asarray(columns["organ_type"], dtype=object),
+        causes_of_death=np.asarray(columns["cause_of_death"], dtype=object),
+    )
+
+
+def _as_float(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+def request_values(request) -> np.ndarray:
+    """Single request as a (1, len(NUMERIC_FIELDS)) matrix; raises ValueError on a NaN or infinite value."""
+    row = [_as_float(getattr(request, name)) for name in NUMERIC_FIELDS]
+    values = np.array([row])
+    if not all(map(math.isfinite, _required_values(row))) or any(map(math.isinf, row)):
+        raise _non_finite_error(values)
+    return values
+
+
+def _check_finite(values: np.ndarray) -> None:
+    """
+    Refuse rows that would otherwise be scored from NaN or infinity. NaN is
+    only the missing marker for optional fields, which requests leave as None.
+    """
+    if np.isinf(values).any() or np.isnan(values[:, REQUIRED_COLUMNS]).any():
+        raise _non_finite_error(values)
+
+
+def _non_finite_error(values: np.ndarray) -> ValueError:
+    invalid = np.isinf(values)
+    invalid[:, REQUIRED_COLUMNS] |= np.isnan(values[:, REQUIRED_COLUMNS])
+    row, column = np.argwhere(invalid)[0]
+    return ValueError(f"Request {row} has a non-finite {NUMERIC_FIELDS[column]}")
+
+
+def round_contributions(contributions: np.ndarray) -> np.ndarray:
+    """
+    Per-feature contributions as responses report them. Every response format
+    rounds through here, so JSON and columnar results carry identical values.
+    """
+    return np.round(contributions, CONTRIBUTION_DECIMALS)
+
+
+def to_scores(raw_scores: np.ndarray) -> np.ndarray:
+    """
+    Scale [0, 1] weighted sums to integer 0-100 scores.
+
+    Rounding to 9 decimals before truncating keeps scores independent of
+    floating-point summation order (a 0.7 sum must never become 69).
+
+    Raises:
+        ValueError: If any raw score is NaN or infinite
+    """
+    if not np.isfinite(raw_scores).all():
+        raise ValueError("Cannot score non-finite assessment values")
+    return np.floor(np.round(raw_scores * 100, 9)).astype(np.int64)
+
+
+def classify(scores: np.ndarray, cutoffs: np.ndarray) -> np.ndarray:
+    """
+    Map 0-100 scores to Decline / Marginal / Accept labels.
+
+    Args:
+        scores: (n,) integer scores
+        cutoffs: (2,) or (n, 2) Marginal and Accept thresholds
+    """
+    level = (scores[:, None] >= np.atleast_2d(cutoffs)).sum(axis=1)
+    return CLASSIFICATION_LABELS[level]
+
+
+def score_batch(batch: FeatureBatch, plans, risk_rules, confidence: float, explain: bool = False) -> ScoredBatch:
+    """
+    Score a whole batch: normalization, weighted sum, classification and risk flags.
+
+    Args:
+        batch: Columnar request data
+        plans: ScoringPlanSet selecting coefficients per organ type
+        risk_rules: RiskRuleSet flagging risk factors per organ type
+        confidence: Confidence reported for every row
+        explain: Also return per-feature contributions, from the same normalization
+
+    Returns:
+        ScoredBatch aligned with the input rows
+    """
+    contributions = None
+    if explain:
+        raw_scores, contributions = plans.explain(batch)
+    else:
+        raw_scores = plans.score(batch)
+    scores = to_scores(raw_scores)
+    return ScoredBatch(
+        scores=scores,
+        classifications=classify(scores, plans.thresholds(batch)),
+        confidences=np.full(len(batch), confidence),
+        risk_flags=risk_rules.evaluate(batch),
+        contributions=contributions,
+        contribution_names=list(plans.feature_names) if explain else None,
+    )
@@ -0,0 +1,250 @@
+"""
+Per-organ scoring plans.
+Normalization ranges and weights are read once from config/scoring_plans.json and
+compiled into flat coefficient arrays, so scoring a row is one clip and one dot
+product no matter how many organs are configured.
+"""
+import copy
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.scoring_kernel import COLUMN_INDEX, FeatureBatch
+
+SCORING_PLANS_ENV = "ULTRAVIAB_SCORING_PLANS"
+DEFAULT_SCORING_PLANS_PATH = Path(__file__).resolve().parent.parent / "config" / "scoring_plans.json"
+
+
+@dataclass
+class ScoringPlan:
+    """
+    Compiled scoring plan for one organ type.
+
+    A feature's normalized value is clip(x * scale + offset, 0, 1). Inverted
+    features and constant features are folded into negative coefficients and
+    the intercept, so raw_score = clipped @ coefficients + intercept.
+
+    Per-feature contributions (weight x normalized value, in feature_names order)
+    come from the same clipped matrix: clipped * coefficients + term_bias, scattered
+    into feature columns, plus constant_terms for the constant features.
+    """
+    organ: str
+    feature_names: List[str]
+    weights: Dict[str, float]
+    columns: np.ndarray         # (k,) int - source column per scaled feature
+    scale: np.ndarray           # (k,) float
+    offset: np.ndarray          # (k,) float
+    fill_values: np.ndarray     # (k,) float - NaN replacement, NaN if required
+    coefficients: np.ndarray    # (k,) float
+    intercept: float
+    thresholds: np.ndarray      # (2,) Marginal and Accept cut-offs
+    term_bias: np.ndarray       # (k,) float - weight of inverted features, else 0
+    term_index: np.ndarray      # (k,) int - position of each scaled feature in feature_names
+    constant_terms: np.ndarray  # (len(feature_names),) float - contribution of constant features
+
+    @classmethod
+    def compile(cls, organ: str, features: List[dict], thresholds: Dict[str, float]) -> "ScoringPlan":
+        """
+        Compile a feature specification list into coefficient arrays.
+
+        Raises:
+            ValueError: If a feature references an unknown column or an empty range
+        """
+        weights, columns, scale, offset, fill, coefficients = {}, [], [], [], [], []
+        term_bias, term_index = [], []
+        constant_terms = np.zeros(len(features))
+        intercept = 0.0
+        for position, spec in enumerate(features):
+            name, weight = spec["name"], float(spec["weight"])
+            weights[name] = weight
+            if "constant" in spec:
+                constant_terms[position] = weight * float(spec["constant"])
+                intercept += constant_terms[position]
+                continue
+            column = spec.get("column")
+            if column not in COLUMN_INDEX:
+                raise ValueError(f"{organ}: feature '{name}' has unknown column '{column}'")
+            lo, hi = float(spec["min"]), float(spec["max"])
+            if hi <= lo:
+                raise ValueError(f"{organ}: feature '{name}' needs max > min")
+            columns.append(COLUMN_INDEX[column])
+            scale.append(1.0 / (hi - lo))
+            offset.append(-lo / (hi - lo))
+            fill.append(float(spec.get("missing", np.nan)))
+            term_index.append(position)
+            if spec.get("invert", False):
+                # w * (1 - v) == w - w * v
+                coefficients.append(-weight)
+                term_bias.append(weight)
+                intercept += weight
+            else:
+                coefficients.append(weight)
+                term_bias.append(0.0)
+
+        return cls(
+            organ=organ,
+            feature_names=[spec["name"] for spec in features],
+            weights=weights,
+            columns=np.array(columns, dtype=np.intp),
+            scale=np.array(scale),
+            offset=np.array(offset),
+            fill_values=np.array(fill),
+            coefficients=np.array(coefficients),
+            intercept=intercept,
+            thresholds=np.array([thresholds["Marginal"], thresholds["Accept"]]),
+            term_bias=np.array(term_bias),
+            term_index=np.array(term_index, dtype=np.intp),
+            constant_terms=constant_terms,
+        )
+
+    def normalize(self, values: np.ndarray) -> np.ndarray:
+        """Clipped [0, 1] normalized values of the scaled features, (n, k)."""
+        x = values[:, self.columns]
+        x = np.where(np.isnan(x), self.fill_values, x)
+        return np.clip(x * self.scale + self.offset, 0.0, 1.0)
+
+    def raw_scores(self, values: np.ndarray) -> np.ndarray:
+        """Weighted viability in [0, 1] for each row of a (n, NUMERIC_FIELDS) matrix."""
+        return self.normalize(values) @ self.coefficients + self.intercept
+
+    def explain(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Raw scores and per-feature contributions from a single normalization.
+
+        Returns:
+            ((n,) raw scores, (n, len(feature_names)) contributions summing to the raw scores)
+        """
+        clipped = self.normalize(values)
+        raw = clipped @ self.coefficients + self.intercept
+        contributions = np.broadcast_to(self.constant_terms, (len(values), len(self.constant_terms))).copy()
+        contributions[:, self.term_index] = clipped * self.coefficients + self.term_bias
+        return raw, contributions
+
+
+class ScoringPlanSet:
+    """All compiled plans plus the fallback used for unconfigured organ types."""
+
+    def __init__(self, plans: Dict[str, ScoringPlan], default_organ: str, version: str):
+        if default_organ not in plans:
+            raise ValueError(f"Default organ '{default_organ}' has no scoring plan")
+        self.plans = plans
+        self.default = plans[default_organ]
+        self.version = version
+        # Contributions of mixed-organ batches share one column layout
+        self.feature_names = self.default.feature_names
+        for plan in plans.values():
+            if plan.feature_names != self.feature_names:
+                raise ValueError(f"{plan.organ}: every organ plan must list the same features in the same order")
+
+    def plan_for(self, organ_type: Optional[str]) -> ScoringPlan:
+        """Return the plan for an organ type (case-insensitive), or the default plan."""
+        return self.plans.get(_organ_key(organ_type), self.default)
+
+    def score(self, batch: FeatureBatch) -> np.ndarray:
+        """
+        Compute raw scores for a batch that may mix organ types.
+
+        Returns:
+            (n,) float array of weighted viability in [0, 1]
+        """
+        groups = self._group_rows(batch)
+        if len(groups) == 1:
+            plan, _ = groups[0]
+            return plan.raw_scores(batch.values)
+        raw = np.empty(len(batch))
+        for plan, rows in groups:
+            raw[rows] = plan.raw_scores(batch.values[rows])
+        return raw
+
+    def explain(self, batch: FeatureBatch) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Raw scores and per-feature contributions for a batch that may mix organ types.
+
+        Returns:
+            ((n,) raw scores, (n, len(feature_names)) contributions)
+        """
+        groups = self._group_rows(batch)
+        if len(groups) == 1:
+            plan, _ = groups[0]
+            return plan.explain(batch.values)
+        raw = np.empty(len(batch))
+        contributions = np.empty((len(batch), len(self.feature_names)))
+        for plan, rows in groups:
+            raw[rows], contributions[rows] = plan.explain(batch.values[rows])
+        return raw, contributions
+
+    def thresholds(self, batch: FeatureBatch) -> np.ndarray:
+        """(n, 2) classification cut-offs matching each row's organ plan."""
+        cutoffs = np.empty((len(batch), 2))
+        for plan, rows in self._group_rows(batch):
+            cutoffs[rows] = plan.thresholds
+        return cutoffs
+
+    def _group_rows(self, batch: FeatureBatch) -> list:
+        organs, codes = batch.organ_groups()
+        if len(organs) <= 1:
+            return [(self.plan_for(organs[0] if organs else None), slice(None))]
+        # Organ spellings sharing a plan ("Kidney", "kidney ", unknown -> default) form one group
+        groups: Dict[int, int] = {}
+        plans: List[ScoringPlan] = []
+        organ_group = np.empty(len(organs), dtype=np.intp)
+        for k, organ in enumerate(organs):
+            plan = self.plan_for(organ)
+            if id(plan) not in groups:
+                groups[id(plan)] = len(plans)
+                plans.append(plan)
+            organ_group[k] = groups[id(plan)]
+        if len(plans) == 1:
+            return [(plans[0], slice(None))]
+        row_group = organ_group[codes]
+        return [(plan, np.flatnonzero(row_group == g)) for g, plan in enumerate(plans)]
+
+
+def _organ_key(organ_type: Optional[str]) -> str:
+    return str(organ_type or "").strip().lower()
+
+
+def compile_scoring_plans(config: dict) -> ScoringPlanSet:
+    """
+    Compile a parsed scoring-plan config into a ScoringPlanSet.
+
+    Each organ starts from the shared feature list and may override any feature's
+    fields by name, or replace the classification thresholds. The set's version
+    combines the declared version with a digest of the config, so any edit to
+    weights or ranges yields a new version.
+    """
+    base_features = config["features"]
+    base_thresholds = config.get("classification_thresholds", {"Marginal": 40, "Accept": 70})
+    plans = {}
+    for organ, overrides in config["organs"].items():
+        features = copy.deepcopy(base_features)
+        for spec in features:
+            spec.update(overrides.get("features", {}).get(spec["name"], {}))
+        thresholds = {**base_thresholds, **overrides.get("classification_thresholds", {})}
+        plans[_organ_key(organ)] = ScoringPlan.compile(organ, features, thresholds)
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+    return ScoringPlanSet(
+        plans,
+        default_organ=_organ_key(config.get("default_organ", "kidney")),
+        version=f"{config.get('version', 'unversioned')}+{digest}",
+    )
+
+
+def load_scoring_plans(path: Optional[str] = None) -> ScoringPlanSet:
+    """
+    Load and compile scoring plans from a JSON config file.
+
+    Args:
+        path: Config path; defaults to $ULTRAVIAB_SCORING_PLANS or config/scoring_plans.json
+
+    Returns:
+        Compiled ScoringPlanSet
+    """
+    path = path or os.environ.get(SCORING_PLANS_ENV) or DEFAULT_SCORING_PLANS_PATH
+    with open(path, encoding="utf-8") as f:
+        return compile_scoring_plans(json.load(f))
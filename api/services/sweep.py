@@ -0,0 +1,89 @@
+"""
+What-if sweeps: score a one- or two-variable grid around a base assessment.
+The whole grid is built as one FeatureBatch and scored in a single vectorized call.
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from schemas.sweep import SweepAxis, SweepRequest, SweepResponse
+from services import scoring_kernel
+from services.scoring_kernel import CLASSIFICATION_LABELS, COLUMN_INDEX, FeatureBatch, ScoredBatch
+
+
+def axis_values(axis: SweepAxis) -> np.ndarray:
+    return np.linspace(axis.start, axis.stop, axis.steps)
+
+
+def sweep_batch(request: SweepRequest) -> Tuple[FeatureBatch, np.ndarray, Optional[np.ndarray]]:
+    """
+    Expand a sweep request into one batch row per grid point, y-major.
+
+    Args:
+        request: Base assessment and swept axes
+
+    Returns:
+        (batch, x values, y values or None)
+    """
+    x_values = axis_values(request.x)
+    y_values = axis_values(request.y) if request.y is not None else None
+    n_rows = len(x_values) * (len(y_values) if y_values is not None else 1)
+
+    values = np.repeat(scoring_kernel.request_values(request.base), n_rows, axis=0)
+    if y_values is None:
+        values[:, COLUMN_INDEX[request.x.field]] = x_values
+    else:
+        grid_y, grid_x = np.meshgrid(y_values, x_values, indexing="ij")
+        values[:, COLUMN_INDEX[request.x.field]] = grid_x.ravel()
+        values[:, COLUMN_INDEX[request.y.field]] = grid_y.ravel()
+
+    batch = FeatureBatch(
+        values=values,
+        organ_types=np.full(n_rows, request.base.organ_type, dtype=object),
+        causes_of_death=np.full(n_rows, request.base.cause_of_death, dtype=object),
+    )
+    return batch, x_values, y_values
+
+
+def sweep_response(
+    request: SweepRequest,
+    scored: ScoredBatch,
+    x_values: np.ndarray,
+    y_values: Optional[np.ndarray],
+    cutoffs: Optional[Dict[str, float]],
+    scoring_version: str,
+) -> SweepResponse:
+    """
+    Reshape a scored grid into score and class-code matrices.
+
+    Args:
+        request: The sweep that produced the batch
+        scored: Scores for the batch built by sweep_batch
+        x_values: Swept x values
+        y_values: Swept y values, or None for a one-variable sweep
+        cutoffs: Classification cut-offs for the base organ, if score-based
+        scoring_version: Version of the weights or model that scored the grid
+
+    Returns:
+        SweepResponse with one matrix row per y value
+    """
+    shape = (len(y_values) if y_values is not None else 1, len(x_values))
+
+    classifications = np.asarray(scored.classifications).astype(str)
+    labels = list(CLASSIFICATION_LABELS)
+    labels += sorted(set(np.unique(classifications)) - set(labels))
+    index = {label: i for i, label in enumerate(labels)}
+    observed, inverse = np.unique(classifications, return_inverse=True)
+    codes = np.array([index[label] for label in observed])[inverse]
+
+    return SweepResponse(
+        x_field=request.x.field,
+        x_values=x_values.tolist(),
+        y_field=request.y.field if request.y is not None else None,
+        y_values=y_values.tolist() if y_values is not None else None,
+        scores=scored.scores.reshape(shape).tolist(),
+        classes=codes.reshape(shape).tolist(),
+        labels=labels,
+        cutoffs=cutoffs,
+        scoring_version=scoring_version,
+    )
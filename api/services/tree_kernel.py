@@ -0,0 +1,127 @@
+"""
+Flat tree-ensemble inference kernel.
+A trained random forest is flattened into contiguous node arrays and evaluated
+with NumPy alone: every (row, tree) pair advances one level per step, so a
+single organ costs a few dozen array operations instead of one scikit-learn
+call per tree.
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+# Rows traversed together; bounds the (rows, trees) working set to a few MB
+DEFAULT_BLOCK_ROWS = 4096
+
+# Finished (row, tree) pairs are dropped from the working set every this many levels
+COMPACT_EVERY = 4
+
+
+@dataclass
+class FlatForest:
+    """
+    A tree ensemble as one flat node table.
+
+    Nodes are numbered breadth-first per tree with siblings adjacent, so the
+    right child of node i is left[i] + 1 and a step is "node = left[node] +
+    goes_right". Leaves point to themselves with an infinite threshold, so a
+    pair that reached its leaf stays there and the traversal needs no leaf
+    checks. Exposes the predict / predict_proba / classes_ /
+    feature_importances_ surface ModelPredictionService uses, so a FlatForest
+    drops into a model artifact in place of the scikit-learn model.
+    """
+    feature: np.ndarray            # (nodes,) intp, split feature (0 on leaves)
+    threshold: np.ndarray          # (nodes,) float32, largest float32 <= the float64 split threshold
+    left: np.ndarray               # (nodes,) intp, left child (self on leaves); right child is left + 1
+    missing_left: np.ndarray       # (nodes,) bool, where NaN goes (True on leaves)
+    value: np.ndarray              # (nodes,) regression value or (nodes, classes) class fractions
+    roots: np.ndarray              # (trees,) intp, root node of each tree
+    max_depth: int
+    n_features_in_: int
+    classes_: Optional[np.ndarray] = None
+    feature_importances_: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """
+        Leaf reached by every row in every tree.
+
+        Args:
+            X: (n, n_features_in_) feature matrix
+
+        Returns:
+            (n, trees) intp node indices
+
+        Raises:
+            ValueError: If X has the wrong number of columns
+        """
+        X = self._validate(X)
+        leaves = np.empty((X.shape[0], self.n_trees), dtype=np.intp)
+        for start in range(0, X.shape[0], DEFAULT_BLOCK_ROWS):
+            block = X[start:start + DEFAULT_BLOCK_ROWS]
+            leaves[start:start + len(block)] = self._apply_block(block)
+        return leaves
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Forest prediction: mean leaf value (regression) or most probable class."""
+        if self.classes_ is not None:
+            return self.classes_[self.predict_proba(X).argmax(axis=1)]
+        return self._mean_leaf_value(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities averaged over the trees.
+
+        Raises:
+            AttributeError: If the forest is a regressor
+        """
+        if self.classes_ is None:
+            raise AttributeError("predict_proba is only available on classifiers")
+        return self._mean_leaf_value(X)
+
+    def _validate(self, X: np.ndarray) -> np.ndarray:
+        # scikit-learn compares float32 feature values; thresholds are rounded down to float32 to match
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected (n, {self.n_features_in_}) features, got {X.shape}")
+        return X
+
+    def _apply_block(self, X: np.ndarray) -> np.ndarray:
+        n, n_features = X.shape
+        flat = X.ravel()
+        has_missing = bool(np.isnan(flat).any())
+        # Active (row, tree) pairs: their slot in the (n, trees) output, row offset into flat, node
+        slot = np.arange(n * self.n_trees, dtype=np.intp)
+        offset = np.repeat(np.arange(n, dtype=np.intp) * n_features, self.n_trees)
+        node = np.tile(self.roots, n)
+        leaves = np.empty(n * self.n_trees, dtype=np.intp)
+        for depth in range(1, self.max_depth + 1):
+            x = flat[offset + self.feature[node]]
+            goes_right = x > self.threshold[node]
+            if has_missing:
+                goes_right |= np.isnan(x) & ~self.missing_left[node]
+            node = self.left[node] + goes_right
+            if depth % COMPACT_EVERY == 0 and depth < self.max_depth:
+                done = self.left[node] == node
+                leaves[slot[done]] = node[done]
+                active = ~done
+                slot, offset, node = slot[active], offset[active], node[active]
+        leaves[slot] = node
+        return leaves.reshape(n, self.n_trees)
+
+    def _mean_leaf_value(self, X: np.ndarray) -> np.ndarray:
+        X = self._validate(X)
+        total = np.empty((X.shape[0],) + self.value.shape[1:], dtype=np.float64)
+        for start in range(0, X.shape[0], DEFAULT_BLOCK_ROWS):
+            leaves = self._apply_block(X[start:start + DEFAULT_BLOCK_ROWS])
+            # cumsum adds tree by tree in estimator order, exactly as scikit-learn's predict accumulates
+            total[start:start + len(leaves)] = np.cumsum(self.value[leaves], axis=1)[:, -1]
+        total /= self.n_trees
+        return total
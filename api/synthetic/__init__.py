@@ -0,0 +1,32 @@
+"""
+Synthetic organ cohorts for training, benchmarks and load tests.
+
+    python -m synthetic --rows 100000000 --out data/cohort --workers 8
+"""
+from .generator import (
+    DEFAULT_CHUNK_ROWS,
+    DEFAULT_SEED,
+    TARGET_CLASS,
+    TARGET_SCORE,
+    CohortChunk,
+    generate_chunk,
+    generate_cohort,
+    iter_chunks,
+    write_cohort,
+)
+from .profiles import CAUSES_OF_DEATH, ORGAN_PROFILES, OrganProfile
+
+__all__ = [
+    "CohortChunk",
+    "generate_chunk",
+    "generate_cohort",
+    "iter_chunks",
+    "write_cohort",
+    "DEFAULT_CHUNK_ROWS",
+    "DEFAULT_SEED",
+    "TARGET_SCORE",
+    "TARGET_CLASS",
+    "OrganProfile",
+    "ORGAN_PROFILES",
+    "CAUSES_OF_DEATH",
+]
@@ -0,0 +1,285 @@
+"""
+Reproducible synthetic cohort generation.
+Every PredictionRequest field is sampled per organ type from a numpy Generator.
+Large cohorts are split into fixed-size chunks, each with its own spawned
+SeedSequence, and written as separate part files by a pool of worker processes:
+the output depends only on (seed, rows, chunk_rows), never on the worker count
+or completion order, and peak memory is one chunk per worker.
+"""
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from services.scoring_kernel import NUMERIC_FIELDS
+from synthetic.profiles import CAUSES_OF_DEATH, ORGAN_PROFILES, profile_table
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+GENERATOR_VERSION = "2"
+
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+# Ground-truth label columns (kept apart from the scorer's own output columns)
+TARGET_SCORE = "target_viability_score"
+TARGET_CLASS = "target_classification"
+TARGET_CUTOFFS = (40, 70)  # Marginal, Accept - as in the rule-based plans
+TARGET_LABELS = ("Decline", "Marginal", "Accept")
+
+# Ceilings: the longest plausible cold storage, and the top of a shear-wave elastography scale
+MAX_COLD_ISCHEMIA_HOURS = 72.0
+MAX_STIFFNESS_KPA = 75.0
+
+# Integer-valued request fields; kdpi is float in memory only so it can hold NaN
+INTEGER_FIELDS = ("echogenicity_grade", "donor_age", "kdpi_percentile")
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+# Leading underscore: Arrow dataset discovery skips it when reading the part files
+MANIFEST_FILENAME = "_manifest.json"
+
+COLUMN_ORDER = ("organ_type",) + NUMERIC_FIELDS + ("cause_of_death", TARGET_SCORE, TARGET_CLASS)
+
+Seed = Union[int, np.random.SeedSequence]
+
+
+@dataclass
+class CohortChunk:
+    """One generated chunk: numeric columns plus dictionary-coded categorical columns."""
+    numeric: Dict[str, np.ndarray]
+    categorical: Dict[str, Tuple[Tuple[str, ...], np.ndarray]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.numeric.values())))
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name in COLUMN_ORDER if name in self.numeric or name in self.categorical]
+
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """Columns keyed by field name, categoricals decoded to object arrays (see columns_to_batch)."""
+        columns = {}
+        for name in self.names:
+            if name in self.categorical:
+                categories, codes = self.categorical[name]
+                columns[name] = np.array(categories, dtype=object)[codes]
+            else:
+                columns[name] = self.numeric[name]
+        return columns
+
+    def to_record_batch(self) -> "pa.RecordBatch":
+        """Arrow record batch: categoricals dictionary-encoded, missing KDPI as nulls."""
+        import pyarrow as pa
+
+        arrays = []
+        for name in self.names:
+            if name in self.categorical:
+                categories, codes = self.categorical[name]
+                arrays.append(pa.DictionaryArray.from_arrays(pa.array(codes.astype(np.int8)), pa.array(categories)))
+            elif self.numeric[name].dtype.kind == "f" and name in INTEGER_FIELDS:
+                values = self.numeric[name]
+                missing = np.isnan(values)
+                arrays.append(pa.array(np.where(missing, 0, values).astype(np.int64), mask=missing))
+            else:
+                arrays.append(pa.array(self.numeric[name]))
+        return pa.RecordBatch.from_arrays(arrays, names=self.names)
+
+
+def generate_chunk(rows: int, seed: Seed = DEFAULT_SEED, organ_type: Optional[str] = None) -> CohortChunk:
+    """
+    Sample one chunk of a synthetic cohort.
+
+    Args:
+        rows: Number of organs
+        seed: Integer seed or a spawned SeedSequence
+        organ_type: Restrict to one organ; by default organs follow the profile shares
+
+    Returns:
+        CohortChunk with every PredictionRequest field plus the ground-truth target
+    """
+    rng = np.random.default_rng(seed)
+    organs = tuple(ORGAN_PROFILES) if organ_type is None else (_profile_name(organ_type),)
+    table = profile_table(organs)
+    shares = table["share"] / table["share"].sum()
+    organ = rng.choice(len(organs), size=rows, p=shares)
+    per_row = {name: values[organ] for name, values in table.items()}
+
+    # Donor and procurement
+    donor_age = np.clip(np.rint(rng.normal(45, 15, rows)), 1, 85)
+    cumulative = np.cumsum(per_row["cause_weights"], axis=1)
+    cause = (rng.random(rows)[:, None] > cumulative[:, :-1]).sum(axis=1)
+    cold_ischemia = np.minimum(rng.gamma(per_row["cit_shape"], per_row["cit_scale_hours"]), MAX_COLD_ISCHEMIA_HOURS)
+    # About a third of donors are DCD, with much longer warm ischemia
+    dcd = rng.random(rows) < 0.3
+    warm_ischemia = np.clip(np.where(dcd, rng.gamma(4.0, 6.0, rows), rng.gamma(1.5, 3.0, rows)), 0, 90)
+    kdpi = np.where(
+        per_row["has_kdpi"] > 0,
+        np.clip(np.rint(1.1 * donor_age - 10 + rng.normal(0, 15, rows)), 0, 100),
+        np.nan,
+    )
+
+    # Latent injury drives the ultrasound findings together
+    injury = (
+        0.6 * cold_ischemia / per_row["cit_tolerance_hours"]
+        + 0.3 * warm_ischemia / 60
+        + 0.3 * np.maximum(donor_age - 40, 0) / 40
+        + 0.1 * (cause == CAUSES_OF_DEATH.index("Anoxia"))
+        + rng.gamma(1.0, 0.15, rows)
+    )
+    stiffness = np.clip(
+        per_row["stiffness_normal_kpa"] * np.exp(0.9 * injury) + rng.normal(0, 0.5, rows), 1.0, MAX_STIFFNESS_KPA
+    )
+    # Shear wave speed grows with the square root of the elastic modulus
+    swv = per_row["swv_normal_ms"] * np.sqrt(stiffness / per_row["stiffness_normal_kpa"]) * (1 + rng.normal(0, 0.03, rows))
+    resistive_index = np.clip(per_row["ri_normal"] + 0.12 * injury + rng.normal(0, 0.04, rows), 0.3, 1.0)
+    perfusion = np.clip(95 - 22 * injury + rng.normal(0, 5, rows), 0, 100)
+    echogenicity = np.clip(np.rint(1.3 + 1.3 * injury + rng.normal(0, 0.6, rows)), 1, 5)
+    edema = np.clip(0.15 + 0.14 * injury + rng.normal(0, 0.04, rows), 0, 1)
+
+    donor_quality = np.where(np.isnan(kdpi), np.clip(1.1 * donor_age - 10, 0, 100), kdpi)
+    # Calibrated to the BuildPlan mix of roughly 40% Accept, 35% Marginal, 25% Decline
+    target = np.clip(
+        130 - 75 * injury - 0.5 * donor_quality + 0.375 * (perfusion - 80) + rng.normal(0, 6, rows), 0, 100
+    )
+
+    numeric = {
+        "tissue_stiffness_kpa": stiffness,
+        "resistive_index": resistive_index,
+        "shear_wave_velocity_ms": swv,
+        "perfusion_uniformity_pct": perfusion,
+        "echogenicity_grade": echogenicity.astype(np.int64),
+        "edema_index": edema,
+        "cold_ischemia_hours": cold_ischemia,
+        "donor_age": donor_age.astype(np.int64),
+        "kdpi_percentile": kdpi,
+        "warm_ischemia_minutes": warm_ischemia,
+    }
+    numeric = {name: numeric[name] for name in NUMERIC_FIELDS}
+    numeric[TARGET_SCORE] = target
+    return CohortChunk(
+        numeric=numeric,
+        categorical={
+            "organ_type": (organs, organ),
+            "cause_of_death": (CAUSES_OF_DEATH, cause),
+            TARGET_CLASS: (TARGET_LABELS, np.searchsorted(TARGET_CUTOFFS, np.floor(target), side="right")),
+        },
+    )
+
+
+def _profile_name(organ_type: str) -> str:
+    for name in ORGAN_PROFILES:
+        if name.lower() == organ_type.strip().lower():
+            return name
+    raise ValueError(f"No synthetic profile for organ type '{organ_type}'. Use one of: {', '.join(ORGAN_PROFILES)}")
+
+
+def chunk_plan(rows: int, chunk_rows: int, seed: int) -> List[Tuple[int, int, np.random.SeedSequence]]:
+    """(chunk index, rows, seed sequence) for every chunk of a cohort."""
+    n_chunks = max(-(-rows // chunk_rows), 1)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    return [(i, min(chunk_rows, rows - i * chunk_rows), seeds[i]) for i in range(n_chunks)]
+
+
+def iter_chunks(rows: int, seed: int = DEFAULT_SEED, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                organ_type: Optional[str] = None) -> Iterator[CohortChunk]:
+    """Generate a cohort in-process, chunk by chunk (same rows as write_cohort with these arguments)."""
+    for _, chunk_size, chunk_seed in chunk_plan(rows, chunk_rows, seed):
+        yield generate_chunk(chunk_size, chunk_seed, organ_type)
+
+
+def generate_cohort(rows: int, seed: int = DEFAULT_SEED, organ_type: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Small in-memory cohort as decoded columns (one chunk).
+
+    Args:
+        rows: Number of organs
+        seed: Integer seed
+        organ_type: Restrict to one organ
+
+    Returns:
+        Columns keyed by field name, ready for columns_to_batch
+    """
+    return generate_chunk(rows, seed, organ_type).to_columns()
+
+
+def _write_part(task: Tuple[int, int, np.random.SeedSequence, str, str, Optional[str]]) -> Tuple[int, int]:
+    index, rows, seed, path, fmt, organ_type = task
+    record_batch = generate_chunk(rows, seed, organ_type).to_record_batch()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(_table(record_batch), path)
+    elif fmt == "arrow":
+        import pyarrow as pa
+        with pa.ipc.new_file(path, record_batch.schema) as writer:
+            writer.write_batch(record_batch)
+    else:
+        import pyarrow.csv
+        pyarrow.csv.write_csv(_table(record_batch), path)
+    return index, rows
+
+
+def _table(record_batch: "pa.RecordBatch") -> "pa.Table":
+    import pyarrow as pa
+    return pa.Table.from_batches([record_batch])
+
+
+def write_cohort(
+    out_dir: str,
+    rows: int,
+    seed: int = DEFAULT_SEED,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    workers: int = 1,
+    fmt: str = "parquet",
+    organ_type: Optional[str] = None,
+) -> dict:
+    """
+    Write a cohort as one part file per chunk, generated by a pool of worker processes.
+
+    Args:
+        out_dir: Output directory (created if needed)
+        rows: Total number of organs
+        seed: Root seed; chunk i uses the i-th spawned SeedSequence
+        chunk_rows: Rows per part file, which bounds each worker's memory
+        workers: Worker processes (1 generates inline)
+        fmt: "parquet", "arrow" or "csv"
+        organ_type: Restrict to one organ
+
+    Returns:
+        The manifest also written to <out_dir>/_manifest.json
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Use one of: {', '.join(FORMATS)}")
+    if organ_type is not None:
+        organ_type = _profile_name(organ_type)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    plan = chunk_plan(rows, chunk_rows, seed)
+    tasks = [
+        (index, chunk_size, chunk_seed, str(out / f"part-{index:05d}{FORMATS[fmt]}"), fmt, organ_type)
+        for index, chunk_size, chunk_seed in plan
+    ]
+    if workers <= 1 or len(tasks) == 1:
+        written = [_write_part(task) for task in tasks]
+    else:
+        context = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        with ProcessPoolExecutor(min(workers, len(tasks)), mp_context=context) as pool:
+            written = list(pool.map(_write_part, tasks))
+
+    manifest = {
+        "generator_version": GENERATOR_VERSION,
+        "seed": seed,
+        "rows": sum(part_rows for _, part_rows in written),
+        "chunk_rows": chunk_rows,
+        "organ_type": organ_type,
+        "format": fmt,
+        "parts": [{"file": Path(task[3]).name, "rows": task[1]} for task in tasks],
+    }
+    (out / MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2))
+    return manifest
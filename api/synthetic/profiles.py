@@ -0,0 +1,62 @@
+"""
+Per-organ distributions for synthetic cohorts.
+Ranges follow the feature table in docs/BuildPlan.md: normal ultrasound values
+per organ, organ-specific cold ischemia tolerance, and abnormalities that cluster
+(high stiffness, high RI, poor perfusion and long ischemia appear together).
+"""
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+CAUSES_OF_DEATH = ("Trauma", "Anoxia", "CVA", "Other")
+
+
+@dataclass(frozen=True)
+class OrganProfile:
+    """
+    Sampling parameters for one organ type.
+
+    Cold ischemia is gamma-distributed; ultrasound features are driven by a
+    latent injury score built from ischemia and donor age, so they are
+    correlated the way real non-viable organs are.
+    """
+    organ_type: str
+    share: float                       # fraction of a mixed cohort
+    cit_shape: float
+    cit_scale_hours: float
+    cit_tolerance_hours: float         # CIT at which ischemic injury reaches 1.0
+    stiffness_normal_kpa: float
+    swv_normal_ms: float               # shear wave velocity at normal stiffness
+    ri_normal: float
+    has_kdpi: bool                     # KDPI is a kidney index; other organs leave it missing
+    cause_weights: Tuple[float, ...]   # aligned with CAUSES_OF_DEATH
+
+
+ORGAN_PROFILES: Dict[str, OrganProfile] = {
+    profile.organ_type: profile
+    for profile in (
+        OrganProfile("Kidney", 0.55, 2.0, 8.0, 30.0, 4.5, 2.0, 0.62, True, (0.30, 0.30, 0.30, 0.10)),
+        OrganProfile("Liver", 0.25, 2.0, 4.0, 15.0, 4.9, 1.3, 0.64, False, (0.35, 0.30, 0.25, 0.10)),
+        OrganProfile("Heart", 0.10, 3.0, 1.2, 4.0, 6.0, 1.6, 0.60, False, (0.45, 0.30, 0.15, 0.10)),
+        OrganProfile("Lung", 0.10, 3.0, 1.8, 6.0, 3.5, 1.2, 0.60, False, (0.40, 0.30, 0.20, 0.10)),
+    )
+}
+
+
+def profile_table(organ_types: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    """
+    Profile parameters as arrays aligned with organ_types, for per-row lookups by organ code.
+
+    Args:
+        organ_types: Organ names present in ORGAN_PROFILES
+
+    Returns:
+        Field name -> (len(organ_types),) array (cause_weights -> (organs, causes))
+    """
+    profiles = [ORGAN_PROFILES[organ] for organ in organ_types]
+    return {
+        name: np.array([getattr(profile, name) for profile in profiles], dtype=np.float64)
+        for name in OrganProfile.__dataclass_fields__
+        if name != "organ_type"
+    }
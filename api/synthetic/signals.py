@@ -0,0 +1,89 @@
+"""
+Synthetic ultrasound recordings with known ground truth.
+Used to check and benchmark services.signal_features: each generator takes the
+value the extractor should recover (RI, shear wave speed, perfusion
+uniformity) and produces a realistic noisy recording around it.
+"""
+from typing import Optional
+
+import numpy as np
+
+from synthetic.generator import DEFAULT_SEED
+
+# Fraction of the cardiac cycle spent in the systolic upstroke
+SYSTOLIC_FRACTION = 0.12
+# Diastolic run-off decay rate per cycle
+DIASTOLIC_DECAY = 3.0
+# Shear wave pulse centre frequency
+SHEAR_PULSE_HZ = 400.0
+
+
+def doppler_trace(seconds: float, sample_rate_hz: float, resistive_index: float = 0.65,
+                  peak_systolic_velocity: float = 60.0, heart_rate_bpm: float = 72.0,
+                  rate_variability: float = 0.04, noise: float = 0.03,
+                  seed: Optional[int] = DEFAULT_SEED) -> np.ndarray:
+    """
+    Doppler velocity envelope: a rapid systolic upstroke to PSV, then an
+    exponential diastolic run-off to EDV = PSV * (1 - RI).
+
+    The heart rate wanders slowly by +-rate_variability, and Gaussian noise of
+    noise * PSV is added.
+
+    Returns:
+        (samples,) float32 velocities
+    """
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * sample_rate_hz)
+    t = np.arange(samples) / sample_rate_hz
+    beat_hz = heart_rate_bpm / 60.0 * (1 + rate_variability * np.sin(2 * np.pi * t / 37.0))
+    phase = np.cumsum(beat_hz) / sample_rate_hz % 1.0
+    systole = phase < SYSTOLIC_FRACTION
+    run_off = np.exp(-DIASTOLIC_DECAY * (phase - SYSTOLIC_FRACTION))
+    floor = np.exp(-DIASTOLIC_DECAY * (1 - SYSTOLIC_FRACTION))
+    shape = np.where(systole, np.sin(0.5 * np.pi * phase / SYSTOLIC_FRACTION), (run_off - floor) / (1 - floor))
+    end_diastolic = peak_systolic_velocity * (1 - resistive_index)
+    trace = end_diastolic + (peak_systolic_velocity - end_diastolic) * shape
+    trace += rng.normal(0, noise * peak_systolic_velocity, samples)
+    return trace.astype(np.float32)
+
+
+def shear_wave_series(acquisitions: int, positions: int = 8, samples: int = 1000, sample_rate_hz: float = 10_000.0,
+                      spacing_mm: float = 1.0, speed_ms: float = 2.0, noise: float = 0.05,
+                      seed: Optional[int] = DEFAULT_SEED) -> np.ndarray:
+    """
+    Tracked displacement after each push: a Ricker pulse reaching position i
+    at i * spacing / speed, attenuated with distance, with per-acquisition
+    speed jitter of 3%.
+
+    Returns:
+        (acquisitions, positions, samples) float32 displacements
+    """
+    rng = np.random.default_rng(seed)
+    speed = speed_ms * (1 + 0.03 * rng.standard_normal((acquisitions, 1, 1)))
+    distance = (np.arange(positions) * spacing_mm / 1000.0)[np.newaxis, :, np.newaxis]
+    t = (np.arange(samples) / sample_rate_hz)[np.newaxis, np.newaxis, :]
+    onset = 2.0 / SHEAR_PULSE_HZ
+    arg = (np.pi * SHEAR_PULSE_HZ * (t - onset - distance / speed)) ** 2
+    pulse = (1 - 2 * arg) * np.exp(-arg) * np.exp(-distance / 0.02)
+    pulse += rng.normal(0, noise, pulse.shape)
+    return pulse.astype(np.float32)
+
+
+def perfusion_series(regions: int, frames: int, uniformity_pct: float = 80.0, noise: float = 0.05,
+                     seed: Optional[int] = DEFAULT_SEED) -> np.ndarray:
+    """
+    Per-region perfusion intensity: a shared wash-in / wash-out curve scaled
+    by region gains whose coefficient of variation is 1 - uniformity / 100.
+
+    Returns:
+        (regions, frames) float32 intensities
+    """
+    rng = np.random.default_rng(seed)
+    variation = 1 - uniformity_pct / 100.0
+    gains = rng.standard_normal(regions)
+    gains = 1 + variation * (gains - gains.mean()) / gains.std()
+    t = np.linspace(0, 1, frames)
+    curve = 0.2 + t / 0.1 * np.exp(1 - t / 0.1) + 0.3 * (1 - np.exp(-t / 0.3))
+    intensity = gains[:, np.newaxis] * curve[np.newaxis, :]
+    intensity *= 1 + rng.normal(0, noise, intensity.shape)
+    return intensity.astype(np.float32)
@@ -0,0 +1,24 @@
+"""
+Model training: stream a cohort, cross-validate candidates in parallel and
+write a versioned artifact the API serves with ULTRAVIAB_ENGINE=model.
+
+    python -m training --cohort data/cohort --n-jobs -1
+"""
+from .artifact import new_version, save_artifact
+from .candidates import CANDIDATES, Candidate, get_candidate
+from .dataset import TrainingSet, load_cohort, synthetic_cohort
+from .evaluation import CandidateResult, cross_validate, select
+
+__all__ = [
+    "TrainingSet",
+    "load_cohort",
+    "synthetic_cohort",
+    "Candidate",
+    "CANDIDATES",
+    "get_candidate",
+    "CandidateResult",
+    "cross_validate",
+    "select",
+    "new_version",
+    "save_artifact",
+]
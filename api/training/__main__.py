@@ -0,0 +1,97 @@
+"""
+Train, cross-validate and version a viability model.
+
+Usage (from api/):
+    python -m training --cohort data/cohort --n-jobs -1
+    python -m training --synthetic-rows 200000 --candidates rf rf_small hgb --max-row-cost-us 5
+    python -m training --cohort data/cohort --f1-tolerance 0.01 --dry-run
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List
+
+from synthetic.generator import DEFAULT_SEED
+from training import artifact, candidates, dataset, evaluation
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Train UltraViab viability models with parallel k-fold CV.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--cohort", help="Cohort file or directory of part files (parquet, arrow or csv)")
+    source.add_argument("--synthetic-rows", type=int, help="Generate a synthetic cohort of this size in-process")
+    parser.add_argument("--max-rows", type=int, help="Train on at most this many rows of the cohort")
+    parser.add_argument("--candidates", nargs="+", default=sorted(candidates.CANDIDATES),
+                        choices=sorted(candidates.CANDIDATES))
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel CV jobs; -1 uses every core")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--max-row-cost-us", type=float, help="Drop candidates slower than this per row in batch")
+    parser.add_argument("--max-size-mb", type=float, help="Drop candidates larger than this when serialized")
+    parser.add_argument("--f1-tolerance", type=float, default=0.0,
+                        help="Macro F1 the cheapest model may give up against the most accurate one")
+    parser.add_argument("--model-dir", help="Artifact root; defaults to api/models")
+    parser.add_argument("--version", help="Artifact version; defaults to <UTC timestamp>-<candidate>")
+    parser.add_argument("--dry-run", action="store_true", help="Cross-validate and select without saving")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        if args.cohort:
+            data = dataset.load_cohort(args.cohort, max_rows=args.max_rows)
+        else:
+            data = dataset.synthetic_cohort(args.synthetic_rows, seed=args.seed)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"Loaded {len(data):,} rows from {data.source} in {time.perf_counter() - started:.1f}s")
+
+    results = evaluation.cross_validate(data, args.candidates, folds=args.folds, n_jobs=args.n_jobs, seed=args.seed)
+    try:
+        selected = evaluation.select(results, args.max_row_cost_us, args.max_size_mb, args.f1_tolerance)
+    except ValueError as exc:
+        print(evaluation.format_table(results))
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(evaluation.format_table(results, selected.name))
+    print(f"Selected {selected.name}")
+    if args.dry_run:
+        return 0
+
+    started = time.perf_counter()
+    candidate = candidates.get_candidate(selected.name)
+    # The final fit has the machine to itself, so the estimators may use every core
+    models = candidates.fit(candidate, data.X, data.y_score, data.y_class, args.seed,
+                            n_jobs=args.n_jobs if args.n_jobs > 0 else os.cpu_count() or 1)
+    fit_seconds = time.perf_counter() - started
+
+    version = args.version or artifact.new_version(selected.name)
+    metadata = {
+        "candidate": selected.name,
+        "description": candidate.description,
+        "source": data.source,
+        "rows": len(data),
+        "seed": args.seed,
+        "folds": args.folds,
+        "final_fit_seconds": fit_seconds,
+        "selection": {
+            "max_row_cost_us": args.max_row_cost_us,
+            "max_size_mb": args.max_size_mb,
+            "f1_tolerance": args.f1_tolerance,
+        },
+        "cross_validation": {result.name: {"mean": result.mean, "std": result.std} for result in results},
+    }
+    try:
+        path = artifact.save_artifact(models, data.feature_names, metadata, version, args.model_dir)
+    except FileExistsError:
+        print(f"error: model version '{version}' already exists", file=sys.stderr)
+        return 1
+    print(f"Wrote {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    print(json.dumps(selected.mean, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
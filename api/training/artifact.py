@@ -0,0 +1,71 @@
+"""
+Versioned model artifacts.
+Writes <model dir>/<version>/model.joblib in the layout services.model_registry
+loads, with the cross-validation report alongside as metrics.json.
+"""
+import json
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from services.model_registry import ARTIFACT_FILENAME, DEFAULT_MODEL_DIR
+
+METRICS_FILENAME = "metrics.json"
+
+# Bumped when the artifact dict layout changes
+ARTIFACT_FORMAT = 1
+
+
+def new_version(candidate: str, now: Optional[datetime] = None) -> str:
+    """Timestamped version label; the registry serves the lexically latest one by default."""
+    now = now or datetime.now(timezone.utc)
+    return f"{now:%Y%m%d-%H%M%S}-{candidate}"
+
+
+def save_artifact(models, feature_names, metadata: Dict[str, Any], version: str,
+                  model_dir: Optional[str] = None) -> Path:
+    """
+    Save fitted models as a new artifact version.
+
+    Args:
+        models: Fitted (regressor, classifier, scaler)
+        feature_names: Ordered feature names the models were trained on
+        metadata: Training report (candidate, cross-validation metrics, data source, ...)
+        version: Version label; also the artifact directory name
+        model_dir: Root of the model directory; defaults to api/models
+
+    Returns:
+        Path of the written model.joblib
+
+    Raises:
+        FileExistsError: If the version already exists
+    """
+    import joblib  # Heavy (pulls in scikit-learn) - only needed when training
+    import sklearn
+
+    regressor, classifier, scaler = models
+    version_dir = Path(model_dir or DEFAULT_MODEL_DIR) / version
+    version_dir.mkdir(parents=True, exist_ok=False)
+
+    metadata = {
+        **metadata,
+        "artifact_format": ARTIFACT_FORMAT,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "sklearn_version": sklearn.__version__,
+        "python_version": platform.python_version(),
+    }
+    path = version_dir / ARTIFACT_FILENAME
+    joblib.dump(
+        {
+            "version": version,
+            "regressor": regressor,
+            "classifier": classifier,
+            "scaler": scaler,
+            "feature_names": list(feature_names),
+            "metadata": metadata,
+        },
+        path,
+    )
+    (version_dir / METRICS_FILENAME).write_text(json.dumps(metadata, indent=2) + "\n")
+    return path
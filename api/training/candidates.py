@@ -0,0 +1,92 @@
+"""
+Candidate model families for training.
+Each candidate builds a (regressor, classifier, scaler) triple with the same
+layout the model registry serves, so a cross-validated candidate can be
+refit and saved without translation.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Models = Tuple[Any, Any, Optional[Any]]  # regressor, classifier, scaler
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A named model family and how to build untrained instances of it."""
+    name: str
+    description: str
+    build: Callable[[int, int], Models]  # (seed, n_jobs) -> models
+
+
+def _linear(seed: int, n_jobs: int) -> Models:
+    from sklearn.linear_model import LogisticRegression, Ridge
+    from sklearn.preprocessing import StandardScaler
+
+    return Ridge(alpha=1.0), LogisticRegression(max_iter=1000, random_state=seed), StandardScaler()
+
+
+def _hist_gradient_boosting(seed: int, n_jobs: int) -> Models:
+    from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
+
+    return (
+        HistGradientBoostingRegressor(max_iter=200, random_state=seed),
+        HistGradientBoostingClassifier(max_iter=200, random_state=seed),
+        None,
+    )
+
+
+def _random_forest(trees: int, max_depth: Optional[int]) -> Callable[[int, int], Models]:
+    def build(seed: int, n_jobs: int) -> Models:
+        from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+        options = dict(n_estimators=trees, max_depth=max_depth, min_samples_leaf=5, random_state=seed, n_jobs=n_jobs)
+        # BuildPlan.md pairs the forest with a StandardScaler; trees do not need it, so it is not fitted
+        return RandomForestRegressor(**options), RandomForestClassifier(**options), None
+    return build
+
+
+CANDIDATES: Dict[str, Candidate] = {
+    candidate.name: candidate
+    for candidate in (
+        Candidate("linear", "Ridge regression + logistic regression on standardized features", _linear),
+        Candidate("hgb", "Histogram gradient boosting (200 iterations)", _hist_gradient_boosting),
+        Candidate("rf", "Random forest, 100 trees, min 5 samples per leaf", _random_forest(100, None)),
+        Candidate("rf_small", "Random forest, 30 trees of depth <= 12", _random_forest(30, 12)),
+    )
+}
+
+
+def get_candidate(name: str) -> Candidate:
+    """
+    Look up a candidate by name.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return CANDIDATES[name]
+    except KeyError:
+        raise ValueError(f"Unknown candidate '{name}'; expected one of {sorted(CANDIDATES)}") from None
+
+
+def fit(candidate: Candidate, X, y_score, y_class, seed: int, n_jobs: int = 1) -> Models:
+    """
+    Fit a candidate's regressor and classifier on the same features.
+
+    Args:
+        candidate: Model family
+        X: Encoded feature matrix
+        y_score: 0-100 viability targets
+        y_class: Classification targets
+        seed: Random state for the estimators
+        n_jobs: Threads/processes the estimators may use
+
+    Returns:
+        Fitted (regressor, classifier, scaler)
+    """
+    regressor, classifier, scaler = candidate.build(seed, n_jobs)
+    if scaler is not None:
+        X = scaler.fit_transform(X)
+    regressor.fit(X, y_score)
+    classifier.fit(X, y_class)
+    return regressor, classifier, scaler
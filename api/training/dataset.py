@@ -0,0 +1,135 @@
+"""
+Training data loading.
+A cohort (file, directory of part files, or freshly generated) is streamed in
+record batch by record batch and encoded straight into the model feature
+matrix, so the raw cohort is never held in memory as a whole.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+from services import columnar_scoring, model_features
+from synthetic.generator import DEFAULT_SEED, TARGET_CLASS, TARGET_CUTOFFS, TARGET_LABELS, TARGET_SCORE, iter_chunks
+
+STREAM_BATCH_ROWS = 250_000
+CSV_BLOCK_BYTES = 1 << 24  # ~16 MB of text per CSV record batch
+
+
+@dataclass
+class TrainingSet:
+    """Encoded features and both targets, row-aligned."""
+    X: np.ndarray              # (n, len(feature_names)) float64
+    y_score: np.ndarray        # (n,) float64, 0-100
+    y_class: np.ndarray        # (n,) str
+    feature_names: List[str]
+    source: str
+
+    def __len__(self) -> int:
+        return self.X.shape[0]
+
+
+def cohort_files(path: str) -> List[str]:
+    """A cohort file, or the part files of a cohort directory in name order (skipping _/. files)."""
+    root = Path(path)
+    if not root.is_dir():
+        return [str(root)]
+    files = sorted(
+        str(child) for child in root.iterdir()
+        if child.is_file() and not child.name.startswith(("_", "."))
+    )
+    if not files:
+        raise ValueError(f"No cohort files in {path}")
+    return files
+
+
+def iter_cohort_batches(path: str, batch_rows: int = STREAM_BATCH_ROWS) -> Iterator["pa.RecordBatch"]:
+    """Stream Arrow IPC, Parquet or CSV cohort files as record batches."""
+    for file in cohort_files(path):
+        if file.lower().endswith(".csv"):
+            import pyarrow.csv  # Optional: only needed for CSV cohorts
+
+            yield from pyarrow.csv.open_csv(file, read_options=pyarrow.csv.ReadOptions(block_size=CSV_BLOCK_BYTES))
+        else:
+            yield from columnar_scoring.read_batches(file, columnar_scoring.format_for_path(file), batch_rows)
+
+
+def _targets(record_batch: "pa.RecordBatch") -> Tuple[np.ndarray, np.ndarray]:
+    """Score and class labels of a batch; the class is derived from the score when absent."""
+    names = record_batch.schema.names
+    if TARGET_SCORE not in names:
+        raise ValueError(f"Cohort has no '{TARGET_SCORE}' label column")
+    y_score = record_batch.column(TARGET_SCORE).to_numpy(zero_copy_only=False).astype(np.float64)
+    if TARGET_CLASS in names:
+        y_class = np.asarray(record_batch.column(TARGET_CLASS).to_pylist(), dtype=object).astype(str)
+    else:
+        y_class = labels_for_scores(y_score)
+    return y_score, y_class
+
+
+def labels_for_scores(scores: np.ndarray) -> np.ndarray:
+    """Decline / Marginal / Accept for 0-100 scores, using the target cut-offs."""
+    return np.asarray(TARGET_LABELS)[np.searchsorted(TARGET_CUTOFFS, np.floor(scores), side="right")]
+
+
+def encode_batches(batches, feature_names: Sequence[str], max_rows: Optional[int] = None, source: str = "") -> TrainingSet:
+    """
+    Encode record batches into a TrainingSet.
+
+    Rows with missing required features or labels are dropped.
+
+    Args:
+        batches: Iterable of Arrow record batches with request and label columns
+        feature_names: Model feature names (see model_features)
+        max_rows: Stop after this many rows
+        source: Description recorded in the artifact metadata
+    """
+    X_parts, score_parts, class_parts, rows = [], [], [], 0
+    for record_batch in batches:
+        if max_rows is not None and rows >= max_rows:
+            break
+        if max_rows is not None and rows + record_batch.num_rows > max_rows:
+            record_batch = record_batch.slice(0, max_rows - rows)
+        batch, missing = columnar_scoring.record_batch_to_features(record_batch)
+        y_score, y_class = _targets(record_batch)
+        keep = ~missing.any(axis=1) & ~np.isnan(y_score)
+        if not keep.all():
+            batch = batch.take(np.flatnonzero(keep))
+            y_score, y_class = y_score[keep], y_class[keep]
+        X_parts.append(model_features.encode(batch, feature_names))
+        score_parts.append(y_score)
+        class_parts.append(y_class)
+        rows += record_batch.num_rows
+    if not X_parts:
+        raise ValueError(f"No training rows in {source or 'cohort'}")
+    return TrainingSet(
+        X=np.concatenate(X_parts),
+        y_score=np.concatenate(score_parts),
+        y_class=np.concatenate(class_parts),
+        feature_names=list(feature_names),
+        source=source,
+    )
+
+
+def load_cohort(path: str, max_rows: Optional[int] = None,
+                feature_names: Sequence[str] = model_features.DEFAULT_FEATURE_NAMES) -> TrainingSet:
+    """
+    Stream a cohort file or directory into a TrainingSet.
+
+    Args:
+        path: .parquet / .arrow / .csv file, or a directory of part files (python -m synthetic output)
+        max_rows: Use at most this many rows, from the start of the cohort
+        feature_names: Model feature names
+    """
+    return encode_batches(iter_cohort_batches(path), feature_names, max_rows, source=str(path))
+
+
+def synthetic_cohort(rows: int, seed: int = DEFAULT_SEED,
+                     feature_names: Sequence[str] = model_features.DEFAULT_FEATURE_NAMES) -> TrainingSet:
+    """Generate a synthetic cohort in-process, chunk by chunk, and encode it."""
+    batches = (chunk.to_record_batch() for chunk in iter_chunks(rows, seed, chunk_rows=STREAM_BATCH_ROWS))
+    return encode_batches(batches, feature_names, source=f"synthetic(rows={rows}, seed={seed})")
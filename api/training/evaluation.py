@@ -0,0 +1,167 @@
+"""
+Parallel k-fold cross-validation and cost-aware model selection.
+Every fold records accuracy metrics next to what the model costs to run: fit
+time, batch and single-row inference latency, and serialized size.
+"""
+import pickle
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from training import candidates
+from training.dataset import TrainingSet
+
+# Single-row latency is the median of this many one-row calls
+SINGLE_ROW_CALLS = 50
+
+# Metrics averaged across folds, in report order
+METRICS = (
+    "mae", "rmse", "r2", "accuracy", "f1_macro",
+    "fit_seconds", "batch_us_per_row", "single_row_ms", "size_mb",
+)
+
+
+@dataclass
+class CandidateResult:
+    """Cross-validation summary of one candidate."""
+    name: str
+    folds: List[Dict[str, float]]
+    mean: Dict[str, float] = field(default_factory=dict)
+    std: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for metric in METRICS:
+            values = np.array([fold[metric] for fold in self.folds])
+            self.mean[metric] = float(values.mean())
+            self.std[metric] = float(values.std())
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _infer(models, X: np.ndarray):
+    """Inference the way ModelPredictionService runs it: scale, regress, classify."""
+    regressor, classifier, scaler = models
+    if scaler is not None:
+        X = scaler.transform(X)
+    return regressor.predict(X), classifier.predict_proba(X)
+
+
+def _evaluate_fold(name: str, data: TrainingSet, train: np.ndarray, test: np.ndarray, seed: int) -> Dict[str, float]:
+    from sklearn.metrics import accuracy_score, f1_score, mean_absolute_error, mean_squared_error, r2_score
+
+    candidate = candidates.get_candidate(name)
+    started = time.perf_counter()
+    models = candidates.fit(candidate, data.X[train], data.y_score[train], data.y_class[train], seed)
+    fit_seconds = time.perf_counter() - started
+
+    X_test = data.X[test]
+    started = time.perf_counter()
+    predicted_scores, probabilities = _infer(models, X_test)
+    batch_seconds = time.perf_counter() - started
+
+    single_calls = []
+    for row in X_test[:SINGLE_ROW_CALLS]:
+        started = time.perf_counter()
+        _infer(models, row[np.newaxis, :])
+        single_calls.append(time.perf_counter() - started)
+
+    # Score as served: clipped to 0-100 and truncated to whole points
+    predicted_scores = np.clip(predicted_scores, 0, 100).astype(np.int64)
+    predicted_classes = np.asarray(models[1].classes_)[probabilities.argmax(axis=1)]
+    y_score, y_class = data.y_score[test], data.y_class[test]
+    return {
+        "mae": float(mean_absolute_error(y_score, predicted_scores)),
+        "rmse": float(np.sqrt(mean_squared_error(y_score, predicted_scores))),
+        "r2": float(r2_score(y_score, predicted_scores)),
+        "accuracy": float(accuracy_score(y_class, predicted_classes)),
+        "f1_macro": float(f1_score(y_class, predicted_classes, average="macro")),
+        "fit_seconds": fit_seconds,
+        "batch_us_per_row": batch_seconds / len(test) * 1e6,
+        "single_row_ms": float(np.median(single_calls)) * 1e3,
+        "size_mb": len(pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL)) / 1e6,
+    }
+
+
+def cross_validate(data: TrainingSet, names: Sequence[str], folds: int = 5, n_jobs: int = -1,
+                   seed: int = 0) -> List[CandidateResult]:
+    """
+    Stratified k-fold cross-validation of several candidates.
+
+    Every (candidate, fold) pair is an independent job spread across n_jobs
+    worker processes; estimators inside a job stay single-threaded so fit and
+    latency numbers are comparable between candidates.
+
+    Args:
+        data: Encoded training set
+        names: Candidate names (see candidates.CANDIDATES)
+        folds: Number of folds
+        n_jobs: Worker processes, -1 for every core
+        seed: Seed for the fold split and the estimators
+
+    Returns:
+        One CandidateResult per candidate, in the order given
+    """
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import StratifiedKFold
+
+    for name in names:
+        candidates.get_candidate(name)
+    splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed).split(data.X, data.y_class))
+    jobs = [(name, train, test) for name in names for train, test in splits]
+    # joblib memory-maps the large feature matrix into the workers instead of copying it per job
+    fold_metrics = Parallel(n_jobs=n_jobs)(
+        delayed(_evaluate_fold)(name, data, train, test, seed) for name, train, test in jobs
+    )
+    return [
+        CandidateResult(name, [metrics for (job_name, _, _), metrics in zip(jobs, fold_metrics) if job_name == name])
+        for name in names
+    ]
+
+
+def select(results: Sequence[CandidateResult], max_row_cost_us: Optional[float] = None,
+           max_size_mb: Optional[float] = None, f1_tolerance: float = 0.0) -> CandidateResult:
+    """
+    Pick the model to ship, trading accuracy against inference cost.
+
+    Candidates over a cost or size budget are dropped. Of the rest, the
+    cheapest per-row candidate whose macro F1 is within f1_tolerance of the
+    best one wins, so a small accuracy loss can buy a much faster model.
+
+    Args:
+        results: Cross-validation results
+        max_row_cost_us: Budget for batch inference cost per row (microseconds)
+        max_size_mb: Budget for serialized model size
+        f1_tolerance: Macro F1 a cheaper model may give up, e.g. 0.01
+
+    Returns:
+        The selected candidate's result
+
+    Raises:
+        ValueError: If no candidate fits the budgets
+    """
+    eligible = [
+        result for result in results
+        if (max_row_cost_us is None or result.mean["batch_us_per_row"] <= max_row_cost_us)
+        and (max_size_mb is None or result.mean["size_mb"] <= max_size_mb)
+    ]
+    if not eligible:
+        raise ValueError("No candidate fits the inference cost / size budget")
+    best_f1 = max(result.mean["f1_macro"] for result in eligible)
+    good_enough = [result for result in eligible if result.mean["f1_macro"] >= best_f1 - f1_tolerance]
+    return min(good_enough, key=lambda result: (result.mean["batch_us_per_row"], -result.mean["f1_macro"]))
+
+
+def format_table(results: Sequence[CandidateResult], selected: Optional[str] = None) -> str:
+    """Cross-validation results as a fixed-width text table (mean +- std across folds)."""
+    header = f"{'candidate':12s}" + "".join(f"{metric:>20s}" for metric in METRICS)
+    lines = [header, "-" * len(header)]
+    for result in results:
+        marker = "*" if result.name == selected else " "
+        cells = "".join(
+            f"{result.mean[metric]:>12.4g} ±{result.std[metric]:<7.2g}" for metric in METRICS
+        )
+        lines.append(f"{marker}{result.name:11s}{cells}")
+    return "\n".join(lines)
@@ -0,0 +1,202 @@
+"""
+Export a trained random forest artifact to the flat NumPy kernel.
+
+Usage (from api/):
+    python -m training.export 20261018-143051-rf            # writes 20261018-143051-rf-flat
+    python -m training.export 20261018-143051-rf --parity-rows 100000
+
+The flat version is only written when it reproduces the scikit-learn
+predictions on a synthetic parity cohort.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from services.model_registry import ARTIFACT_FILENAME, DEFAULT_MODEL_DIR, load_model_artifact
+from services.tree_kernel import FlatForest
+from training import artifact, dataset
+
+FLAT_SUFFIX = "-flat"
+
+# Largest |sklearn - flat| accepted on regression values and class probabilities
+PARITY_TOLERANCE = 1e-9
+DEFAULT_PARITY_ROWS = 20_000
+PARITY_SEED = 7
+
+
+def _breadth_first(children_left: np.ndarray, children_right: np.ndarray) -> np.ndarray:
+    """Node ids of one tree in breadth-first order, each left child directly followed by its sibling."""
+    levels, frontier = [], np.zeros(1, dtype=np.intp)
+    while frontier.size:
+        levels.append(frontier)
+        internal = frontier[children_left[frontier] != -1]
+        frontier = np.column_stack((children_left[internal], children_right[internal])).ravel()
+    return np.concatenate(levels)
+
+
+def _round_down_float32(threshold: np.ndarray) -> np.ndarray:
+    """
+    Largest float32 <= each float64 threshold.
+
+    For a float32 feature value x, x <= t holds exactly when x <= round_down(t),
+    so the kernel can compare in float32 and still split like scikit-learn.
+    """
+    rounded = threshold.astype(np.float32)
+    too_high = rounded.astype(np.float64) > threshold
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
+
+
+def flatten_forest(model) -> FlatForest:
+    """
+    Flatten a fitted scikit-learn forest (or single decision tree) into one node table.
+
+    Args:
+        model: Fitted RandomForest / ExtraTrees / DecisionTree regressor or classifier
+
+    Returns:
+        Equivalent FlatForest
+
+    Raises:
+        ValueError: If the model is not a single-output tree ensemble
+    """
+    trees = getattr(model, "estimators_", None)
+    if trees is None:
+        trees = [model]
+    if not all(hasattr(tree, "tree_") for tree in trees) or getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError(f"{type(model).__name__} is not a single-output tree ensemble")
+
+    classifier = hasattr(model, "classes_")
+    parts: Dict[str, list] = {name: [] for name in ("feature", "threshold", "left", "missing_left", "value")}
+    roots, offset, max_depth = [], 0, 0
+    for estimator in trees:
+        tree = estimator.tree_
+        order = _breadth_first(tree.children_left, tree.children_right)
+        new_index = np.empty_like(order)
+        new_index[order] = np.arange(len(order))
+        leaf = tree.children_left[order] == -1
+        missing_left = getattr(tree, "missing_go_to_left", None)
+        missing_left = np.zeros(tree.node_count, dtype=bool) if missing_left is None else missing_left.astype(bool)
+        # Leaves loop back to themselves, so extra traversal steps are no-ops
+        parts["feature"].append(np.where(leaf, 0, tree.feature[order]))
+        parts["threshold"].append(np.where(leaf, np.inf, _round_down_float32(tree.threshold[order])))
+        parts["left"].append(np.where(leaf, np.arange(len(order)), new_index[tree.children_left[order]]) + offset)
+        parts["missing_left"].append(leaf | missing_left[order])
+        if classifier:
+            value = tree.value[order, 0, :]
+            totals = value.sum(axis=1, keepdims=True)
+            # Older scikit-learn stores class counts instead of fractions
+            if not np.allclose(totals, 1.0):
+                value = value / totals
+        else:
+            value = tree.value[order, 0, 0]
+        parts["value"].append(value)
+        roots.append(offset)
+        offset += tree.node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    importances = getattr(model, "feature_importances_", None)
+    return FlatForest(
+        feature=np.concatenate(parts["feature"]).astype(np.intp),
+        threshold=np.concatenate(parts["threshold"]).astype(np.float32),
+        left=np.concatenate(parts["left"]).astype(np.intp),
+        missing_left=np.concatenate(parts["missing_left"]),
+        value=np.ascontiguousarray(np.concatenate(parts["value"]), dtype=np.float64),
+        roots=np.array(roots, dtype=np.intp),
+        max_depth=int(max_depth),
+        n_features_in_=int(model.n_features_in_),
+        classes_=np.asarray(model.classes_) if classifier else None,
+        feature_importances_=None if importances is None else np.asarray(importances, dtype=np.float64),
+    )
+
+
+def check_parity(model, flat: FlatForest, X: np.ndarray) -> Dict[str, float]:
+    """
+    Compare a flattened forest with the scikit-learn model it came from.
+
+    Args:
+        model: Fitted scikit-learn model
+        flat: flatten_forest(model)
+        X: Feature rows to compare on
+
+    Returns:
+        {"max_abs_diff": ..., "label_mismatches": ...} (label mismatches are 0 for regressors)
+    """
+    if flat.classes_ is None:
+        return {"max_abs_diff": float(np.max(np.abs(model.predict(X) - flat.predict(X)))), "label_mismatches": 0}
+    expected, actual = model.predict_proba(X), flat.predict_proba(X)
+    return {
+        "max_abs_diff": float(np.max(np.abs(expected - actual))),
+        "label_mismatches": int(np.count_nonzero(model.predict(X) != flat.predict(X))),
+    }
+
+
+def export_artifact(version: str, model_dir: Optional[str] = None, parity_rows: int = DEFAULT_PARITY_ROWS,
+                    flat_version: Optional[str] = None) -> Path:
+    """
+    Write a flat-kernel copy of a random forest artifact as a new version.
+
+    Args:
+        version: Version of the trained artifact to export
+        model_dir: Artifact root; defaults to api/models
+        parity_rows: Synthetic rows the flat models must reproduce exactly
+        flat_version: Version label of the export; defaults to <version>-flat
+
+    Returns:
+        Path of the exported model.joblib
+
+    Raises:
+        ValueError: If the artifact is not a forest (or is scaled) or parity fails
+    """
+    source = load_model_artifact(Path(model_dir or DEFAULT_MODEL_DIR) / version / ARTIFACT_FILENAME)
+    if source.scaler is not None:
+        raise ValueError(f"{version}: scaled (linear) models cannot be exported to the tree kernel")
+
+    models = [source.regressor] + ([source.classifier] if source.classifier is not None else [])
+    flat_models = [flatten_forest(model) for model in models]
+
+    X = dataset.synthetic_cohort(parity_rows, seed=PARITY_SEED, feature_names=source.feature_names).X
+    parity = {}
+    for role, model, flat in zip(("regressor", "classifier"), models, flat_models):
+        parity[role] = check_parity(model, flat, X)
+        if parity[role]["max_abs_diff"] > PARITY_TOLERANCE or parity[role]["label_mismatches"]:
+            raise ValueError(f"{version}: flat {role} does not match scikit-learn: {parity[role]}")
+
+    flat_regressor, flat_classifier = flat_models[0], (flat_models[1] if len(flat_models) > 1 else None)
+    metadata = {
+        **source.metadata,
+        "kernel": "flat",
+        "exported_from": source.version,
+        "parity": {"rows": parity_rows, "tolerance": PARITY_TOLERANCE, **parity},
+        "nodes": sum(flat.n_nodes for flat in flat_models),
+    }
+    return artifact.save_artifact(
+        (flat_regressor, flat_classifier, None), source.feature_names, metadata,
+        flat_version or version + FLAT_SUFFIX, model_dir,
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export a random forest artifact to the flat NumPy kernel.")
+    parser.add_argument("version", help="Trained artifact version (directory name under the model dir)")
+    parser.add_argument("--model-dir", help="Artifact root; defaults to api/models")
+    parser.add_argument("--parity-rows", type=int, default=DEFAULT_PARITY_ROWS)
+    parser.add_argument("--flat-version", help="Version label of the export; defaults to <version>-flat")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        path = export_artifact(args.version, args.model_dir, args.parity_rows, args.flat_version)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"Wrote {path} in {time.perf_counter() - started:.1f}s (parity checked on {args.parity_rows:,} rows)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,23 @@
-from .dependencies import get_prediction_service
+from .dependencies import (
+    get_assessment_store,
+    get_assessment_writer,
+    get_micro_batcher,
+    get_model_registry,
+    get_prediction_cache,
+    get_prediction_service,
+    get_risk_rules,
+    get_scoring_executor,
+    get_scoring_plans,
+)
 
-__all__ = ["get_prediction_service"]
+__all__ = [
+    "get_assessment_store",
+    "get_assessment_writer",
+    "get_micro_batcher",
+    "get_model_registry",
+    "get_prediction_cache",
+    "get_prediction_service",
+    "get_risk_rules",
+    "get_scoring_executor",
+    "get_scoring_plans",
+]
@@ -2,18 +2,282 @@
 Dependency injection utilities.
 Follows Dependency Inversion Principle - high-level modules depend on abstractions.
 """
+import os
 from functools import lru_cache
+from typing import Awaitable, Callable, Optional, TypeVar
 
+from services.assessment_store import (
+    ASSESSMENT_DB_ENV,
+    IAssessmentStore,
+    SQLiteAssessmentStore,
+)
+from services.assessment_writer import (
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_MAX_PENDING,
+    DEFAULT_WRITE_BATCH_SIZE,
+    FLUSH_INTERVAL_ENV,
+    MAX_PENDING_ENV,
+    WRITE_BATCH_SIZE_ENV,
+    AssessmentWriteBehind,
+)
+from services.job_runner import (
+    DEFAULT_JOB_DIR,
+    DEFAULT_JOB_NICE,
+    DEFAULT_JOB_WORKERS,
+    DEFAULT_MAX_QUEUED_JOBS,
+    JOB_DIR_ENV,
+    JOB_MAX_QUEUED_ENV,
+    JOB_NICE_ENV,
+    JOB_WORKERS_ENV,
+    JobRunner,
+)
+from services.job_store import JOB_DB_ENV, IJobStore, SQLiteJobStore
+from services.micro_batcher import (
+    DEFAULT_MAX_BATCH_SIZE,
+    MICROBATCH_SIZE_ENV,
+    MICROBATCH_WAIT_ENV,
+    MicroBatcher,
+)
+from services.model_registry import ModelRegistry, load_model_registry
+from services.prediction_cache import (
+    CACHE_SIZE_ENV,
+    CACHE_TTL_ENV,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL_SECONDS,
+    CachedPredictionService,
+    LRUTTLCache,
+)
 from services.prediction_service import PredictionService, IPredictionService
+from services.risk_rules import DEFAULT_RELOAD_SECONDS, RISK_RULES_RELOAD_ENV, RiskRuleProvider
+from services.scoring_executor import (
+    EXECUTOR_ENV,
+    EXECUTOR_WORKERS_ENV,
+    INLINE,
+    MAX_QUEUE_DEPTH_ENV,
+    MAX_STREAMS_ENV,
+    ScoringExecutor,
+)
+from services.scoring_plan import ScoringPlanSet, load_scoring_plans
+
+ENGINE_ENV = "ULTRAVIAB_ENGINE"
+RULES_ENGINE = "rules"
+MODEL_ENGINE = "model"
+
+T = TypeVar("T")
+
+
+def get_engine() -> str:
+    """Scoring engine selected by $ULTRAVIAB_ENGINE: "rules" (default) or "model"."""
+    engine = os.environ.get(ENGINE_ENV, RULES_ENGINE).strip().lower()
+    if engine not in (RULES_ENGINE, MODEL_ENGINE):
+        raise ValueError(f"{ENGINE_ENV} must be '{RULES_ENGINE}' or '{MODEL_ENGINE}', got '{engine}'")
+    return engine
+
+
+@lru_cache()
+def resolved_inline(getter: Callable[[], T]) -> Callable[[], Awaitable[T]]:
+    """
+    Async form of a cached getter, for Depends() on latency-sensitive routes.
+    FastAPI runs plain-def dependencies on its threadpool, one thread hop per
+    dependency per request; once the app has started, these getters just return
+    a cached object, which is cheaper to do on the event loop. The same wrapper
+    is returned for a given getter, so it can be a dependency_overrides key.
+    
+    Args:
+        getter: One of the lru_cache'd get_* functions below
+        
+    Returns:
+        Coroutine function returning getter()
+    """
+    async def dependency() -> T:
+        return getter()
+
+    dependency.__name__ = dependency.__qualname__ = getter.__name__
+    dependency.__doc__ = getter.__doc__
+    return dependency
+
+
+@lru_cache()
+def get_scoring_plans() -> ScoringPlanSet:
+    """
+    Load and compile the per-organ scoring plans once per process.
+    
+    Returns:
+        Compiled ScoringPlanSet
+    """
+    return load_scoring_plans()
+
+
+@lru_cache()
+def get_risk_rules() -> RiskRuleProvider:
+    """
+    Per-organ risk rules, re-read when their file changes (checked every
+    $ULTRAVIAB_RISK_RULES_RELOAD_SECONDS; 0 disables reloading).
+    
+    Returns:
+        Shared RiskRuleProvider
+    """
+    reload_seconds = float(os.environ.get(RISK_RULES_RELOAD_ENV, DEFAULT_RELOAD_SECONDS))
+    return RiskRuleProvider(reload_seconds=reload_seconds)
+
+
+@lru_cache()
+def get_model_registry() -> ModelRegistry:
+    """
+    Load every model artifact once per process (before workers fork, when preloaded).
+    
+    Returns:
+        ModelRegistry, empty when the rule-based engine is serving
+    """
+    if get_engine() != MODEL_ENGINE:
+        return ModelRegistry({})
+    return load_model_registry()
+
+
+@lru_cache()
+def get_prediction_cache() -> Optional[LRUTTLCache]:
+    """
+    Response cache sized by $ULTRAVIAB_CACHE_SIZE (0 disables) and $ULTRAVIAB_CACHE_TTL_SECONDS.
+    
+    Returns:
+        Shared LRUTTLCache, or None when caching is disabled
+    """
+    max_entries = int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+    if max_entries <= 0:
+        return None
+    ttl_seconds = float(os.environ.get(CACHE_TTL_ENV, DEFAULT_CACHE_TTL_SECONDS))
+    return LRUTTLCache(max_entries, ttl_seconds)
 
 
 @lru_cache()
 def get_prediction_service() -> IPredictionService:
     """
-    Dependency injection for PredictionService.
+    Dependency injection for the prediction service.
     Uses caching to maintain singleton instance.
     
     Returns:
-        IPredictionService implementation
+        IPredictionService implementation for the configured engine
+    """
+    if get_engine() == MODEL_ENGINE:
+        from services.model_service import ModelPredictionService
+        service = ModelPredictionService(get_model_registry().active, get_risk_rules())
+    else:
+        service = PredictionService(get_scoring_plans(), get_risk_rules())
+
+    cache = get_prediction_cache()
+    return CachedPredictionService(service, cache) if cache is not None else service
+
+
+@lru_cache()
+def get_scoring_executor() -> ScoringExecutor:
+    """
+    Executor running scoring calls, configured by $ULTRAVIAB_EXECUTOR
+    ("inline", "thread" or "process"), $ULTRAVIAB_EXECUTOR_WORKERS,
+    $ULTRAVIAB_MAX_QUEUE_DEPTH and $ULTRAVIAB_MAX_STREAMS.
+    
+    Returns:
+        Shared ScoringExecutor wrapping the prediction service
+    """
+    workers = os.environ.get(EXECUTOR_WORKERS_ENV)
+    max_queue_depth = os.environ.get(MAX_QUEUE_DEPTH_ENV)
+    max_streams = os.environ.get(MAX_STREAMS_ENV)
+    return ScoringExecutor(
+        get_prediction_service(),
+        service_factory=get_prediction_service,
+        mode=os.environ.get(EXECUTOR_ENV, INLINE).strip().lower(),
+        workers=int(workers) if workers else None,
+        max_queue_depth=int(max_queue_depth) if max_queue_depth else None,
+        max_streams=int(max_streams) if max_streams else None,
+    )
+
+
+@lru_cache()
+def get_micro_batcher() -> Optional[MicroBatcher]:
+    """
+    Opt-in coalescer for concurrent single predictions, enabled by a positive
+    $ULTRAVIAB_MICROBATCH_WAIT_MS and capped by $ULTRAVIAB_MICROBATCH_MAX_SIZE.
+    
+    Returns:
+        Shared MicroBatcher, or None when micro-batching is disabled
+    """
+    max_wait_ms = float(os.environ.get(MICROBATCH_WAIT_ENV, 0))
+    if max_wait_ms <= 0:
+        return None
+    max_batch_size = int(os.environ.get(MICROBATCH_SIZE_ENV, DEFAULT_MAX_BATCH_SIZE))
+    return MicroBatcher(get_scoring_executor(), max_wait_ms / 1000, max_batch_size)
+
+
+@lru_cache()
+def get_assessment_store() -> Optional[IAssessmentStore]:
+    """
+    Assessment history store at $ULTRAVIAB_ASSESSMENT_DB. Persistence is
+    opt-in: nothing is stored unless the variable names a database path.
+    
+    Returns:
+        Shared IAssessmentStore, or None when persistence is disabled
+    """
+    path = os.environ.get(ASSESSMENT_DB_ENV)
+    if not path:
+        return None
+    return SQLiteAssessmentStore(path)
+
+
+@lru_cache()
+def get_assessment_writer() -> Optional[AssessmentWriteBehind]:
+    """
+    Write-behind buffer in front of the assessment store, tuned by
+    $ULTRAVIAB_ASSESSMENT_BATCH_SIZE, $ULTRAVIAB_ASSESSMENT_FLUSH_MS and
+    $ULTRAVIAB_ASSESSMENT_MAX_PENDING.
+    
+    Returns:
+        Shared AssessmentWriteBehind, or None when persistence is disabled
+    """
+    store = get_assessment_store()
+    if store is None:
+        return None
+    flush_ms = os.environ.get(FLUSH_INTERVAL_ENV)
+    return AssessmentWriteBehind(
+        store,
+        batch_size=int(os.environ.get(WRITE_BATCH_SIZE_ENV, DEFAULT_WRITE_BATCH_SIZE)),
+        flush_interval_seconds=float(flush_ms) / 1000 if flush_ms else DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending=int(os.environ.get(MAX_PENDING_ENV, DEFAULT_MAX_PENDING)),
+    )
+
+
+@lru_cache()
+def get_job_store() -> Optional[IJobStore]:
+    """
+    Bulk scoring job queue at $ULTRAVIAB_JOB_DB. Jobs are opt-in: /jobs is
+    disabled unless the variable names a database path.
+    
+    Returns:
+        Shared IJobStore, or None when jobs are disabled
+    """
+    path = os.environ.get(JOB_DB_ENV)
+    if not path:
+        return None
+    return SQLiteJobStore(path)
+
+
+@lru_cache()
+def get_job_runner() -> Optional[JobRunner]:
+    """
+    Runner for bulk scoring jobs, with $ULTRAVIAB_JOB_WORKERS worker processes
+    niced by $ULTRAVIAB_JOB_NICE, at most $ULTRAVIAB_JOB_MAX_QUEUED waiting jobs
+    and job files under $ULTRAVIAB_JOB_DIR.
+    
+    Returns:
+        Shared JobRunner, or None when jobs are disabled
     """
-    return PredictionService()
+    store = get_job_store()
+    if store is None:
+        return None
+    return JobRunner(
+        store,
+        store_path=store.path,
+        service_factory=get_prediction_service,
+        job_dir=os.environ.get(JOB_DIR_ENV) or str(DEFAULT_JOB_DIR),
+        workers=int(os.environ.get(JOB_WORKERS_ENV, DEFAULT_JOB_WORKERS)),
+        max_queued=int(os.environ.get(JOB_MAX_QUEUED_ENV, DEFAULT_MAX_QUEUED_JOBS)),
+        nice=int(os.environ.get(JOB_NICE_ENV, DEFAULT_JOB_NICE)),
+    )
@@ -1,4 +1,5 @@
 import { AssessmentFormData, AnalysisResult } from "@/types/assessment";
+import { ARROW_STREAM, readArrowStream, toPredictions } from "@/services/arrow";
 
 // Change to your ngrok/Railway URL for real device testing
 const BASE_URL = "http://localhost:8000";
@@ -72,6 +73,30 @@ export const getPrediction = async (
   return await response.json();
 };
 
+/**
+ * Score many assessments in one call. The predictions come back as an Arrow
+ * IPC stream, less than half the size of the JSON batch response.
+ */
+export const getPredictionBatch = async (
+  requests: PredictionRequest[],
+): Promise<PredictionResponse[]> => {
+  const response = await fetch(`${BASE_URL}/predict/batch`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+      Accept: ARROW_STREAM,
+    },
+    body: JSON.stringify({ requests }),
+  });
+
+  if (!response.ok) {
+    const errorText = await response.text();
+    throw new Error(`Batch prediction failed: ${response.status} - ${errorText}`);
+  }
+
+  return toPredictions(readArrowStream(await response.arrayBuffer()));
+};
+
 /**
  * High-level function to predict organ viability from form data
  */
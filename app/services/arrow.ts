@@ -0,0 +1,315 @@
+import type { PredictionResponse } from "@/services/api";
+
+/**
+ * Minimal reader for the Arrow IPC streams returned by /predict and
+ * /predict/batch when a client sends `Accept: application/vnd.apache.arrow.stream`.
+ *
+ * Covers the column types those responses use - integers, floats, UTF-8
+ * strings and lists of strings, with nulls - without pulling apache-arrow
+ * (and its BigInt and TextDecoder requirements) into the app bundle.
+ */
+
+export const ARROW_STREAM = "application/vnd.apache.arrow.stream";
+
+const CONTRIBUTION_PREFIX = "contribution_";
+
+// Arrow format enums (Message.fbs / Schema.fbs)
+const HEADER_SCHEMA = 1;
+const HEADER_DICTIONARY_BATCH = 2;
+const HEADER_RECORD_BATCH = 3;
+const TYPE_NULL = 1;
+const TYPE_INT = 2;
+const TYPE_FLOATING_POINT = 3;
+const TYPE_UTF8 = 5;
+const TYPE_LIST = 12;
+const PRECISION_SINGLE = 1;
+const PRECISION_DOUBLE = 2;
+
+export type ArrowValue = number | string | ArrowValue[] | null;
+
+export interface ArrowTable {
+  numRows: number;
+  columns: Record<string, ArrowValue[]>;
+}
+
+interface ArrowField {
+  name: string;
+  typeId: number;
+  bitWidth: number;
+  signed: boolean;
+  precision: number;
+  children: ArrowField[];
+}
+
+interface BufferRef {
+  offset: number;
+  length: number;
+}
+
+interface BatchCursor {
+  body: number;
+  nodes: number[];
+  buffers: BufferRef[];
+  node: number;
+  buffer: number;
+}
+
+// --- FlatBuffers access: tables are addressed by absolute byte position ---
+
+const fieldPos = (view: DataView, table: number, index: number): number => {
+  const vtable = table - view.getInt32(table, true);
+  const entry = 4 + 2 * index;
+  if (entry >= view.getUint16(vtable, true)) return 0;
+  const offset = view.getUint16(vtable + entry, true);
+  return offset ? table + offset : 0;
+};
+
+const deref = (view: DataView, pos: number): number =>
+  pos + view.getUint32(pos, true);
+
+const int64 = (view: DataView, pos: number): number =>
+  view.getInt32(pos + 4, true) * 2 ** 32 + view.getUint32(pos, true);
+
+const readUint8Field = (view: DataView, table: number, index: number): number => {
+  const pos = fieldPos(view, table, index);
+  return pos ? view.getUint8(pos) : 0;
+};
+
+const readInt16Field = (view: DataView, table: number, index: number): number => {
+  const pos = fieldPos(view, table, index);
+  return pos ? view.getInt16(pos, true) : 0;
+};
+
+const readInt32Field = (view: DataView, table: number, index: number): number => {
+  const pos = fieldPos(view, table, index);
+  return pos ? view.getInt32(pos, true) : 0;
+};
+
+const readInt64Field = (view: DataView, table: number, index: number): number => {
+  const pos = fieldPos(view, table, index);
+  return pos ? int64(view, pos) : 0;
+};
+
+const readTableField = (view: DataView, table: number, index: number): number => {
+  const pos = fieldPos(view, table, index);
+  return pos ? deref(view, pos) : 0;
+};
+
+/** Start of each element of a vector field, given the element size (offsets are followed for tables) */
+const readVectorField = (
+  view: DataView,
+  table: number,
+  index: number,
+  structSize = 0,
+): number[] => {
+  const pos = fieldPos(view, table, index);
+  if (!pos) return [];
+  const vector = deref(view, pos);
+  const length = view.getUint32(vector, true);
+  const items: number[] = [];
+  for (let i = 0; i < length; i++) {
+    const item = vector + 4 + i * (structSize || 4);
+    items.push(structSize ? item : deref(view, item));
+  }
+  return items;
+};
+
+/**
+ * Decode UTF-8 bytes; Hermes does not ship TextDecoder
+ */
+const decodeUtf8 = (bytes: Uint8Array, start: number, end: number): string => {
+  let text = "";
+  let i = start;
+  while (i < end) {
+    const byte = bytes[i++];
+    let code = byte;
+    if (byte >= 0xf0) {
+      code = ((byte & 0x07) << 18) | ((bytes[i++] & 0x3f) << 12) | ((bytes[i++] & 0x3f) << 6) | (bytes[i++] & 0x3f);
+    } else if (byte >= 0xe0) {
+      code = ((byte & 0x0f) << 12) | ((bytes[i++] & 0x3f) << 6) | (bytes[i++] & 0x3f);
+    } else if (byte >= 0xc0) {
+      code = ((byte & 0x1f) << 6) | (bytes[i++] & 0x3f);
+    }
+    if (code > 0xffff) {
+      code -= 0x10000;
+      text += String.fromCharCode(0xd800 + (code >> 10), 0xdc00 + (code & 0x3ff));
+    } else {
+      text += String.fromCharCode(code);
+    }
+  }
+  return text;
+};
+
+const readString = (view: DataView, bytes: Uint8Array, pos: number): string => {
+  const length = view.getUint32(pos, true);
+  return decodeUtf8(bytes, pos + 4, pos + 4 + length);
+};
+
+// --- Arrow messages ---
+
+const readField = (view: DataView, bytes: Uint8Array, table: number): ArrowField => {
+  const namePos = readTableField(view, table, 0);
+  const typeId = readUint8Field(view, table, 2);
+  const type = readTableField(view, table, 3);
+  const field: ArrowField = {
+    name: namePos ? readString(view, bytes, namePos) : "",
+    typeId,
+    bitWidth: 0,
+    signed: false,
+    precision: 0,
+    children: readVectorField(view, table, 5).map((child) => readField(view, bytes, child)),
+  };
+  if (readTableField(view, table, 4)) {
+    throw new Error(`Arrow column '${field.name}' is dictionary-encoded`);
+  }
+  if (typeId === TYPE_INT) {
+    field.bitWidth = readInt32Field(view, type, 0);
+    field.signed = readUint8Field(view, type, 1) !== 0;
+  } else if (typeId === TYPE_FLOATING_POINT) {
+    field.precision = readInt16Field(view, type, 0);
+    if (field.precision !== PRECISION_SINGLE && field.precision !== PRECISION_DOUBLE) {
+      throw new Error(`Arrow column '${field.name}' uses half-precision floats`);
+    }
+  } else if (typeId !== TYPE_NULL && typeId !== TYPE_UTF8 && typeId !== TYPE_LIST) {
+    throw new Error(`Arrow column '${field.name}' has unsupported type ${typeId}`);
+  }
+  return field;
+};
+
+const readColumn = (
+  view: DataView,
+  bytes: Uint8Array,
+  field: ArrowField,
+  cursor: BatchCursor,
+): ArrowValue[] => {
+  const length = cursor.nodes[cursor.node++];
+  const values: ArrowValue[] = new Array(length).fill(null);
+  if (field.typeId === TYPE_NULL) return values; // no buffers at all
+
+  const validity = cursor.buffers[cursor.buffer++];
+  const validityStart = cursor.body + validity.offset;
+  const isValid = (i: number): boolean =>
+    validity.length === 0 || (bytes[validityStart + (i >> 3)] & (1 << (i & 7))) !== 0;
+
+  if (field.typeId === TYPE_INT || field.typeId === TYPE_FLOATING_POINT) {
+    const data = cursor.body + cursor.buffers[cursor.buffer++].offset;
+    for (let i = 0; i < length; i++) {
+      if (!isValid(i)) continue;
+      if (field.typeId === TYPE_FLOATING_POINT) {
+        values[i] = field.precision === PRECISION_DOUBLE
+          ? view.getFloat64(data + 8 * i, true)
+          : view.getFloat32(data + 4 * i, true);
+      } else if (field.bitWidth === 64) {
+        const pos = data + 8 * i;
+        const high = field.signed ? view.getInt32(pos + 4, true) : view.getUint32(pos + 4, true);
+        values[i] = high * 2 ** 32 + view.getUint32(pos, true);
+      } else if (field.bitWidth === 32) {
+        values[i] = field.signed ? view.getInt32(data + 4 * i, true) : view.getUint32(data + 4 * i, true);
+      } else if (field.bitWidth === 16) {
+        values[i] = field.signed ? view.getInt16(data + 2 * i, true) : view.getUint16(data + 2 * i, true);
+      } else {
+        values[i] = field.signed ? view.getInt8(data + i) : view.getUint8(data + i);
+      }
+    }
+    return values;
+  }
+
+  const offsets = cursor.body + cursor.buffers[cursor.buffer++].offset;
+  const offset = (i: number): number => view.getInt32(offsets + 4 * i, true);
+  if (field.typeId === TYPE_UTF8) {
+    const data = cursor.body + cursor.buffers[cursor.buffer++].offset;
+    for (let i = 0; i < length; i++) {
+      if (isValid(i)) values[i] = decodeUtf8(bytes, data + offset(i), data + offset(i + 1));
+    }
+    return values;
+  }
+
+  // List: the child column holds every row's items back to back
+  const items = readColumn(view, bytes, field.children[0], cursor);
+  for (let i = 0; i < length; i++) {
+    if (isValid(i)) values[i] = items.slice(offset(i), offset(i + 1));
+  }
+  return values;
+};
+
+/**
+ * Decode an Arrow IPC stream into plain column arrays
+ */
+export const readArrowStream = (buffer: ArrayBuffer): ArrowTable => {
+  const view = new DataView(buffer);
+  const bytes = new Uint8Array(buffer);
+  let fields: ArrowField[] | null = null;
+  const table: ArrowTable = { numRows: 0, columns: {} };
+
+  let pos = 0;
+  while (pos + 4 <= buffer.byteLength) {
+    let metadataLength = view.getInt32(pos, true);
+    pos += 4;
+    if (metadataLength === -1) {
+      // Continuation marker, followed by the real length
+      metadataLength = view.getInt32(pos, true);
+      pos += 4;
+    }
+    if (metadataLength === 0) break; // end of stream
+
+    const message = deref(view, pos);
+    const headerType = readUint8Field(view, message, 1);
+    const header = readTableField(view, message, 2);
+    const body = pos + metadataLength;
+    pos = body + readInt64Field(view, message, 3);
+
+    if (headerType === HEADER_SCHEMA) {
+      fields = readVectorField(view, header, 1).map((field) => readField(view, bytes, field));
+      for (const field of fields) table.columns[field.name] = [];
+    } else if (headerType === HEADER_RECORD_BATCH) {
+      if (fields === null) throw new Error("Arrow record batch before its schema");
+      if (readTableField(view, header, 3)) throw new Error("Compressed Arrow streams are not supported");
+      const cursor: BatchCursor = {
+        body,
+        nodes: readVectorField(view, header, 1, 16).map((node) => int64(view, node)),
+        buffers: readVectorField(view, header, 2, 16).map((ref) => ({
+          offset: int64(view, ref),
+          length: int64(view, ref + 8),
+        })),
+        node: 0,
+        buffer: 0,
+      };
+      for (const field of fields) {
+        const column = table.columns[field.name];
+        for (const value of readColumn(view, bytes, field, cursor)) column.push(value);
+      }
+      table.numRows += readInt64Field(view, header, 0);
+    } else if (headerType === HEADER_DICTIONARY_BATCH) {
+      throw new Error("Dictionary-encoded Arrow streams are not supported");
+    }
+  }
+  if (fields === null) throw new Error("Not an Arrow IPC stream");
+  return table;
+};
+
+/**
+ * Rebuild prediction responses from a decoded /predict or /predict/batch table
+ */
+export const toPredictions = (table: ArrowTable): PredictionResponse[] => {
+  const { columns } = table;
+  const contributions = Object.keys(columns).filter((name) => name.startsWith(CONTRIBUTION_PREFIX));
+  const predictions: PredictionResponse[] = [];
+  for (let i = 0; i < table.numRows; i++) {
+    const error = columns.error?.[i];
+    if (error != null) throw new Error(`Row ${i} was not scored: ${error}`);
+
+    const feature_contributions: Record<string, number> = {};
+    for (const name of contributions) {
+      const value = columns[name][i];
+      if (value != null) feature_contributions[name.slice(CONTRIBUTION_PREFIX.length)] = value as number;
+    }
+    predictions.push({
+      viability_score: columns.viability_score[i] as number,
+      classification: columns.classification[i] as string,
+      confidence: columns.confidence[i] as number,
+      risk_factors: (columns.risk_factors[i] ?? []) as string[],
+      feature_contributions,
+    });
+  }
+  return predictions;
+};
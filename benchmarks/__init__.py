@@ -0,0 +1,13 @@
+"""
+Benchmark suite for the UltraViab scoring path.
+Run from the repository root: python -m benchmarks.run --help
+"""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+API_DIR = REPO_ROOT / "api"
+
+# The API uses top-level imports (schemas, services, ...) rooted at api/
+if str(API_DIR) not in sys.path:
+    sys.path.insert(0, str(API_DIR))
@@ -0,0 +1,259 @@
+"""
+Request/response codec benchmarks: per-request overhead of the fast-path JSON
+codec against the pydantic path FastAPI takes for a declared body parameter and
+response_model, in isolation and through /predict and /predict/batch, and the
+cost and size per row of /predict/batch with JSON and Arrow IPC bodies.
+
+The "before" route is the previous /predict implementation, served by the same
+executor: a declared PredictionRequest body, response_model re-validation and
+threadpool-resolved dependencies. Both routes are called in process through
+ASGI, without a server, so the difference is the per-request overhead alone.
+
+    python -m benchmarks.bench_codec --requests 5000
+"""
+import argparse
+import asyncio
+import io
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+from fastapi import Depends, FastAPI
+from pydantic import TypeAdapter
+
+from controllers import prediction_controller
+from schemas.prediction import BatchPredictionRequest, BatchPredictionResponse, PredictionRequest, PredictionResponse
+from services import request_codec
+from services.assessment_writer import AssessmentWriteBehind
+from services.micro_batcher import MicroBatcher
+from services.scoring_executor import ScoringExecutor
+from utils.dependencies import get_assessment_writer, get_micro_batcher, get_scoring_executor
+
+from benchmarks.cohort import cohort_requests, cohort_table
+
+Result = Dict[str, dict]
+
+BATCH_SIZE = 256
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+# The fast path must cost less per request than the pydantic path it replaces
+OVERHEAD_LIMIT_PCT = 100.0
+
+_RESPONSE = TypeAdapter(PredictionResponse)
+_BATCH_RESPONSE = TypeAdapter(BatchPredictionResponse)
+
+
+def _per_item_us(fn: Callable[[object], object], items: list, rows_per_item: int = 1) -> float:
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - started) / (len(items) * rows_per_item) * 1e6
+
+
+def _pydantic_decode(body: bytes) -> PredictionRequest:
+    # FastAPI: request.json(), then the body field's validate_python
+    return PredictionRequest.model_validate(json.loads(body), from_attributes=True)
+
+
+def _pydantic_encode(adapter: TypeAdapter, content) -> bytes:
+    # FastAPI: serialize_response validates against response_model, dumps to
+    # JSON-able Python, then JSONResponse renders it with json.dumps
+    value = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(
+        adapter.dump_python(value, mode="json"), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def bench_in_process(payloads: List[dict]) -> Result:
+    """Decode and encode alone, for single requests and BATCH_SIZE-row batches."""
+    service = get_scoring_executor().service
+    bodies = [json.dumps(payload).encode() for payload in payloads]
+    requests = [PredictionRequest(**payload) for payload in payloads]
+    predictions = service.predict_batch(requests)
+    batches = [payloads[i:i + BATCH_SIZE] for i in range(0, len(payloads) - BATCH_SIZE + 1, BATCH_SIZE)]
+    batch_bodies = [json.dumps({"requests": batch}).encode() for batch in batches]
+    batch_predictions = [predictions[i:i + BATCH_SIZE] for i in range(0, len(batches) * BATCH_SIZE, BATCH_SIZE)]
+
+    timings = {
+        "decode_us": (
+            _per_item_us(_pydantic_decode, bodies),
+            _per_item_us(request_codec.decode_request, bodies),
+        ),
+        "encode_us": (
+            _per_item_us(lambda prediction: _pydantic_encode(_RESPONSE, prediction), predictions),
+            _per_item_us(request_codec.encode_prediction, predictions),
+        ),
+        "batch_decode_us_per_row": (
+            _per_item_us(lambda body: BatchPredictionRequest.model_validate(json.loads(body)), batch_bodies, BATCH_SIZE),
+            _per_item_us(request_codec.decode_batch, batch_bodies, BATCH_SIZE),
+        ),
+        "batch_encode_us_per_row": (
+            _per_item_us(
+                lambda batch: _pydantic_encode(_BATCH_RESPONSE, BatchPredictionResponse(predictions=batch)),
+                batch_predictions, BATCH_SIZE,
+            ),
+            _per_item_us(request_codec.encode_batch, batch_predictions, BATCH_SIZE),
+        ),
+    }
+    results: Result = {}
+    for name, (before, after) in timings.items():
+        unit = "us/row" if name.endswith("per_row") else "us/request"
+        results[f"codec.pydantic_{name}"] = {"value": before, "unit": unit, "better": "lower"}
+        results[f"codec.fast_{name}"] = {"value": after, "unit": unit, "better": "lower"}
+    return results
+
+
+def _benchmark_app() -> FastAPI:
+    """The current prediction routes plus the previous /predict and /predict/batch under /pydantic."""
+    app = FastAPI()
+    app.include_router(prediction_controller.router)
+
+    @app.post("/pydantic/predict", response_model=PredictionResponse)
+    async def predict(
+        request: PredictionRequest,
+        executor: ScoringExecutor = Depends(get_scoring_executor),
+        batcher: Optional[MicroBatcher] = Depends(get_micro_batcher),
+        writer: Optional[AssessmentWriteBehind] = Depends(get_assessment_writer)
+    ) -> PredictionResponse:
+        if batcher is not None:
+            prediction = await batcher.predict(request)
+        else:
+            prediction = await executor.predict(request)
+        prediction_controller._record(writer, executor, [request], [prediction])
+        return prediction
+
+    @app.post("/pydantic/predict/batch", response_model=BatchPredictionResponse)
+    async def predict_batch(
+        request: BatchPredictionRequest,
+        executor: ScoringExecutor = Depends(get_scoring_executor),
+        writer: Optional[AssessmentWriteBehind] = Depends(get_assessment_writer)
+    ) -> BatchPredictionResponse:
+        predictions = await executor.predict_batch(request.requests)
+        prediction_controller._record(writer, executor, request.requests, predictions)
+        return BatchPredictionResponse(predictions=predictions)
+
+    return app
+
+
+async def _post(app: FastAPI, path: str, body: bytes, content_type: str = "application/json") -> int:
+    """POST body to path through the ASGI app; returns the status code."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def _route_us(app: FastAPI, path: str, bodies: List[bytes], rows_per_body: int = 1,
+                    content_type: str = "application/json") -> float:
+    for body in bodies[:50]:
+        status = await _post(app, path, body, content_type)
+        if status != 200:
+            raise RuntimeError(f"{path} returned {status}")
+    started = time.perf_counter()
+    for body in bodies:
+        await _post(app, path, body, content_type)
+    return (time.perf_counter() - started) / (len(bodies) * rows_per_body) * 1e6
+
+
+def bench_routes(payloads: List[dict]) -> Result:
+    """Sequential calls through both versions of the routes."""
+    # Warm the shared dependencies, as the app's lifespan does
+    get_scoring_executor(), get_micro_batcher(), get_assessment_writer()
+    app = _benchmark_app()
+    bodies = [json.dumps(payload).encode() for payload in payloads]
+    batch_bodies = [
+        json.dumps({"requests": payloads[i:i + BATCH_SIZE]}).encode()
+        for i in range(0, len(payloads) - BATCH_SIZE + 1, BATCH_SIZE)
+    ]
+
+    async def measure():
+        return (
+            await _route_us(app, "/pydantic/predict", bodies),
+            await _route_us(app, "/predict", bodies),
+            await _route_us(app, "/pydantic/predict/batch", batch_bodies, BATCH_SIZE),
+            await _route_us(app, "/predict/batch", batch_bodies, BATCH_SIZE),
+        )
+
+    single_before, single_after, batch_before, batch_after = asyncio.run(measure())
+    return {
+        "codec.pydantic_predict_route_us": {"value": single_before, "unit": "us/request", "better": "lower"},
+        "codec.fast_predict_route_us": {"value": single_after, "unit": "us/request", "better": "lower"},
+        "codec.pydantic_batch_route_us_per_row": {"value": batch_before, "unit": "us/row", "better": "lower"},
+        "codec.fast_batch_route_us_per_row": {"value": batch_after, "unit": "us/row", "better": "lower"},
+        "codec.predict_route_cost_pct": {
+            "value": single_after / single_before * 100, "unit": "% of pydantic route", "better": "lower",
+            "limit": OVERHEAD_LIMIT_PCT,
+        },
+    }
+
+
+def bench_wire_formats(rows: int, repeats: int = 5) -> Result:
+    """One /predict/batch call of `rows` rows, as a JSON body and as an Arrow IPC stream."""
+    import pyarrow as pa
+
+    table = cohort_table(rows)
+    table = table.select([name for name in table.schema.names if name in PredictionRequest.model_fields])
+    json_body = json.dumps({"requests": table.to_pylist()}).encode()
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    arrow_body = sink.getvalue()
+    app = _benchmark_app()
+
+    async def measure():
+        return (
+            await _route_us(app, "/predict/batch", [json_body] * repeats, rows),
+            await _route_us(app, "/predict/batch", [arrow_body] * repeats, rows, ARROW_STREAM),
+        )
+
+    json_us, arrow_us = asyncio.run(measure())
+    return {
+        "codec.json_batch_us_per_row": {"value": json_us, "unit": "us/row", "better": "lower"},
+        "codec.arrow_batch_us_per_row": {"value": arrow_us, "unit": "us/row", "better": "lower"},
+        "codec.json_body_bytes_per_row": {"value": len(json_body) / rows, "unit": "bytes/row", "better": "lower"},
+        "codec.arrow_body_bytes_per_row": {"value": len(arrow_body) / rows, "unit": "bytes/row", "better": "lower"},
+        "codec.arrow_batch_cost_pct": {
+            "value": arrow_us / json_us * 100, "unit": "% of JSON batch", "better": "lower",
+            "limit": OVERHEAD_LIMIT_PCT,
+        },
+    }
+
+
+def run(requests: int = 5000) -> Result:
+    """
+    Time `requests` cohort payloads through both codecs and both versions of
+    the routes, and a `requests`-row batch as JSON and as Arrow.
+    """
+    payloads = cohort_requests(max(requests, BATCH_SIZE))
+    results = bench_in_process(payloads)
+    results.update(bench_routes(payloads))
+    results.update(bench_wire_formats(max(requests, BATCH_SIZE)))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args(argv)
+    for name, metric in sorted(run(args.requests).items()):
+        print(f"{name:40s} {metric['value']:>12.4g} {metric['unit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
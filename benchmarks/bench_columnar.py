@@ -0,0 +1,85 @@
+"""
+Columnar cohort benchmarks: Arrow IPC / Parquet file scoring against the CSV stream path.
+
+    python -m benchmarks.bench_columnar --rows 10000000
+"""
+import argparse
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from services import bulk_scoring, columnar_scoring
+from services.prediction_service import PredictionService
+
+from benchmarks.cohort import cohort_table
+
+Result = Dict[str, dict]
+
+# The CSV path is scored on at most this many rows; it is only the reference
+CSV_MAX_ROWS = 200_000
+
+
+def _rate(name: str, rows: int, seconds: float) -> Result:
+    return {name: {"value": rows / seconds, "unit": "rows/s", "better": "higher"}}
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def run(rows: int = 1_000_000, batch_rows: int = columnar_scoring.DEFAULT_BATCH_ROWS) -> Result:
+    """
+    Score one cohort as Arrow IPC and as Parquet (file to file, with contributions)
+    and a slice of it through the CSV to NDJSON stream path.
+    """
+    import pyarrow as pa
+    import pyarrow.csv
+    import pyarrow.parquet as pq
+
+    service = PredictionService()
+    table = cohort_table(rows)
+    results: Result = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        arrow_path, parquet_path = str(Path(tmp) / "cohort.arrow"), str(Path(tmp) / "cohort.parquet")
+        with pa.ipc.new_file(arrow_path, table.schema) as writer:
+            writer.write_table(table, max_chunksize=batch_rows)
+        pq.write_table(table, parquet_path)
+
+        for fmt, source in ((columnar_scoring.ARROW_FILE, arrow_path), (columnar_scoring.PARQUET, parquet_path)):
+            destination = str(Path(tmp) / f"scored.{fmt}")
+            seconds = _timed(lambda: columnar_scoring.score_file(
+                service, source, destination, source_format=fmt, destination_format=fmt, batch_rows=batch_rows
+            ))
+            results.update(_rate(f"columnar.{fmt}", rows, seconds))
+
+    csv_rows = min(rows, CSV_MAX_ROWS)
+    upload = io.BytesIO()
+    csv_table = table.slice(0, csv_rows)
+    csv_table = pa.table({
+        name: column.cast(column.type.value_type) if pa.types.is_dictionary(column.type) else column
+        for name, column in zip(csv_table.column_names, csv_table.columns)
+    })
+    pyarrow.csv.write_csv(csv_table, upload)
+    upload.seek(0)
+    seconds = _timed(lambda: sum(1 for _ in bulk_scoring.score_upload(service, upload, bulk_scoring.CSV)))
+    results.update(_rate("columnar.csv_reference", csv_rows, seconds))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-rows", type=int, default=columnar_scoring.DEFAULT_BATCH_ROWS)
+    args = parser.parse_args(argv)
+    for name, metric in sorted(run(args.rows, args.batch_rows).items()):
+        seconds_per_10m = 10_000_000 / metric["value"]
+        print(f"{name:28s} {metric['value']:>12,.0f} rows/s   ({seconds_per_10m:,.1f} s per 10M rows)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
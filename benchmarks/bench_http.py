@@ -0,0 +1,113 @@
+"""
+End-to-end HTTP benchmarks against a local uvicorn server under concurrency.
+"""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+from benchmarks import API_DIR
+from benchmarks.cohort import cohort_requests
+
+Result = Dict[str, dict]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LocalServer:
+    """uvicorn serving api/app.py in a subprocess for the duration of a with-block."""
+
+    def __init__(self, workers: int = 1, env: Optional[Dict[str, str]] = None):
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.workers = workers
+        self.env = {**os.environ, **(env or {})}
+        self.process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "LocalServer":
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app:app", "--host", "127.0.0.1",
+             "--port", str(self.port), "--workers", str(self.workers), "--log-level", "warning"],
+            cwd=API_DIR, env=self.env,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                if httpx.get(f"{self.url}/health", timeout=1).status_code == 200:
+                    return self
+            except httpx.TransportError:
+                time.sleep(0.1)
+        self.__exit__(None, None, None)
+        raise RuntimeError("uvicorn did not become healthy within 30 s")
+
+    def __exit__(self, *exc) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait(timeout=10)
+
+
+def _percentiles(name: str, latencies: List[float], elapsed: float, rows: int) -> Result:
+    ordered = sorted(latencies)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        f"{name}.p50_ms": {"value": pick(0.50), "unit": "ms", "better": "lower"},
+        f"{name}.p90_ms": {"value": pick(0.90), "unit": "ms", "better": "lower"},
+        f"{name}.p99_ms": {"value": pick(0.99), "unit": "ms", "better": "lower"},
+        f"{name}.throughput": {"value": rows / elapsed, "unit": "rows/s", "better": "higher"},
+    }
+
+
+async def _load(url: str, path: str, bodies: Sequence[dict], concurrency: int) -> Result:
+    latencies: List[float] = []
+    queue: "asyncio.Queue[dict]" = asyncio.Queue()
+    for body in bodies:
+        queue.put_nowait(body)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        async def worker():
+            while not queue.empty():
+                body = queue.get_nowait()
+                started = time.perf_counter()
+                response = await client.post(path, json=body)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(bodies)))))
+        elapsed = time.perf_counter() - started
+
+    name = f"http{path.replace('/', '.')}.c{concurrency}"
+    rows = sum(len(body.get("requests", [body])) for body in bodies)
+    return _percentiles(name, latencies, elapsed, rows)
+
+
+def run(samples: int = 2000, concurrency: Sequence[int] = (1, 16, 64), batch_size: int = 256,
+        workers: int = 1) -> Result:
+    """
+    Measure /predict and /predict/batch latency percentiles and throughput.
+
+    The server runs with the response cache disabled so every request is scored.
+    """
+    payloads = cohort_requests(samples)
+    batches = [{"requests": payloads[i:i + batch_size]} for i in range(0, len(payloads), batch_size)]
+    results: Result = {}
+    with LocalServer(workers=workers, env={"ULTRAVIAB_CACHE_SIZE": "0"}) as server:
+        # Warm-up so connection setup and first-call costs are not measured
+        asyncio.run(_load(server.url, "/predict", payloads[:50], 4))
+        for level in concurrency:
+            results.update(asyncio.run(_load(server.url, "/predict", payloads, level)))
+            results.update(asyncio.run(_load(server.url, "/predict/batch", batches, level)))
+    return results
@@ -0,0 +1,138 @@
+"""
+Import-time budget for cold starts.
+
+Imports each entry point in a fresh interpreter under ``-X importtime``, reports
+the most expensive modules and fails when an entry point exceeds its budget or
+loads a dependency it must not need.
+
+    python -m benchmarks.bench_imports            # report and check budgets
+    python -m benchmarks.bench_imports --top 25   # show more modules
+"""
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks import API_DIR
+
+Result = Dict[str, dict]
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    name: str
+    statement: str
+    budget_ms: float
+    forbidden: Tuple[str, ...] = ()
+
+
+HEAVY = ("fastapi", "starlette", "pydantic", "pandas", "sklearn", "joblib", "scipy", "pyarrow")
+
+ENTRY_POINTS = (
+    # Batch jobs and serverless scorers: NumPy only
+    EntryPoint(
+        "scoring_kernel",
+        "import services.scoring_kernel, services.scoring_plan",
+        budget_ms=250,
+        forbidden=HEAVY,
+    ),
+    # Flat forest inference and ultrasound signal features: NumPy only
+    EntryPoint(
+        "numpy_kernels",
+        "import services.tree_kernel, services.signal_features",
+        budget_ms=250,
+        forbidden=HEAVY,
+    ),
+    # Prediction service: adds the pydantic schemas, still no web stack or ML libraries
+    EntryPoint(
+        "prediction_service",
+        "import services.prediction_service",
+        budget_ms=600,
+        forbidden=("fastapi", "starlette", "pandas", "sklearn", "joblib", "scipy", "pyarrow"),
+    ),
+    # Full API app, rule-based engine: model libraries stay unloaded until used
+    EntryPoint(
+        "app",
+        "import app",
+        budget_ms=1500,
+        forbidden=("pandas", "sklearn", "joblib", "scipy", "pyarrow"),
+    ),
+)
+
+
+def profile_import(statement: str) -> Tuple[List[Tuple[str, float, float]], List[str]]:
+    """
+    Run an import statement in a fresh interpreter with -X importtime.
+
+    Args:
+        statement: Python import statement to execute from api/
+
+    Returns:
+        ([(module, self_ms, cumulative_ms)], top-level packages loaded)
+    """
+    env = dict(os.environ, PYTHONPATH=str(API_DIR))
+    script = f"{statement}\nimport sys\nprint('\\n'.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=API_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        # One separator space, then two per nesting level
+        modules.append((module[1:], int(self_us) / 1000, int(cumulative_us) / 1000))
+    return modules, completed.stdout.split()
+
+
+def check(entry: EntryPoint, repeats: int = 3) -> Tuple[float, List[Tuple[str, float, float]], List[str]]:
+    """
+    Best-of-N total import time of an entry point, its module costs and forbidden packages loaded.
+    """
+    best_total, best_modules, loaded = float("inf"), [], []
+    for _ in range(repeats):
+        modules, loaded = profile_import(entry.statement)
+        # Cumulative times of the top-level (unindented) imports add up to the total
+        total = sum(cumulative for name, _, cumulative in modules if not name.startswith(" "))
+        if total < best_total:
+            best_total, best_modules = total, modules
+    return best_total, best_modules, [name for name in entry.forbidden if name in loaded]
+
+
+def run(entry_points: Sequence[EntryPoint] = ENTRY_POINTS, repeats: int = 3) -> Result:
+    """Total import time per entry point, in benchmark-suite result format."""
+    results: Result = {}
+    for entry in entry_points:
+        total, _, _ = check(entry, repeats)
+        results[f"import.{entry.name}"] = {"value": total, "unit": "ms", "better": "lower"}
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=10, help="Most expensive modules to list per entry point")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failures = []
+    for entry in ENTRY_POINTS:
+        total, modules, forbidden = check(entry, args.repeats)
+        status = "OK" if total <= entry.budget_ms and not forbidden else "OVER"
+        print(f"{entry.name}: {total:.1f} ms (budget {entry.budget_ms:.0f} ms) {status}")
+        for name, self_ms, cumulative_ms in sorted(modules, key=lambda m: m[1], reverse=True)[:args.top]:
+            print(f"    {self_ms:8.2f} ms self {cumulative_ms:9.2f} ms cumulative  {name.strip()}")
+        if total > entry.budget_ms:
+            failures.append(f"{entry.name} took {total:.1f} ms, budget is {entry.budget_ms:.0f} ms")
+        if forbidden:
+            failures.append(f"{entry.name} imported {', '.join(forbidden)}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
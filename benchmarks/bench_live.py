@@ -0,0 +1,110 @@
+"""
+Live-assessment benchmarks: partial updates scored incrementally by a
+ScoringSession against merging and fully rescoring each update, plus the
+round trip of an update through the /predict/live WebSocket.
+
+    python -m benchmarks.bench_live --updates 5000
+"""
+import argparse
+import json
+import random
+import time
+from typing import Dict, List
+
+from services.incremental_scoring import ScoringSession, merge_update
+from services.prediction_service import PredictionService
+from schemas.prediction import PredictionRequest
+
+from benchmarks.cohort import cohort_requests
+
+Result = Dict[str, dict]
+
+# Fields a perfusion monitor streams, updated two at a time
+LIVE_FIELDS = ("cold_ischemia_hours", "resistive_index", "perfusion_uniformity_pct", "warm_ischemia_minutes")
+# An incremental update must cost less than rescoring the merged assessment
+UPDATE_COST_LIMIT_PCT = 100.0
+
+
+def _updates(count: int, seed: int = 7) -> List[dict]:
+    rng = random.Random(seed)
+    sources = cohort_requests(min(count, 1000))
+    return [
+        {name: sources[i % len(sources)][name] for name in rng.sample(LIVE_FIELDS, 2)}
+        for i in range(count)
+    ]
+
+
+def _per_update_us(seconds: float, count: int) -> float:
+    return seconds / count * 1e6
+
+
+def bench_in_process(service: PredictionService, start: PredictionRequest, updates: List[dict]) -> Result:
+    """Incremental session updates vs. merge + predict() of the whole assessment."""
+    session = ScoringSession(service, start)
+    started = time.perf_counter()
+    for fields in updates:
+        session.update(fields)
+    incremental = time.perf_counter() - started
+
+    request = start
+    started = time.perf_counter()
+    for fields in updates:
+        request, _ = merge_update(request, fields)
+        service.predict(request)
+    full = time.perf_counter() - started
+
+    return {
+        "live.session_update_us": {
+            "value": _per_update_us(incremental, len(updates)), "unit": "us/update", "better": "lower",
+        },
+        "live.full_rescore_us": {
+            "value": _per_update_us(full, len(updates)), "unit": "us/update", "better": "lower",
+        },
+        "live.update_cost_pct": {
+            "value": incremental / full * 100, "unit": "% of full rescore", "better": "lower",
+            "limit": UPDATE_COST_LIMIT_PCT,
+        },
+    }
+
+
+def bench_websocket(start: dict, updates: List[dict]) -> Result:
+    """Update round trip through the ASGI app's WebSocket route (in-process, no network)."""
+    from fastapi.testclient import TestClient
+
+    from app import app
+
+    with TestClient(app).websocket_connect("/predict/live") as websocket:
+        websocket.send_text(json.dumps({"assessment": start}))
+        websocket.receive_text()
+        started = time.perf_counter()
+        for fields in updates:
+            websocket.send_text(json.dumps({"update": fields}))
+            websocket.receive_text()
+        elapsed = time.perf_counter() - started
+    return {
+        "live.websocket_roundtrip_us": {
+            "value": _per_update_us(elapsed, len(updates)), "unit": "us/update", "better": "lower",
+        },
+    }
+
+
+def run(updates: int = 5000) -> Result:
+    """Time `updates` two-field updates in process and over the WebSocket route."""
+    start = cohort_requests(1)[0]
+    changes = _updates(updates)
+    results = bench_in_process(PredictionService(), PredictionRequest(**start), changes)
+    results.update(bench_websocket(start, changes))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=5000)
+    args = parser.parse_args(argv)
+    for name, metric in sorted(run(args.updates).items()):
+        print(f"{name:40s} {metric['value']:>12.4g} {metric['unit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
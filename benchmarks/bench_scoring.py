@@ -0,0 +1,82 @@
+"""
+In-process scoring benchmarks: PredictionService throughput and batch-size sweeps.
+"""
+import time
+from typing import Callable, Dict, List, Sequence
+
+from schemas.prediction import PredictionRequest
+from services import scoring_kernel
+from services.prediction_service import PredictionService
+
+from benchmarks.cohort import cohort_requests
+
+Result = Dict[str, dict]
+
+# Computing per-feature contributions may cost at most this fraction of plain scoring
+EXPLAIN_OVERHEAD_LIMIT_PCT = 50.0
+
+
+def _rate(name: str, rows: int, seconds: float) -> Result:
+    return {name: {"value": rows / seconds, "unit": "rows/s", "better": "higher"}}
+
+
+def _best_of(repeats: int, fn: Callable[[], None]) -> float:
+    """Fastest wall time of several runs, which is the least noisy estimate."""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench_predict(service: PredictionService, requests: Sequence[PredictionRequest], repeats: int) -> Result:
+    """Single-request predict() throughput."""
+    seconds = _best_of(repeats, lambda: [service.predict(r) for r in requests])
+    return _rate("service.predict", len(requests), seconds)
+
+
+def bench_batch_sweep(service: PredictionService, requests: Sequence[PredictionRequest],
+                      batch_sizes: Sequence[int], repeats: int) -> Result:
+    """predict_batch() and columnar score_batch() throughput per batch size."""
+    results: Result = {}
+    for size in batch_sizes:
+        chunks = [list(requests[i:i + size]) for i in range(0, len(requests), size)]
+        seconds = _best_of(repeats, lambda: [service.predict_batch(chunk) for chunk in chunks])
+        results.update(_rate(f"service.predict_batch.{size}", len(requests), seconds))
+
+        batches = [scoring_kernel.requests_to_batch(chunk) for chunk in chunks]
+        seconds = _best_of(repeats, lambda: [service.score_batch(batch) for batch in batches])
+        results.update(_rate(f"service.score_batch.{size}", len(requests), seconds))
+    return results
+
+
+def bench_explain_overhead(service: PredictionService, requests: Sequence[PredictionRequest],
+                           batch_sizes: Sequence[int], repeats: int) -> Result:
+    """Extra cost of score_batch(explain=True) over plain scoring, as a percentage, per batch size."""
+    results: Result = {}
+    for size in batch_sizes:
+        batches = [scoring_kernel.requests_to_batch(requests[i:i + size]) for i in range(0, len(requests), size)]
+        plain = _best_of(repeats, lambda: [service.score_batch(batch) for batch in batches])
+        explained = _best_of(repeats, lambda: [service.score_batch(batch, explain=True) for batch in batches])
+        results[f"service.explain_overhead.{size}"] = {
+            "value": max(explained / plain - 1, 0.0) * 100,
+            "unit": "%",
+            "better": "lower",
+            "limit": EXPLAIN_OVERHEAD_LIMIT_PCT,
+        }
+    return results
+
+
+def run(samples: int = 5000, batch_sizes: Sequence[int] = (1, 16, 256, 4096), repeats: int = 3) -> Result:
+    """
+    Run every in-process scoring benchmark on a synthetic cohort.
+
+    The service is used without the response cache so every call really scores.
+    """
+    service = PredictionService()
+    requests: List[PredictionRequest] = [PredictionRequest(**payload) for payload in cohort_requests(samples)]
+    results = bench_predict(service, requests, repeats)
+    results.update(bench_batch_sweep(service, requests, batch_sizes, repeats))
+    results.update(bench_explain_overhead(service, requests, batch_sizes, repeats))
+    return results
@@ -0,0 +1,99 @@
+"""
+Flat tree kernel benchmarks: a random forest served by scikit-learn against its
+flat NumPy export, single-row and batch, plus a parity check.
+
+    python -m benchmarks.bench_trees --train-rows 50000
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, Dict
+
+from schemas.prediction import PredictionRequest
+from services.model_registry import ModelArtifact
+from services.model_service import ModelPredictionService
+from training import candidates, dataset
+from training.export import PARITY_TOLERANCE, check_parity, flatten_forest
+
+from benchmarks.cohort import cohort_requests
+
+Result = Dict[str, dict]
+
+SINGLE_ROW_CALLS = 200
+BATCH_ROWS = 10_000
+
+
+def _median_ms(calls: int, fn: Callable[[int], None]) -> float:
+    timings = []
+    for i in range(calls):
+        started = time.perf_counter()
+        fn(i)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1e3
+
+
+def _latency(name: str, ms: float) -> Result:
+    return {name: {"value": ms, "unit": "ms", "better": "lower"}}
+
+
+def _rate(name: str, rows: int, seconds: float) -> Result:
+    return {name: {"value": rows / seconds, "unit": "rows/s", "better": "higher"}}
+
+
+def run(train_rows: int = 50_000, seed: int = 0) -> Result:
+    """
+    Train the "rf" candidate, flatten it and time both at the model and the
+    /predict service level. Parity metrics carry an absolute limit.
+    """
+    data = dataset.synthetic_cohort(train_rows, seed=seed)
+    regressor, classifier, _ = candidates.fit(
+        candidates.get_candidate("rf"), data.X, data.y_score, data.y_class, seed
+    )
+    flat_regressor, flat_classifier = flatten_forest(regressor), flatten_forest(classifier)
+    X = dataset.synthetic_cohort(BATCH_ROWS, seed=seed + 1).X
+
+    results: Result = {}
+    for role, model, flat in (("regressor", regressor, flat_regressor), ("classifier", classifier, flat_classifier)):
+        parity = check_parity(model, flat, X)
+        results[f"trees.parity.{role}.max_abs_diff"] = {
+            "value": parity["max_abs_diff"], "unit": "abs", "better": "lower", "limit": PARITY_TOLERANCE,
+        }
+        results[f"trees.parity.{role}.label_mismatches"] = {
+            "value": parity["label_mismatches"], "unit": "rows", "better": "lower", "limit": 0,
+        }
+
+    requests = [PredictionRequest(**payload) for payload in cohort_requests(SINGLE_ROW_CALLS, seed=seed + 2)]
+    for kind, models in (("sklearn", (regressor, classifier)), ("flat", (flat_regressor, flat_classifier))):
+        model_regressor, model_classifier = models
+        rows = [X[i:i + 1] for i in range(SINGLE_ROW_CALLS)]
+        results.update(_latency(
+            f"trees.{kind}.single_row",
+            _median_ms(SINGLE_ROW_CALLS, lambda i: (model_regressor.predict(rows[i]), model_classifier.predict_proba(rows[i]))),
+        ))
+        started = time.perf_counter()
+        model_regressor.predict(X)
+        model_classifier.predict_proba(X)
+        results.update(_rate(f"trees.{kind}.batch", len(X), time.perf_counter() - started))
+
+        service = ModelPredictionService(ModelArtifact(
+            version=kind, path="", regressor=model_regressor, classifier=model_classifier,
+            feature_names=data.feature_names,
+        ))
+        results.update(_latency(
+            f"trees.{kind}.service_predict",
+            _median_ms(SINGLE_ROW_CALLS, lambda i: service.predict(requests[i])),
+        ))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--train-rows", type=int, default=50_000)
+    args = parser.parse_args(argv)
+    for name, metric in sorted(run(args.train_rows).items()):
+        print(f"{name:45s} {metric['value']:>12.4g} {metric['unit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
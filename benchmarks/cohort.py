@@ -0,0 +1,34 @@
+"""
+Synthetic benchmark cohorts built with the synthetic package (api/synthetic).
+"""
+from typing import List
+
+from synthetic import generate_cohort, iter_chunks
+from synthetic.generator import TARGET_CLASS, TARGET_SCORE
+
+
+def cohort_table(samples: int, seed: int = 42):
+    """Synthetic cohort as an Arrow table with PredictionRequest column names."""
+    import pyarrow as pa
+    return pa.Table.from_batches([chunk.to_record_batch() for chunk in iter_chunks(samples, seed)])
+
+
+def cohort_requests(samples: int, seed: int = 42) -> List[dict]:
+    """
+    Synthetic cohort as PredictionRequest payloads.
+
+    Every field is generated per organ type, and the organ mix follows the
+    generator's profile shares, so per-organ plans are exercised.
+    """
+    columns = generate_cohort(samples, seed)
+    del columns[TARGET_SCORE], columns[TARGET_CLASS]
+    names = list(columns)
+    payloads = []
+    for row in zip(*(columns[name].tolist() for name in names)):
+        payload = dict(zip(names, row))
+        if payload["kdpi_percentile"] != payload["kdpi_percentile"]:  # NaN: not a kidney
+            payload["kdpi_percentile"] = None
+        else:
+            payload["kdpi_percentile"] = int(payload["kdpi_percentile"])
+        payloads.append(payload)
+    return payloads
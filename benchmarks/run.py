@@ -0,0 +1,138 @@
+"""
+Run the benchmark suite, write machine-readable results and check for regressions.
+
+    python -m benchmarks.run                     # all suites, compare with baseline.json
+    python -m benchmarks.run --suite scoring     # in-process scoring only
+    python -m benchmarks.run --update-baseline   # accept the current numbers as the baseline
+
+Exits with status 1 when any metric is worse than the baseline by more than the
+tolerance, so it can gate CI. Baselines are machine-specific: record them on the
+machine that runs the comparison.
+"""
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_RESULTS_DIR = BENCH_DIR / "results"
+DEFAULT_TOLERANCE = 0.25
+
+SUITES = ("scoring", "http", "imports", "columnar", "trees", "signals", "live", "codec")
+
+
+def run_suites(suites: List[str], args: argparse.Namespace) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    if "scoring" in suites:
+        from benchmarks import bench_scoring
+        results.update(bench_scoring.run(samples=args.samples, batch_sizes=args.batch_sizes, repeats=args.repeats))
+    if "http" in suites:
+        from benchmarks import bench_http
+        results.update(bench_http.run(samples=args.samples, concurrency=args.concurrency, workers=args.workers))
+    if "imports" in suites:
+        from benchmarks import bench_imports
+        results.update(bench_imports.run(repeats=args.repeats))
+    if "columnar" in suites:
+        from benchmarks import bench_columnar
+        results.update(bench_columnar.run(rows=args.columnar_rows))
+    if "trees" in suites:
+        from benchmarks import bench_trees
+        results.update(bench_trees.run(train_rows=args.tree_train_rows))
+    if "signals" in suites:
+        from benchmarks import bench_signals
+        results.update(bench_signals.run(minutes=args.signal_minutes))
+    if "live" in suites:
+        from benchmarks import bench_live
+        results.update(bench_live.run(updates=args.live_updates))
+    if "codec" in suites:
+        from benchmarks import bench_codec
+        results.update(bench_codec.run(requests=args.codec_requests))
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """
+    Return a description of every metric that regressed beyond the tolerance
+    or, for metrics that declare an absolute "limit" instead, exceeded it.
+
+    Args:
+        results: Current metrics
+        baseline: Stored metrics
+        tolerance: Allowed relative slowdown, e.g. 0.25 for 25%
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        limit = current.get("limit")
+        if limit is not None:
+            if current["value"] > limit:
+                regressions.append(f"{name}: {current['value']:.4g} {current['unit']} exceeds limit {limit:.4g}")
+            continue
+        reference = baseline.get(name)
+        if reference is None or reference["value"] == 0:
+            continue
+        change = (current["value"] - reference["value"]) / reference["value"]
+        worse = -change if current["better"] == "higher" else change
+        if worse > tolerance:
+            regressions.append(
+                f"{name}: {current['value']:.4g} {current['unit']} vs baseline "
+                f"{reference['value']:.4g} ({worse:+.0%} worse)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", action="append", choices=SUITES, help="Suite to run (repeatable; default all)")
+    parser.add_argument("--samples", type=int, default=5000, help="Synthetic cohort size")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 4096])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the HTTP suite")
+    parser.add_argument("--columnar-rows", type=int, default=1_000_000, help="Cohort size for the columnar suite")
+    parser.add_argument("--tree-train-rows", type=int, default=50_000, help="Forest training rows for the trees suite")
+    parser.add_argument("--signal-minutes", type=float, default=5.0, help="Recording length for the signals suite")
+    parser.add_argument("--live-updates", type=int, default=5000, help="Partial updates for the live suite")
+    parser.add_argument("--codec-requests", type=int, default=5000, help="Requests per route for the codec suite")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--output", type=Path, help="Results file (default results/<timestamp>.json)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_suites(args.suite or list(SUITES), args)
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics": results,
+    }
+
+    output = args.output or DEFAULT_RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    for name, metric in sorted(results.items()):
+        print(f"{name:45s} {metric['value']:>12.4g} {metric['unit']}")
+    print(f"Results written to {output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["metrics"]
+    else:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+HTTP client for the UltraViab API.
+One keep-alive session (connection pool) is reused across Analyze presses, with
+explicit connect/read timeouts and bounded, jittered retries.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_URL_ENV = "ULTRAVIAB_API_URL"
+DEFAULT_API_URL = "http://localhost:8000"
+
+CONNECT_TIMEOUT_SECONDS = 2.0
+READ_TIMEOUT_SECONDS = 5.0
+MAX_RETRIES = 2
+BACKOFF_SECONDS = 0.2
+BACKOFF_JITTER_SECONDS = 0.1
+POOL_SIZE = 4
+
+
+class ApiError(Exception):
+    """The API could not be reached or answered with an error."""
+
+    def __init__(self, message: str, latency_ms: float, unreachable: bool = False):
+        super().__init__(message)
+        self.latency_ms = latency_ms
+        self.unreachable = unreachable
+
+
+@dataclass
+class ApiResult:
+    """A successful API response and how long the round trip took."""
+    data: Dict[str, Any]
+    latency_ms: float
+
+
+class UltraViabClient:
+    """Reusable, pooled client for the prediction API."""
+
+    def __init__(
+        self,
+        base_url: str = None,
+        connect_timeout: float = CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = READ_TIMEOUT_SECONDS,
+        retries: int = MAX_RETRIES,
+    ):
+        self.base_url = (base_url or os.environ.get(API_URL_ENV) or DEFAULT_API_URL).rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Retry only where no scoring happened: failed connects and 503 (queue full).
+        # Read timeouts are not retried - the API may already have recorded the assessment -
+        # and read=False re-raises them as ReadTimeout rather than a retries-exhausted ConnectionError.
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=False,
+            status=retries,
+            status_forcelist=(503,),
+            allowed_methods=frozenset({"GET", "POST"}),
+            backoff_factor=BACKOFF_SECONDS,
+            backoff_jitter=BACKOFF_JITTER_SECONDS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def predict(self, payload: Dict[str, Any]) -> ApiResult:
+        """
+        Score one organ assessment.
+
+        Args:
+            payload: PredictionRequest fields
+
+        Returns:
+            ApiResult with the prediction and round-trip latency
+
+        Raises:
+            ApiError: If the API is unreachable, times out or returns an error
+        """
+        return self._request("POST", "/predict", json=payload)
+
+    def sweep(self, payload: Dict[str, Any], x: Dict[str, Any], y: Dict[str, Any] = None) -> ApiResult:
+        """
+        Score a what-if grid around one assessment in a single call.
+
+        Args:
+            payload: Base PredictionRequest fields
+            x: Swept axis, {"field", "start", "stop", "steps"}
+            y: Optional second swept axis
+
+        Returns:
+            ApiResult with the SweepResponse and round-trip latency
+
+        Raises:
+            ApiError: If the API is unreachable, times out or returns an error
+        """
+        body = {"base": payload, "x": x}
+        if y is not None:
+            body["y"] = y
+        return self._request("POST", "/predict/sweep", json=body)
+
+    def _request(self, method: str, path: str, **kwargs) -> ApiResult:
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, timeout=self.timeout, **kwargs)
+        except requests.ReadTimeout:
+            # Reached but slow: report it rather than falling back to a simulated score
+            latency_ms = _elapsed_ms(started)
+            raise ApiError(f"API did not answer within {self.timeout[1]:g} s", latency_ms)
+        except requests.ConnectionError:
+            # Includes ConnectTimeout
+            raise ApiError(f"API unreachable at {self.base_url}", _elapsed_ms(started), unreachable=True)
+        latency_ms = _elapsed_ms(started)
+
+        if response.status_code != 200:
+            try:
+                detail = response.json().get("detail", response.reason)
+            except ValueError:
+                detail = response.reason
+            raise ApiError(f"API error {response.status_code}: {detail}", latency_ms)
+        return ApiResult(data=response.json(), latency_ms=latency_ms)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
@@ -1,9 +1,8 @@
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
-import time
-import requests
+
+from api_client import ApiError, UltraViabClient
 
 # --- Page Config ---
 st.set_page_config(
@@ -387,6 +386,136 @@ def hex_to_rgba(hex_code, opacity=1.0):
     r, g, b = int(hex_code[0:2], 16), int(hex_code[2:4], 16), int(hex_code[4:6], 16)
     return f"rgba({r}, {g}, {b}, {opacity})"
 
+# Figures are cached on their inputs, so reruns that change nothing skip rebuilding them.
+# They are cached as plain dicts, which are much cheaper to copy out of the cache than Figures.
+@st.cache_data(max_entries=256)
+def build_radar_figure(values, color):
+    categories = ['Stiffness', 'RI', 'CIT', 'Age', 'Perfusion', 'SWV']
+    
+    # Close the loop for radar chart
+    categories = categories + [categories[0]]
+    values = list(values) + [values[0]]
+    
+    fig_radar = go.Figure()
+    fig_radar.add_trace(go.Scatterpolar(
+        r=values, theta=categories, fill='toself',
+        line_color=color, fillcolor=hex_to_rgba(color, 0.12), line_width=2
+    ))
+    
+    ref_values = [0.4, 0.6, 0.5, 0.6, 0.2, 0.5]
+    ref_values = ref_values + [ref_values[0]]
+    
+    fig_radar.add_trace(go.Scatterpolar(
+        r=ref_values, theta=categories,
+        line_color='rgba(255, 255, 255, 0.8)', line_dash='dash', line_width=2
+    ))
+    fig_radar.update_layout(
+        polar=dict(
+            bgcolor='rgba(0,0,0,0)',
+            radialaxis=dict(visible=True, showticklabels=False, range=[0, 1], gridcolor='rgba(45, 45, 58, 0.6)'),
+            angularaxis=dict(gridcolor='rgba(45, 45, 58, 0.6)', tickfont=dict(color='#9898a8', size=11, family='DM Sans'))
+        ),
+        showlegend=False, margin=dict(l=50, r=50, t=20, b=20),
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#9898a8", family="DM Sans"), height=260
+    )
+    return fig_radar.to_dict()
+
+@st.cache_data(max_entries=256)
+def build_contribution_figure(contribs):
+    contribs = sorted(contribs, key=lambda item: item[1])
+    features = [feature for feature, _ in contribs]
+    impacts = [impact for _, impact in contribs]
+    
+    fig_bar = go.Figure(go.Bar(
+        x=impacts, y=features, orientation='h',
+        marker=dict(color=['#ef4444' if x < 0 else '#22c55e' for x in impacts]),
+        text=[f"{x:+.1f}" for x in impacts],
+        textposition='outside', textfont=dict(color='#9898a8', size=10, family='JetBrains Mono')
+    ))
+    fig_bar.update_layout(
+        xaxis=dict(title=dict(text="Impact", font=dict(color='#9898a8', size=11)), tickfont=dict(color='#9898a8', size=10),
+                   gridcolor='rgba(45, 45, 58, 0.4)', zerolinecolor='rgba(45, 45, 58, 0.8)'),
+        yaxis=dict(title=None, tickfont=dict(color='#e8e8ed', size=11)),
+        margin=dict(l=20, r=50, t=20, b=20),
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        height=260, bargap=0.35
+    )
+    return fig_bar.to_dict()
+
+# 300 points is visually identical to 1200 at the panel's width
+WAVEFORM_POINTS = 300
+
+@st.cache_data(max_entries=256)
+def build_waveform_figure(freq, amp):
+    """Signal preview; freq/amp derive from RI and stiffness, so only those sliders rebuild it."""
+    t = np.linspace(0, 12, WAVEFORM_POINTS)
+    # Fixed seed keeps the noise stable across reruns instead of re-rolling it
+    noise = np.random.default_rng(0).normal(0, 0.015, WAVEFORM_POINTS)
+    wave = amp * np.sin(2 * np.pi * freq * t) * (1 - 0.02 * t) + noise
+    
+    fig_wave = go.Figure()
+    
+    # Glow layer
+    fig_wave.add_trace(go.Scatter(
+        x=t, y=wave, mode='lines', 
+        line=dict(color='rgba(34, 197, 94, 0.25)', width=8),
+        hoverinfo='skip'
+    ))
+    
+    # Main signal
+    fig_wave.add_trace(go.Scatter(
+        x=t, y=wave, mode='lines', 
+        line=dict(color='#22c55e', width=2),
+        fill='tozeroy', fillcolor='rgba(34, 197, 94, 0.06)',
+        hoverinfo='skip'
+    ))
+    
+    fig_wave.update_layout(
+        height=150, 
+        margin=dict(l=0, r=0, t=10, b=0),
+        xaxis=dict(showgrid=False, showticklabels=False, zeroline=False, fixedrange=True),
+        yaxis=dict(showgrid=False, showticklabels=False, range=[-2.5, 2.5], zeroline=False, fixedrange=True),
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        showlegend=False
+    )
+    return fig_wave.to_dict()
+
+@st.cache_data(max_entries=64)
+def build_sensitivity_figure(sweep):
+    """Heatmap of score over CIT x stiffness, with the classification cut-offs as contours."""
+    colorscale = [[0.0, '#ef4444'], [0.4, '#eab308'], [0.7, '#22c55e'], [1.0, '#16a34a']]
+    fig = go.Figure(go.Heatmap(
+        x=sweep['x_values'], y=sweep['y_values'], z=sweep['scores'],
+        zmin=0, zmax=100, colorscale=colorscale,
+        colorbar=dict(title=dict(text="Score", font=dict(color='#9898a8')), tickfont=dict(color='#9898a8'))
+    ))
+    for label, cutoff in (sweep.get('cutoffs') or {}).items():
+        fig.add_trace(go.Contour(
+            x=sweep['x_values'], y=sweep['y_values'], z=sweep['scores'],
+            contours=dict(start=cutoff, end=cutoff, size=1, coloring='none', showlabels=True),
+            line=dict(color='rgba(255, 255, 255, 0.8)', width=2, dash='dash'),
+            showscale=False, hoverinfo='skip', name=label
+        ))
+    fig.update_layout(
+        xaxis=dict(title=dict(text="Cold Ischemia Time (hrs)", font=dict(color='#9898a8', size=11)), tickfont=dict(color='#9898a8', size=10)),
+        yaxis=dict(title=dict(text="Tissue Stiffness (kPa)", font=dict(color='#9898a8', size=11)), tickfont=dict(color='#9898a8', size=10)),
+        margin=dict(l=20, r=20, t=20, b=20),
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        height=320, showlegend=False
+    )
+    return fig.to_dict()
+
+# Slower round trips than this are flagged in the UI
+SLOW_API_MS = 1000
+
+
+@st.cache_resource
+def get_api_client():
+    """One pooled keep-alive client shared by every rerun and session."""
+    return UltraViabClient()
+
+
 # Initialize Session State
 if 'organ_type' not in st.session_state:
     st.session_state['organ_type'] = "Kidney"
@@ -438,10 +567,7 @@ if run_scan or st.session_state.get('scan_triggered', False):
     st.session_state['scan_triggered'] = False
     
     with st.spinner("Analyzing..."):
-        time.sleep(0.8)
-        
         # API Integration
-        api_url = "http://localhost:8000/predict"
         payload = {
             "organ_type": organ_type, "tissue_stiffness_kpa": stiffness,
             "resistive_index": ri, "shear_wave_velocity_ms": swv,
@@ -451,29 +577,33 @@ if run_scan or st.session_state.get('scan_triggered', False):
             "cause_of_death": cause_death, "warm_ischemia_minutes": warm_ischemia
         }
         
+        api_error = None
         try:
-            response = requests.post(api_url, json=payload)
-            if response.status_code == 200:
-                data = response.json()
-                score = data['viability_score']
-                status = data['classification'].upper()
-                risk_factors = data.get('risk_factors', [])
-                msg = f"Detected risks: {', '.join(risk_factors)}" if risk_factors else "No significant risks detected"
+            result = get_api_client().predict(payload)
+            latency_ms = result.latency_ms
+            data = result.data
+            score = data['viability_score']
+            status = data['classification'].upper()
+            risk_factors = data.get('risk_factors', [])
+            msg = f"Detected risks: {', '.join(risk_factors)}" if risk_factors else "No significant risks detected"
+        except ApiError as exc:
+            api_error = exc
+            latency_ms = exc.latency_ms
+            if exc.unreachable:
+                # Fallback simulation, clearly labelled as such
+                score = 100
+                score -= (stiffness - 5.0) * 3 if stiffness > 6.0 else 0
+                score -= (ri - 0.7) * 40 if ri > 0.7 else 0
+                score -= (cit_hours - 12) * 1.5 if cit_hours > 12 else 0
+                score -= (donor_age - 50) * 0.3 if donor_age > 50 else 0
+                score = max(0, min(100, score))
+                
+                if score >= 70: status = "ACCEPT"
+                elif score >= 40: status = "MARGINAL"
+                else: status = "DECLINE"
+                msg = f"Simulation mode - {exc}"
             else:
-                score, status, msg = 0, "ERROR", "API connection failed"
-        except:
-            # Fallback simulation
-            score = 100
-            score -= (stiffness - 5.0) * 3 if stiffness > 6.0 else 0
-            score -= (ri - 0.7) * 40 if ri > 0.7 else 0
-            score -= (cit_hours - 12) * 1.5 if cit_hours > 12 else 0
-            score -= (donor_age - 50) * 0.3 if donor_age > 50 else 0
-            score = max(0, min(100, score))
-            
-            if score >= 70: status = "ACCEPT"
-            elif score >= 40: status = "MARGINAL"
-            else: status = "DECLINE"
-            msg = "Running in simulation mode"
+                score, status, msg = 0, "ERROR", str(exc)
 
     # Color mapping
     status_colors = {"ACCEPT": "#22c55e", "MARGINAL": "#eab308", "DECLINE": "#ef4444", "ERROR": "#ef4444"}
@@ -537,6 +667,13 @@ if run_scan or st.session_state.get('scan_triggered', False):
     </div>
     """, unsafe_allow_html=True)
     
+    if api_error is not None:
+        st.error(f"{api_error} after {latency_ms:.0f} ms")
+    elif latency_ms > SLOW_API_MS:
+        st.warning(f"Slow API response: {latency_ms:.0f} ms round trip")
+    else:
+        st.caption(f"API round trip: {latency_ms:.0f} ms")
+    
     st.markdown("")
     
     # Charts Row
@@ -546,67 +683,44 @@ if run_scan or st.session_state.get('scan_triggered', False):
         c1, c2 = st.columns(2)
     
     with c1:
-        categories = ['Stiffness', 'RI', 'CIT', 'Age', 'Perfusion', 'SWV']
-        values = [
+        values = (
             min(1, stiffness / 15.0), min(1, ri / 1.0), min(1, cit_hours / 40.0),
             min(1, donor_age / 100.0), min(1, (100-perfusion)/100.0), min(1, swv / 4.0)
-        ]
-        
-        # Close the loop for radar chart
-        categories = categories + [categories[0]]
-        values = values + [values[0]]
-        
-        fig_radar = go.Figure()
-        fig_radar.add_trace(go.Scatterpolar(
-            r=values, theta=categories, fill='toself',
-            line_color=color, fillcolor=hex_to_rgba(color, 0.12), line_width=2
-        ))
-        
-        ref_values = [0.4, 0.6, 0.5, 0.6, 0.2, 0.5]
-        ref_values = ref_values + [ref_values[0]]
-        
-        fig_radar.add_trace(go.Scatterpolar(
-            r=ref_values, theta=categories,
-            line_color='rgba(255, 255, 255, 0.8)', line_dash='dash', line_width=2
-        ))
-        fig_radar.update_layout(
-            polar=dict(
-                bgcolor='rgba(0,0,0,0)',
-                radialaxis=dict(visible=True, showticklabels=False, range=[0, 1], gridcolor='rgba(45, 45, 58, 0.6)'),
-                angularaxis=dict(gridcolor='rgba(45, 45, 58, 0.6)', tickfont=dict(color='#9898a8', size=11, family='DM Sans'))
-            ),
-            showlegend=False, margin=dict(l=50, r=50, t=20, b=20),
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color="#9898a8", family="DM Sans"), height=260
         )
-        st.plotly_chart(fig_radar, use_container_width=True, config={'displayModeBar': False})
+        st.plotly_chart(build_radar_figure(values, color), use_container_width=True, config={'displayModeBar': False})
 
     with c2:
-        contribs = {
-            "Stiffness": -max(0, (stiffness - 5.0) * 3),
-            "RI": -max(0, (ri - 0.7) * 40),
-            "CIT": -max(0, (cit_hours - 12) * 1.5),
-            "Age": -max(0, (donor_age - 50) * 0.3),
-            "Perfusion": 10 if perfusion > 80 else -5
-        }
-        contrib_df = pd.DataFrame(list(contribs.items()), columns=['Feature', 'Impact'])
-        contrib_df = contrib_df.sort_values('Impact', ascending=True)
-        
-        fig_bar = go.Figure(go.Bar(
-            x=contrib_df['Impact'], y=contrib_df['Feature'], orientation='h',
-            marker=dict(color=contrib_df['Impact'].apply(lambda x: '#ef4444' if x < 0 else '#22c55e')),
-            text=contrib_df['Impact'].apply(lambda x: f"{x:+.1f}"),
-            textposition='outside', textfont=dict(color='#9898a8', size=10, family='JetBrains Mono')
-        ))
-        fig_bar.update_layout(
-            xaxis=dict(title=dict(text="Impact", font=dict(color='#9898a8', size=11)), tickfont=dict(color='#9898a8', size=10),
-                       gridcolor='rgba(45, 45, 58, 0.4)', zerolinecolor='rgba(45, 45, 58, 0.8)'),
-            yaxis=dict(title=None, tickfont=dict(color='#e8e8ed', size=11)),
-            margin=dict(l=20, r=50, t=20, b=20),
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-            height=260, bargap=0.35
-        )
-        st.plotly_chart(fig_bar, use_container_width=True, config={'displayModeBar': False})
+        if api_error is None and data.get('feature_contributions'):
+            # Score points each feature earned (weight x normalized value x 100)
+            contribs = {
+                name.replace('_', ' ').title(): round(value * 100, 1)
+                for name, value in data['feature_contributions'].items()
+            }
+        else:
+            # Simulation-mode estimate
+            contribs = {
+                "Stiffness": -max(0, (stiffness - 5.0) * 3),
+                "RI": -max(0, (ri - 0.7) * 40),
+                "CIT": -max(0, (cit_hours - 12) * 1.5),
+                "Age": -max(0, (donor_age - 50) * 0.3),
+                "Perfusion": 10 if perfusion > 80 else -5
+            }
+        st.plotly_chart(build_contribution_figure(tuple(contribs.items())), use_container_width=True, config={'displayModeBar': False})
+
+    # One /predict/sweep call scores the whole CIT x stiffness grid
+    if api_error is None:
+        st.markdown("### Sensitivity")
+        with st.container(border=True):
+            try:
+                sweep = get_api_client().sweep(
+                    payload,
+                    x={"field": "cold_ischemia_hours", "start": 0, "stop": 48, "steps": 49},
+                    y={"field": "tissue_stiffness_kpa", "start": 0, "stop": 50, "steps": 51},
+                )
+                st.plotly_chart(build_sensitivity_figure(sweep.data), use_container_width=True, config={'displayModeBar': False})
+                st.caption(f"{49 * 51} scenarios scored in one call ({sweep.latency_ms:.0f} ms)")
+            except ApiError as exc:
+                st.error(f"Sensitivity sweep failed: {exc}")
 
 else:
     # Idle state - show placeholder
@@ -635,34 +749,4 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-t = np.linspace(0, 12, 1200)
-amp = amp_val
-freq = freq_val
-wave = amp * np.sin(2 * np.pi * freq * t) * (1 - 0.02 * t) + np.random.normal(0, 0.015, 1200)
-
-fig_wave = go.Figure()
-
-# Glow layer
-fig_wave.add_trace(go.Scatter(
-    x=t, y=wave, mode='lines', 
-    line=dict(color='rgba(34, 197, 94, 0.25)', width=8),
-    hoverinfo='skip'
-))
-
-# Main signal
-fig_wave.add_trace(go.Scatter(
-    x=t, y=wave, mode='lines', 
-    line=dict(color='#22c55e', width=2),
-    fill='tozeroy', fillcolor='rgba(34, 197, 94, 0.06)',
-    hoverinfo='skip'
-))
-
-fig_wave.update_layout(
-    height=150, 
-    margin=dict(l=0, r=0, t=10, b=0),
-    xaxis=dict(showgrid=False, showticklabels=False, zeroline=False, fixedrange=True),
-    yaxis=dict(showgrid=False, showticklabels=False, range=[-2.5, 2.5], zeroline=False, fixedrange=True),
-    paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-    showlegend=False
-)
-st.plotly_chart(fig_wave, use_container_width=True, config={'displayModeBar': False})
+st.plotly_chart(build_waveform_figure(freq_val, amp_val), use_container_width=True, config={'displayModeBar': False})
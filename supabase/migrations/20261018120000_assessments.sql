@@ -0,0 +1,24 @@
+-- Assessment history written by the UltraViab API (see api/services/assessment_store.py,
+-- whose SQLite schema mirrors this table).
+
+create table if not exists public.assessments (
+    id bigint generated always as identity primary key,
+    created_at timestamptz not null default now(),
+    organ_type text not null,
+    viability_score smallint not null check (viability_score between 0 and 100),
+    classification text not null,
+    confidence real not null,
+    scoring_version text not null,
+    risk_factors jsonb not null default '[]'::jsonb,
+    request jsonb not null
+);
+
+-- History queries filter on organ type / classification and page newest-first by time
+create index if not exists assessments_organ_type_created_at_idx
+    on public.assessments (organ_type, created_at desc, id desc);
+create index if not exists assessments_classification_created_at_idx
+    on public.assessments (classification, created_at desc, id desc);
+create index if not exists assessments_created_at_idx
+    on public.assessments (created_at desc, id desc);
+
+alter table public.assessments enable row level security;
@@ -1,5 +1,11 @@
-from api.services.prediction_service import PredictionService
-from api.schemas.prediction import PredictionRequest
+import sys
+from pathlib import Path
+
+# The API uses top-level imports (schemas, services, ...) rooted at api/
+sys.path.insert(0, str(Path(__file__).resolve().parent / "api"))
+
+from services.prediction_service import PredictionService
+from schemas.prediction import PredictionRequest
 
 service = PredictionService()
 